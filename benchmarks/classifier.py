@@ -0,0 +1,51 @@
+"""Benchmark the single pass provider classifier against checking the filters of each provider.
+
+Usage: python benchmarks/classifier.py
+"""
+import logging
+
+from common import best_time, load_corpus, print_table
+
+from circuit_maintenance_parser import classify_notification, get_supported_providers
+from circuit_maintenance_parser.data import NotificationData
+
+
+def check_each_provider_filters(data: NotificationData):
+    """Previous approach, running the include and exclude filters of each provider with filters."""
+    candidates = []
+    for provider_class in get_supported_providers():
+        if not provider_class.get_default_include_filters():
+            continue
+        provider = provider_class()
+        if provider.include_filter_check(data) and not provider.exclude_filter_check(data):
+            candidates.append(provider_class)
+    return candidates
+
+
+def main():
+    """Run the benchmark over the `tests/unit/data/*/*.eml` corpus."""
+    logging.disable(logging.CRITICAL)
+    corpus = [data for data in map(NotificationData.init_from_email_bytes, (raw for _, raw in load_corpus())) if data]
+
+    rows = []
+    for name, classify_function in (
+        ("filters per provider", check_each_provider_filters),
+        ("classify_notification", classify_notification),
+    ):
+
+        def classify_corpus(classify_function=classify_function):
+            results = []
+            for data in corpus:
+                with data.memoization():
+                    results.append(classify_function(data))
+            return results
+
+        elapsed = best_time(classify_corpus, number=3)
+        classified = sum(1 for candidates in classify_corpus() if candidates)
+        rows.append([name, f"{elapsed / len(corpus) * 1e6:.1f}", f"{classified}/{len(corpus)}"])
+
+    print_table(["classification", "us/notification", "with candidates"], rows)
+
+
+if __name__ == "__main__":
+    main()
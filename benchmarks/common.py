@@ -0,0 +1,55 @@
+"""Shared helpers for the circuit-maintenance-parser benchmarks."""
+import glob
+import os
+import timeit
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from circuit_maintenance_parser.data import NotificationData
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "tests", "unit", "data")
+
+
+def load_corpus(pattern: str = "*/*.eml") -> List[Tuple[str, bytes]]:
+    """Load the test data files matching a glob pattern, relative to `tests/unit/data`."""
+    corpus = []
+    for file_path in sorted(glob.glob(os.path.join(TEST_DATA_DIR, pattern))):
+        with open(file_path, "rb") as file_obj:
+            corpus.append((os.path.relpath(file_path, TEST_DATA_DIR), file_obj.read()))
+    return corpus
+
+
+def load_html_contents(provider_type: str) -> List[bytes]:
+    """Return the HTML contents of the HTML files and of the emails of the test data of a Provider."""
+    contents = [raw for _, raw in load_corpus(f"{provider_type}/*.html")]
+    for _, raw in load_corpus(f"{provider_type}/*.eml"):
+        data = NotificationData.init_from_email_bytes(raw)
+        if data:
+            contents.extend(bytes(data_part.content) for data_part in data.data_parts if data_part.type == "text/html")
+    return contents
+
+
+def best_time(function: Callable, number: int = 10, repeat: int = 5) -> float:
+    """Return the best time, in seconds, of one call to `function`."""
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def peak_memory(function: Callable) -> int:
+    """Return the peak memory, in bytes, allocated during one call to `function`."""
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def print_table(headers: List[str], rows: List[List]):
+    """Print a simple aligned table with the benchmark results."""
+    rows = [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(str(header)), *(len(row[idx]) for row in rows)) for idx, header in enumerate(headers)]
+    print("  ".join(header.ljust(widths[idx]) for idx, header in enumerate(headers)))
+    print("  ".join("-" * width for width in widths))
+    for row in rows:
+        print("  ".join(cell.ljust(widths[idx]) for idx, cell in enumerate(row)))
@@ -0,0 +1,72 @@
+"""Benchmark the dates parsed with the `strptime` format learned per parser field against `dateutil`.
+
+The dates are the ones of the test data of each Provider, and the learned formats are reset before each run, so the
+first date of each field is parsed by `dateutil` to learn its format.
+
+Usage: python benchmarks/date_parsing.py
+"""
+from dateutil import parser
+
+from common import best_time, print_table
+
+from circuit_maintenance_parser import utils
+
+# Dates of the test data, per parser field, and whether the day comes first in them
+DATES = (
+    (("TextParserAWS1", "start"), ("Thu, 20 May 2021 08:00:00 GMT", "Mon, 13 Sep 2021 19:02:00 GMT"), False),
+    (("HtmlParserBSO1", "start"), ("Aug 29, 2022 15:00 UTC", "Aug 18, 2022 05:00 UTC"), False),
+    (("SubjectParserColt1", "start"), ("31/10/2021 00:00:00 GMT", "07/12/2021 23:00:00 GMT"), True),
+    (("HtmlParserEquinix", "start"), ("FRIDAY, 02 JUL 10:00 2021", "WEDNESDAY, 17 NOV 07:00 2021"), False),
+    (("HtmlParserGTT1", "start"), ("2021-08-13 18:00:00 GMT", "2021-11-13 04:00:00 GMT"), False),
+    (("HtmlParserHGC1", "start"), ("15-Aug-2021\xa0 07:01 UTC", "16-Aug-2021\xa0 12:00 UTC"), False),
+    (("HtmlParserLumen1", "start"), ("2021-05-20 07:00", "2021-08-26 04:00"), False),
+    (("HtmlParserMegaport1", "start"), ("Wed, 12 May 2021 10:00:00", "Tue, 25 May 2021 16:00:00"), False),
+    (("HtmlParserMomentum1", "start"), ("2021-08-14 09:30 AM UTC", "2021-08-14 11:00 AM UTC"), False),
+    (("HtmlParserSeaborn2", "start"), ("8/12/2021 2:00:00 am GMT", "8/12/2021 11:00:00 am GMT"), False),
+    (("HtmlParserSparkle1", "start"), ("08/10/2021 03:00 UTC", "08/11/2021 03:00 UTC"), False),
+    (("HtmlParserTelstra1", "start"), ("01-Jun-2021 15:59:00", "22-May-2021 10:00:00"), False),
+    (("HtmlParserTurkcell1", "start"), ("07.08.2021 00:00 GMT+3", "18.08.2021 00:30 GMT+3"), False),
+    (("HtmlParserVerizon1", "start"), ("Aug 16 2021 23:01 GMT", "Aug 7 2021 05:00 GMT"), False),
+    (("HtmlParserZayo1", "start"), ("25-Sep-2020 07:00", "27-Feb-2021 06:00"), False),
+)
+
+# Number of dates parsed per field in each run, as for a batch of notifications of the same Provider
+DATES_PER_FIELD = 50
+
+
+def parse_with_dateutil():
+    """Previous implementation, parsing every date with `dateutil`."""
+    return [
+        parser.parse(timestr, dayfirst=dayfirst)
+        for _, timestrs, dayfirst in DATES
+        for timestr in timestrs * (DATES_PER_FIELD // len(timestrs))
+    ]
+
+
+def parse_with_learned_formats():
+    """Current implementation, parsing the dates with the format learned per field, after resetting them."""
+    utils.learned_datetime_formats.clear()
+    return [
+        utils.parse_datetime(timestr, key, dayfirst)
+        for key, timestrs, dayfirst in DATES
+        for timestr in timestrs * (DATES_PER_FIELD // len(timestrs))
+    ]
+
+
+def main():
+    """Run the benchmark, checking that both implementations parse the same dates."""
+    dates = len(DATES) * DATES_PER_FIELD
+    rows = []
+    for parse_all in (parse_with_dateutil, parse_with_learned_formats):
+        elapsed = best_time(parse_all, number=5, repeat=5)
+        rows.append([parse_all.__name__, dates, f"{elapsed / dates * 1e6:.1f}"])
+    print_table(["implementation", "dates", "us/date"], rows)
+
+    utils.datetime_format_stats.clear()
+    assert parse_with_learned_formats() == parse_with_dateutil()
+    stats = utils.datetime_format_stats
+    print(f"\nhit rate: {stats['hit'] / dates:.1%} ({dict(stats)})")
+
+
+if __name__ == "__main__":
+    main()
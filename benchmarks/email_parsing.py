@@ -0,0 +1,42 @@
+"""Benchmark the bytes-native email parsing against decoding the raw email as a string first.
+
+Usage: python benchmarks/email_parsing.py
+"""
+import email
+import logging
+
+from common import best_time, load_corpus, peak_memory, print_table
+
+from circuit_maintenance_parser.data import NotificationData
+
+
+def init_from_email_string(raw_email_bytes: bytes):
+    """Previous implementation, decoding the whole raw email as UTF-8 text before parsing it."""
+    try:
+        return NotificationData.init_from_emailmessage(email.message_from_string(raw_email_bytes.decode("utf-8")))
+    except UnicodeDecodeError:
+        return None
+
+
+def main():
+    """Run the benchmark over the `tests/unit/data/*/*.eml` corpus."""
+    logging.disable(logging.CRITICAL)
+    corpus = load_corpus("*/*.eml")
+    largest_email = max((raw for _, raw in corpus), key=len)
+
+    rows = []
+    for name, init_function in (
+        ("string (message_from_string)", init_from_email_string),
+        ("bytes (BytesFeedParser)", NotificationData.init_from_email_bytes),
+    ):
+        elapsed = best_time(lambda init_function=init_function: [init_function(raw) for _, raw in corpus], number=3)
+        failures = sum(1 for _, raw in corpus if init_function(raw) is None)
+        peak = peak_memory(lambda init_function=init_function: init_function(largest_email))
+        rows.append([name, f"{elapsed / len(corpus) * 1e6:.1f}", failures, f"{peak / 1024:.1f}"])
+
+    print(f"Corpus: {len(corpus)} emails, largest one {len(largest_email) / 1024:.1f} KiB\n")
+    print_table(["parsing path", "us/email", "failures", "peak KiB (largest)"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark walking deeply nested forwarded emails, comparing with the previous recursive walk.
+
+Usage: python benchmarks/email_walk.py
+"""
+import email
+
+from common import best_time, print_table
+
+from circuit_maintenance_parser.data import NotificationData
+from circuit_maintenance_parser.testing import build_forwarded_email
+
+# Iterative walk of `NotificationData`, without the `DataPart` Set of the public `walk_email` decoding every payload
+walk_email_parts = NotificationData._walk_email_parts  # pylint: disable=protected-access
+
+
+def recursive_walk_email(email_message, data_parts: set) -> int:
+    """Previous implementation, recursing into parts already visited by `email.message.Message.walk()`."""
+    visited_parts = 0
+    for part in email_message.walk():
+        visited_parts += 1
+        if "image" in part.get_content_type():
+            continue
+
+        if "multipart" in part.get_content_type():
+            for inner_part in part.get_payload():
+                if isinstance(inner_part, email.message.Message):
+                    visited_parts += recursive_walk_email(inner_part, data_parts)
+        elif "message/rfc822" in part.get_content_type():
+            if isinstance(part.get_payload(), email.message.Message):
+                visited_parts += recursive_walk_email(part.get_payload(), data_parts)
+        else:
+            data_parts.add((part.get_content_type(), part.get_payload(decode=True)))
+    return visited_parts
+
+
+def main():
+    """Run the benchmark for an increasing number of forwarding levels."""
+    rows = []
+    for forwarding_levels in (1, 2, 4, 6, 8, 10, 12):
+        email_message = build_forwarded_email(forwarding_levels)
+        total_parts = len(list(email_message.walk()))
+        recursive_visits = recursive_walk_email(email_message, set())
+        iterative_visits = walk_email_parts(email_message, {}, max_depth=100)
+        recursive_time = best_time(
+            lambda email_message=email_message: recursive_walk_email(email_message, set()), number=3, repeat=3
+        )
+        iterative_time = best_time(
+            lambda email_message=email_message: walk_email_parts(email_message, {}, max_depth=100)
+        )
+        rows.append(
+            [
+                forwarding_levels,
+                total_parts,
+                recursive_visits,
+                iterative_visits,
+                f"{recursive_time * 1e6:.1f}",
+                f"{iterative_time * 1e6:.1f}",
+            ]
+        )
+
+    print_table(
+        ["forwards", "parts", "recursive visits", "iterative visits", "recursive us", "iterative us"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark the filters decoding with the MIME charset against guessing the encoding of the whole content.
+
+Usage: python benchmarks/filter_check.py
+"""
+import logging
+
+import chardet
+from common import best_time, load_corpus, print_table
+
+from circuit_maintenance_parser.data import NotificationData
+from circuit_maintenance_parser.provider import GenericProvider, charset_detection_stats
+from circuit_maintenance_parser.providers.equinix import Equinix
+from circuit_maintenance_parser.providers.lumen import Lumen
+from circuit_maintenance_parser.providers.tata import Tata
+from circuit_maintenance_parser.providers.zayo import Zayo
+
+
+def get_data_part_text_full_chardet(data_part) -> str:
+    """Previous implementation, running chardet over the whole content."""
+    data_part_encoding = chardet.detect(bytes(data_part.content)).get("encoding", "utf-8")
+    return str(data_part.content, data_part_encoding)
+
+
+def main():
+    """Run the benchmark over the emails of the providers with an `_include_filter`."""
+    logging.disable(logging.CRITICAL)
+    rows = []
+    for provider_class in (Equinix, Lumen, Tata, Zayo):
+        provider = provider_class()
+        include_filters = provider.get_default_include_filters()
+        corpus = [
+            NotificationData.init_from_email_bytes(raw)
+            for _, raw in load_corpus(f"{provider_class.get_provider_type()}/*.eml")
+        ]
+        data_parts = [
+            data_part for data in corpus if data for data_part in data.data_parts if data_part.type in include_filters
+        ]
+        if not data_parts:
+            continue
+
+        charset_detection_stats.clear()
+        row = [provider_class.__name__, len(data_parts)]
+        for get_data_part_text in (get_data_part_text_full_chardet, GenericProvider.get_data_part_text):
+            elapsed = best_time(
+                lambda get_data_part_text=get_data_part_text, data_parts=data_parts: [
+                    get_data_part_text(data_part) for data_part in data_parts
+                ],
+                number=1,
+                repeat=3,
+            )
+            row.append(f"{elapsed / len(data_parts) * 1e3:.2f}")
+        row.append(", ".join(f"{source}: {count}" for source, count in sorted(charset_detection_stats.items())))
+        rows.append(row)
+
+    print_table(["provider", "data parts", "full chardet ms/part", "charset ms/part", "charset sources"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark the filters compiled once per Provider class against compiling them on every check.
+
+Usage: python benchmarks/filter_plan.py
+"""
+import logging
+import re
+
+from common import best_time, load_corpus, print_table
+
+from circuit_maintenance_parser import get_supported_providers
+from circuit_maintenance_parser.data import NotificationData
+
+
+def filter_check_from_defaults(provider, data: NotificationData) -> bool:
+    """Previous implementation, reading the filter defaults and searching the expressions on every check."""
+    for filter_dict, filter_type in (
+        (provider.get_default_exclude_filters(), "exclude"),
+        (provider.get_default_include_filters(), "include"),
+    ):
+        if not filter_dict:
+            continue
+        matched = False
+        for data_part in data.data_parts:
+            if data_part.type not in filter_dict:
+                continue
+            text = provider.get_filter_text(data_part)
+            if any(re.search(filter_re, text) for filter_re in filter_dict[data_part.type]):
+                matched = True
+                break
+        if filter_type == "exclude" and matched:
+            return False
+        if filter_type == "include" and not matched:
+            return False
+    return True
+
+
+def filter_check_compiled(provider, data: NotificationData) -> bool:
+    """Current implementation, with the filters compiled once per Provider class."""
+    return not provider.exclude_filter_check(data) and provider.include_filter_check(data)
+
+
+def main():
+    """Run the filters of all the Providers with filters over the emails of the corpus."""
+    logging.disable(logging.CRITICAL)
+    providers = [
+        provider_class()
+        for provider_class in get_supported_providers()
+        if provider_class.get_default_include_filters() or provider_class.get_default_exclude_filters()
+    ]
+    corpus = [NotificationData.init_from_email_bytes(raw) for _, raw in load_corpus()]
+    corpus = [data for data in corpus if data]
+
+    rows = []
+    for filter_check in (filter_check_from_defaults, filter_check_compiled):
+        elapsed = best_time(
+            lambda filter_check=filter_check: [
+                filter_check(provider, data) for data in corpus for provider in providers
+            ],
+            number=1,
+            repeat=3,
+        )
+        accepted = sum(1 for data in corpus for provider in providers if filter_check(provider, data))
+        rows.append([filter_check.__name__, f"{elapsed / len(corpus) * 1e6:.1f}", accepted])
+
+    print_table(["implementation", "us/notification", "accepted"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark the HTML backends building the DOM of the HTML parsers of the hot Providers.
+
+For each HTML parser, over the HTML content of its Provider test data, it reports the time to build the DOM with each
+backend, and the time of parsing it with the backend of the parser, DOM included. The BeautifulSoup DOM is the lower
+bound of the previous parsing time of the parsers moved to the lxml backend.
+
+Usage: python benchmarks/html_backend.py
+"""
+import logging
+
+from common import best_time, load_html_contents, print_table
+
+from circuit_maintenance_parser import get_provider_class
+from circuit_maintenance_parser.errors import ParserError
+from circuit_maintenance_parser.parser import Html
+
+PROVIDER_TYPES = ("equinix", "lumen", "telstra", "verizon", "zayo")
+
+
+def parse_all(parser_class, contents):
+    """Parse all the HTML contents, ignoring the failures."""
+    for raw in contents:
+        try:
+            parser_class().parse(raw, "text/html")
+        except ParserError:
+            pass
+
+
+def main():
+    """Run the benchmark over the HTML parsers of the hot Providers."""
+    logging.disable(logging.CRITICAL)
+    rows = []
+    for provider_type in PROVIDER_TYPES:
+        contents = load_html_contents(provider_type)
+        soup_elapsed = best_time(lambda contents=contents: [Html.parse_soup(raw) for raw in contents])
+        lxml_elapsed = best_time(lambda contents=contents: [Html.parse_lxml_tree(raw) for raw in contents])
+        html_parsers = {
+            data_parser
+            for processor in get_provider_class(provider_type).get_default_processors()
+            for data_parser in processor.data_parsers
+            if issubclass(data_parser, Html)
+        }
+        for parser_class in sorted(html_parsers, key=lambda data_parser: data_parser.__name__):
+            parse_elapsed = best_time(
+                lambda parser_class=parser_class, contents=contents: parse_all(parser_class, contents)
+            )
+            rows.append(
+                [
+                    parser_class.__name__,
+                    parser_class()._html_backend,  # pylint: disable=protected-access
+                    len(contents),
+                    f"{soup_elapsed / len(contents) * 1e3:.2f}",
+                    f"{lxml_elapsed / len(contents) * 1e3:.2f}",
+                    f"{parse_elapsed / len(contents) * 1e3:.2f}",
+                ]
+            )
+
+    print_table(
+        ["parser", "backend", "contents", "bs4 DOM ms/content", "lxml tree ms/content", "parse ms/content"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
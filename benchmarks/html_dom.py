@@ -0,0 +1,59 @@
+"""Benchmark the HTML parsers of the Providers with multiple HTML Processors, sharing the DOM of each DataPart or not.
+
+Usage: python benchmarks/html_dom.py
+"""
+import logging
+from unittest.mock import patch
+
+from common import best_time, load_corpus, print_table
+
+from circuit_maintenance_parser import get_provider_class
+from circuit_maintenance_parser.data import NotificationData
+from circuit_maintenance_parser.errors import ProviderError
+from circuit_maintenance_parser.parser import Html
+
+parse_soup = Html.parse_soup
+
+
+def get_soup_without_sharing(_, raw):
+    """Previous implementation, parsing the DOM for each parser."""
+    return Html.parse_soup(raw)
+
+
+def get_maintenances(provider_class, corpus):
+    """Process all the notifications of the corpus, ignoring the failures."""
+    for data in corpus:
+        try:
+            provider_class().get_maintenances(data)
+        except ProviderError:
+            pass
+
+
+def run(provider_class, corpus):
+    """Return the time per email, in ms, and the number of DOMs parsed processing the corpus."""
+    elapsed = best_time(lambda: get_maintenances(provider_class, corpus), number=5, repeat=3)
+    with patch.object(Html, "parse_soup", side_effect=parse_soup) as mock_parse_soup:
+        get_maintenances(provider_class, corpus)
+    return f"{elapsed / len(corpus) * 1e3:.2f}", mock_parse_soup.call_count
+
+
+def main():
+    """Run the benchmark over the emails of the Providers with multiple HTML Processors."""
+    logging.disable(logging.CRITICAL)
+    rows = []
+    for provider_type in ("hgc", "seaborn"):
+        provider_class = get_provider_class(provider_type)
+        corpus = [NotificationData.init_from_email_bytes(raw) for _, raw in load_corpus(f"{provider_type}/*.eml")]
+        corpus = [data for data in corpus if data]
+
+        row = [provider_class.__name__, len(corpus)]
+        with patch.object(Html, "get_soup", get_soup_without_sharing):
+            row.extend(run(provider_class, corpus))
+        row.extend(run(provider_class, corpus))
+        rows.append(row)
+
+    print_table(["provider", "emails", "without sharing ms/email", "DOMs", "shared ms/email", "DOMs"], rows)
+
+
+if __name__ == "__main__":
+    main()
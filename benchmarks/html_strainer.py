@@ -0,0 +1,56 @@
+"""Benchmark the HTML parsers declaring the tags they parse, parsing only those tags or the whole DOM.
+
+Usage: python benchmarks/html_strainer.py
+"""
+import logging
+
+from common import best_time, load_html_contents, print_table
+
+from circuit_maintenance_parser.errors import ParserError
+from circuit_maintenance_parser.parsers.gtt import HtmlParserGTT1
+from circuit_maintenance_parser.parsers.momentum import HtmlParserMomentum1
+
+PARSERS = (
+    ("gtt", HtmlParserGTT1),
+    ("momentum", HtmlParserMomentum1),
+)
+
+
+def parse_all(parser, contents):
+    """Parse all the HTML contents, returning the results or the failures."""
+    results = []
+    for raw in contents:
+        try:
+            results.append(parser.parse(raw, "text/html"))
+        except ParserError as exc:
+            results.append(repr(exc.__cause__))
+    return results
+
+
+def main():
+    """Run the benchmark over the HTML contents of the Providers of the parsers declaring their tags."""
+    logging.disable(logging.CRITICAL)
+    rows = []
+    for provider_type, parser_class in PARSERS:
+        contents = load_html_contents(provider_type)
+        parser = parser_class()
+        parse_only_tags = parser._parse_only_tags  # pylint: disable=protected-access
+        whole_dom_parser = parser_class()
+        whole_dom_parser._parse_only_tags = None  # pylint: disable=protected-access
+
+        row = [parser_class.__name__, ",".join(parse_only_tags), len(contents)]
+        for each_parser in (whole_dom_parser, parser):
+            elapsed = best_time(
+                lambda each_parser=each_parser, contents=contents: parse_all(each_parser, contents),
+                number=20,
+                repeat=10,
+            )
+            row.append(f"{elapsed / len(contents) * 1e3:.2f}")
+        row.append(parse_all(whole_dom_parser, contents) == parse_all(parser, contents))
+        rows.append(row)
+
+    print_table(["parser", "tags", "contents", "whole DOM ms/content", "only tags ms/content", "same results"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark the cold-start import time of the library, with its Providers imported on demand.
+
+Each scenario runs in a fresh interpreter, so nothing is cached from a previous import. Importing all the
+supported Providers is the equivalent of the cold start before the registry, when the package imported them all.
+
+Usage: python benchmarks/import_time.py
+"""
+import subprocess
+import sys
+
+from common import print_table
+
+SCENARIOS = (
+    ("import circuit_maintenance_parser", "import circuit_maintenance_parser"),
+    (
+        'get_provider_class("zayo")',
+        "import circuit_maintenance_parser; circuit_maintenance_parser.get_provider_class('zayo')",
+    ),
+    (
+        "all the supported providers",
+        "import circuit_maintenance_parser; circuit_maintenance_parser.SUPPORTED_PROVIDERS",
+    ),
+)
+
+TIMED_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, len(sys.modules))
+"""
+
+
+def cold_start(statement: str):
+    """Return the time, in seconds, and the number of loaded modules of running the statement in a new interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", TIMED_SCRIPT.format(statement=statement)], check=True, capture_output=True, text=True
+    ).stdout.split()
+    return float(output[0]), int(output[1])
+
+
+def main(repeat: int = 5):
+    """Run each scenario several times, keeping the best time."""
+    rows = []
+    for name, statement in SCENARIOS:
+        results = [cold_start(statement) for _ in range(repeat)]
+        elapsed, modules = min(results)
+        rows.append([name, f"{elapsed * 1e3:.1f}", modules])
+
+    print_table(["scenario", "best ms", "loaded modules"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark the construction cost of NotificationData against the previous pydantic model.
+
+Usage: python benchmarks/notification_data.py
+"""
+from typing import List
+
+from common import best_time, print_table
+from pydantic import BaseModel
+
+from circuit_maintenance_parser.data import DataPart, NotificationData
+
+
+class PydanticNotificationData(BaseModel, extra="forbid", arbitrary_types_allowed=True):
+    """Previous implementation, validating the data parts on every construction."""
+
+    data_parts: List[DataPart] = []
+
+    def add_data_part(self, data_type: str, data_content: bytes):
+        """Add a DataPart element into the instance data_parts."""
+        self.data_parts.append(DataPart(data_type, data_content))
+
+
+def main():
+    """Run the benchmark for notifications with an increasing number of data parts."""
+    number = 10000
+    rows = []
+    for parts_count in (1, 4, 16):
+        data_parts = [DataPart("text/plain", f"content {idx}".encode()) for idx in range(parts_count)]
+        row = [parts_count]
+        for notification_class in (PydanticNotificationData, NotificationData):
+            elapsed = best_time(
+                lambda notification_class=notification_class, data_parts=data_parts: notification_class(
+                    data_parts=data_parts
+                ),
+                number=number,
+            )
+            row.append(f"{elapsed * 1e6:.2f}")
+        rows.append(row)
+
+    print_table(["data parts", "pydantic us/notification", "slots us/notification"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Benchmark the headers-only pre-scan against parsing the whole email to read its routing headers.
+
+Usage: python benchmarks/peek_headers.py
+"""
+import email
+import logging
+
+from common import best_time, load_corpus, print_table
+
+from circuit_maintenance_parser.data import EMAIL_ROUTING_HEADERS, NotificationData
+
+
+def full_parse_headers(raw_email_bytes: bytes):
+    """Read the routing headers after parsing and decoding the whole MIME tree, as required before."""
+    NotificationData.init_from_email_bytes(raw_email_bytes)
+    email_message = email.message_from_bytes(raw_email_bytes)
+    return {header_name: email_message[header_name] for header_name in EMAIL_ROUTING_HEADERS}
+
+
+def main():
+    """Run the benchmark over the `tests/unit/data/*/*.eml` corpus."""
+    logging.disable(logging.CRITICAL)
+    corpus = load_corpus("*/*.eml")
+    largest_email = max((raw for _, raw in corpus), key=len)
+
+    rows = []
+    for name, headers_function in (
+        ("full parse", full_parse_headers),
+        ("peek_headers", NotificationData.peek_headers),
+    ):
+        elapsed = best_time(lambda headers_function=headers_function: [headers_function(raw) for _, raw in corpus], 3)
+        largest = best_time(lambda headers_function=headers_function: headers_function(largest_email))
+        rows.append([name, f"{elapsed / len(corpus) * 1e6:.1f}", f"{largest * 1e6:.1f}"])
+
+    print(f"Corpus: {len(corpus)} emails, largest one {len(largest_email) / 1024:.1f} KiB\n")
+    print_table(["headers path", "us/email", "us (largest)"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark the Providers with multiple Processors, reusing the parsed data of their shared Parsers or not.
+
+Usage: python benchmarks/processor_fallback.py
+"""
+import logging
+from collections import Counter
+from unittest.mock import patch
+
+from common import best_time, load_corpus, print_table
+
+from circuit_maintenance_parser import get_provider_class
+from circuit_maintenance_parser.data import NotificationData
+from circuit_maintenance_parser.errors import ProviderError
+from circuit_maintenance_parser.parser import Parser
+from circuit_maintenance_parser.processor import GenericProcessor
+
+parser_runs: Counter = Counter()
+parse_data_part = Parser.parse_data_part
+
+
+def counted_parse_data_part(parser, data_part):
+    """Count the DataParts parsed by each Parser class."""
+    parser_runs[parser.__class__.__name__] += 1
+    return parse_data_part(parser, data_part)
+
+
+def parse_data_part_without_reuse(data_parser, data_part):
+    """Previous implementation, parsing the DataPart for each Processor."""
+    return data_parser().parse_data_part(data_part)
+
+
+def get_maintenances(provider_class, corpus):
+    """Process all the notifications of the corpus, ignoring the failures."""
+    for data in corpus:
+        try:
+            provider_class().get_maintenances(data)
+        except ProviderError:
+            pass
+
+
+def run(provider_class, corpus):
+    """Return the time per email, in ms, and the number of parser runs of processing the corpus."""
+    elapsed = best_time(lambda: get_maintenances(provider_class, corpus))
+    parser_runs.clear()
+    with patch.object(Parser, "parse_data_part", counted_parse_data_part):
+        get_maintenances(provider_class, corpus)
+    return f"{elapsed / len(corpus) * 1e3:.2f}", sum(parser_runs.values())
+
+
+def main():
+    """Run the benchmark over the emails of the Providers with multiple Processors sharing Parsers."""
+    logging.disable(logging.CRITICAL)
+    rows = []
+    for provider_type in ("cogent", "colt", "hgc", "seaborn"):
+        provider_class = get_provider_class(provider_type)
+        corpus = [NotificationData.init_from_email_bytes(raw) for _, raw in load_corpus(f"{provider_type}/*.eml")]
+        corpus = [data for data in corpus if data]
+
+        row = [provider_class.__name__, len(corpus)]
+        with patch.object(GenericProcessor, "parse_data_part", staticmethod(parse_data_part_without_reuse)):
+            row.extend(run(provider_class, corpus))
+        row.extend(run(provider_class, corpus))
+        rows.append(row)
+
+    print_table(
+        ["provider", "emails", "without reuse ms/email", "parser runs", "with reuse ms/email", "parser runs"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark the regular expressions registered by the parsers against the `re` functions they replaced.
+
+Over the lines of the test data emails, it reports the time per search of the registered expressions of all the
+parsers called through the `re` module functions with their patterns, as the parsers did, with the `re` cache warm and
+with the `re` cache emptied before each line (as when the other expressions of the application evict them from it),
+and called on the registered expressions, which don't depend on the `re` cache.
+
+Usage: python benchmarks/regex_registry.py
+"""
+import re
+
+from common import best_time, load_corpus, print_table
+
+from circuit_maintenance_parser import get_supported_providers
+from circuit_maintenance_parser.utils import compile_registered_regexes, regex_registry
+
+MAX_LINES = 500
+
+
+def search_with_re(patterns, lines):
+    """Search all the lines with the `re` functions, as the parsers did."""
+    for line in lines:
+        for pattern, flags in patterns:
+            re.search(pattern, line, flags)
+
+
+def search_with_re_evicted(patterns, lines):
+    """Search all the lines with the `re` functions, emptying the `re` cache before each line."""
+    for line in lines:
+        re.purge()
+        for pattern, flags in patterns:
+            re.search(pattern, line, flags)
+
+
+def search_with_registry(regexes, lines):
+    """Search all the lines with the registered expressions."""
+    for line in lines:
+        for regex in regexes:
+            regex.search(line)
+
+
+def main():
+    """Run the benchmark over the lines of the test data emails."""
+    # Importing the Providers imports their parsers, which register their expressions
+    get_supported_providers()
+    compile_registered_regexes()
+    patterns = list(regex_registry)
+    regexes = list(regex_registry.values())
+
+    lines = []
+    for _, raw in load_corpus():
+        lines.extend(line for line in raw.decode("utf-8", errors="ignore").splitlines() if line.strip())
+    lines = lines[:MAX_LINES]
+    searches = len(lines) * len(patterns)
+
+    rows = []
+    for mode, function, args in (
+        ("re functions", search_with_re, patterns),
+        ("re functions, cache evicted", search_with_re_evicted, patterns),
+        ("registered expressions", search_with_registry, regexes),
+    ):
+        elapsed = best_time(lambda function=function, args=args: function(args, lines), number=1)
+        rows.append([mode, len(patterns), len(lines), f"{elapsed / searches * 1e6:.2f}"])
+
+    print_table(["mode", "expressions", "lines", "us/search"], rows)
+
+
+if __name__ == "__main__":
+    main()
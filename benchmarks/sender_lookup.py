@@ -0,0 +1,46 @@
+"""Benchmark the sender index lookup against scanning the supported providers.
+
+Usage: python benchmarks/sender_lookup.py
+"""
+from common import best_time, print_table
+
+from circuit_maintenance_parser import get_supported_providers, lookup_provider_class_from_sender
+
+
+def scan_provider_class_from_sender(email_sender: str):
+    """Previous implementation, scanning the providers for an exact organizer match."""
+    for provider_parser in get_supported_providers():
+        if provider_parser.get_default_organizer() == email_sender:
+            return provider_parser
+    return None
+
+
+def main():
+    """Run the benchmark over the organizers of the providers, some subdomains of them and unknown senders."""
+    organizers = [provider.get_default_organizer() for provider in get_supported_providers()[1:]]
+    subdomain_senders = [f"noreply@notify.{organizer.rsplit('@', 1)[1]}" for organizer in organizers]
+    unknown_senders = [f"noc{idx}@example.com" for idx in range(len(organizers))]
+
+    rows = []
+    for name, senders in (
+        ("organizers", organizers),
+        ("subdomains", subdomain_senders),
+        ("unknown", unknown_senders),
+    ):
+        row = [name]
+        for lookup_function in (scan_provider_class_from_sender, lookup_provider_class_from_sender):
+            elapsed = best_time(
+                lambda lookup_function=lookup_function, senders=senders: [
+                    lookup_function(sender) for sender in senders
+                ],
+                number=100,
+            )
+            matches = sum(1 for sender in senders if lookup_function(sender))
+            row.extend([f"{elapsed / len(senders) * 1e6:.2f}", f"{matches}/{len(senders)}"])
+        rows.append(row)
+
+    print_table(["senders", "scan us/sender", "scan matches", "index us/sender", "index matches"], rows)
+
+
+if __name__ == "__main__":
+    main()
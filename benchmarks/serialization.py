@@ -0,0 +1,42 @@
+"""Benchmark loading serialized NotificationData against parsing the raw emails again.
+
+Usage: python benchmarks/serialization.py
+"""
+import logging
+
+from common import best_time, load_corpus, print_table
+
+from circuit_maintenance_parser.data import NotificationData
+
+
+def main():
+    """Run the benchmark over the `tests/unit/data/*/*.eml` corpus."""
+    logging.disable(logging.CRITICAL)
+    corpus = [raw for _, raw in load_corpus("*/*.eml") if NotificationData.init_from_email_bytes(raw)]
+    serialized_corpus = [NotificationData.init_from_email_bytes(raw).to_bytes() for raw in corpus]
+
+    rows = []
+    for name, load_function, loaded_corpus in (
+        ("parse raw email", NotificationData.init_from_email_bytes, corpus),
+        ("from_bytes (bytes)", NotificationData.from_bytes, serialized_corpus),
+        (
+            "from_bytes (memoryview)",
+            NotificationData.from_bytes,
+            [memoryview(serialized) for serialized in serialized_corpus],
+        ),
+    ):
+        elapsed = best_time(
+            lambda load_function=load_function, loaded_corpus=loaded_corpus: [
+                load_function(raw) for raw in loaded_corpus
+            ],
+            number=3,
+        )
+        size = sum(len(raw) for raw in loaded_corpus)
+        rows.append([name, f"{elapsed / len(corpus) * 1e6:.1f}", f"{size / 1024:.1f}"])
+
+    print(f"Corpus: {len(corpus)} emails\n")
+    print_table(["loading path", "us/notification", "total KiB"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,78 +1,40 @@
 """Circuit-maintenance-parser init."""
 
-from typing import Optional, Type
+from email.utils import parseaddr
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
+from .classifier import ProviderClassifier
 from .data import NotificationData
 from .errors import NonexistentProviderError, ProviderError
 from .output import Maintenance
-from .provider import (
-    AWS,
-    BSO,
-    GTT,
-    HGC,
-    NTT,
-    AquaComms,
-    Arelion,
-    Cogent,
-    Colt,
-    CrownCastle,
-    Equinix,
-    EUNetworks,
-    GenericProvider,
-    GlobalCloudXchange,
-    Google,
-    Lumen,
-    Megaport,
-    Momentum,
-    Netflix,
-    PacketFabric,
-    PCCW,
-    Seaborn,
-    Sparkle,
-    Tata,
-    Telia,
-    Telstra,
-    Turkcell,
-    Verizon,
-    Windstream,
-    Zayo,
-)
-
-SUPPORTED_PROVIDERS = (
-    GenericProvider,
-    AquaComms,
-    Arelion,
-    AWS,
-    BSO,
-    Cogent,
-    Colt,
-    CrownCastle,
-    Equinix,
-    EUNetworks,
-    GlobalCloudXchange,
-    Google,
-    GTT,
-    HGC,
-    Lumen,
-    Megaport,
-    Momentum,
-    Netflix,
-    NTT,
-    PacketFabric,
-    PCCW,
-    Seaborn,
-    Sparkle,
-    Tata,
-    Telia,
-    Telstra,
-    Turkcell,
-    Verizon,
-    Windstream,
-    Zayo,
-)
-
-SUPPORTED_PROVIDER_NAMES = [provider.get_provider_type() for provider in SUPPORTED_PROVIDERS]
-SUPPORTED_ORGANIZER_EMAILS = [provider.get_default_organizer() for provider in SUPPORTED_PROVIDERS]
+from .provider import GenericProvider
+from .providers import PROVIDER_CLASS_NAMES, PROVIDER_CLASS_NAMES_BY_TYPE, import_provider_class
+
+# The provider types are known upfront, but each Provider, and its Parsers, is only imported when it's used
+SUPPORTED_PROVIDER_NAMES = [GenericProvider.get_provider_type()] + list(PROVIDER_CLASS_NAMES_BY_TYPE)
+
+
+@lru_cache(maxsize=None)
+def get_supported_providers() -> Tuple[Type[GenericProvider], ...]:
+    """Return the classes of all the supported Providers, importing them on first use."""
+    return (GenericProvider,) + tuple(import_provider_class(class_name) for class_name in PROVIDER_CLASS_NAMES)
+
+
+def get_supported_organizer_emails() -> List[str]:
+    """Return the default organizers of all the supported Providers."""
+    return [provider.get_default_organizer() for provider in get_supported_providers()]
+
+
+def __getattr__(name: str) -> Any:
+    """Expose the supported Providers, which are imported on first access, as module attributes."""
+    if name == "SUPPORTED_PROVIDERS":
+        return get_supported_providers()
+    if name == "SUPPORTED_ORGANIZER_EMAILS":
+        return get_supported_organizer_emails()
+    if name in PROVIDER_CLASS_NAMES:
+        return import_provider_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def init_provider(provider_type=None) -> Optional[GenericProvider]:
@@ -88,28 +50,100 @@ def init_provider(provider_type=None) -> Optional[GenericProvider]:
 
 
 def get_provider_class(provider_name: str) -> Type[GenericProvider]:
-    """Returns the Provider parser class for a specific provider_type."""
+    """Returns the Provider parser class for a specific provider_type, importing only its own module."""
     provider_name = provider_name.lower()
 
-    for provider_parser in SUPPORTED_PROVIDERS:
-        if provider_parser.get_provider_type() == provider_name:
-            break
-    else:
+    if provider_name == GenericProvider.get_provider_type():
+        return GenericProvider
+    if provider_name not in PROVIDER_CLASS_NAMES_BY_TYPE:
         raise NonexistentProviderError(
             f"{provider_name} is not a currently supported provider. Only {', '.join(SUPPORTED_PROVIDER_NAMES)}"
         )
 
-    return provider_parser
+    return import_provider_class(PROVIDER_CLASS_NAMES_BY_TYPE[provider_name])
+
+
+def normalize_email_address(email_address: str) -> str:
+    """Return the bare email address, in lower case, from a sender or organizer such as `NOC <mailto:noc@ex.com>`."""
+    address = email_address.strip().lower()
+    # Bare addresses, the most common case, don't need the full address parsing
+    if any(character in address for character in '<>"() \t,;'):
+        _, address = parseaddr(address)
+    if address.startswith("mailto:"):
+        address = address.partition(":")[2]
+    return address
+
+
+def build_sender_index(
+    providers: Iterable[Type[GenericProvider]],
+) -> Tuple[Dict[str, Type[GenericProvider]], Dict[str, Type[GenericProvider]]]:
+    """Build the indexes of the providers by the address and by the domain of their default organizer.
+
+    The providers whose organizer domain is a company-wide mail domain, see `_sender_domain_lookup`, are only indexed
+    by their address. When multiple providers share the same address or domain, the first one wins.
+    """
+    address_index: Dict[str, Type[GenericProvider]] = {}
+    domain_index: Dict[str, Type[GenericProvider]] = {}
+    for provider_parser in providers:
+        address = normalize_email_address(provider_parser.get_default_organizer())
+        if "@" not in address:
+            continue
+        address_index.setdefault(address, provider_parser)
+        if provider_parser.get_default_sender_domain_lookup():
+            domain_index.setdefault(address.rsplit("@", 1)[1], provider_parser)
+    return address_index, domain_index
+
+
+@lru_cache(maxsize=None)
+def get_sender_index() -> Tuple[Dict[str, Type[GenericProvider]], Dict[str, Type[GenericProvider]]]:
+    """Return the sender indexes of the `SUPPORTED_PROVIDERS`, built on first use."""
+    return build_sender_index(get_supported_providers())
+
+
+def lookup_provider_class_from_sender(email_sender: str) -> Optional[Type[GenericProvider]]:
+    """Returns the notification parser class for an email sender, or None if no provider matches it.
+
+    The sender is matched first by its exact address, then by its domain, and then by each of its parent domains,
+    so a sender like `noreply@notify.zayo.com` matches the provider whose organizer is `mr@zayo.com`.
+    """
+    address_index, domain_index = get_sender_index()
+    address = normalize_email_address(email_sender)
+    if address in address_index:
+        return address_index[address]
+
+    domain = address.rpartition("@")[2]
+    while domain:
+        if domain in domain_index:
+            return domain_index[domain]
+        domain = domain.partition(".")[2]
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_provider_classifier() -> ProviderClassifier:
+    """Return the classifier of the `SUPPORTED_PROVIDERS`, compiled on first use."""
+    return ProviderClassifier(get_supported_providers())
+
+
+def classify_notification(data: NotificationData) -> List[Type[GenericProvider]]:
+    """Returns the candidate provider classes for a notification, ranked by how many of their filters match it.
+
+    All the include and exclude filters of the supported providers are matched in a single pass over the content of
+    the notification. Providers without filters are never candidates.
+    """
+    return get_provider_classifier().classify(data)
 
 
 def get_provider_class_from_sender(email_sender: str) -> Type[GenericProvider]:
-    """Returns the notification parser class for an email sender address."""
-    for provider_parser in SUPPORTED_PROVIDERS:
-        if provider_parser.get_default_organizer() == email_sender:
-            break
-    else:
+    """Returns the notification parser class for an email sender address, matching the organizer address exactly.
+
+    The senders are only matched by their domain with `lookup_provider_class_from_sender`.
+    """
+    address_index, _ = get_sender_index()
+    provider_parser = address_index.get(normalize_email_address(email_sender))
+    if provider_parser is None:
         raise NonexistentProviderError(
-            f"{email_sender} is not a currently supported provider parser. Only {', '.join(SUPPORTED_ORGANIZER_EMAILS)}"
+            f"{email_sender} is not a currently supported provider parser. Only {', '.join(get_supported_organizer_emails())}"
         )
 
     return provider_parser
@@ -120,6 +154,8 @@ __all__ = [
     "NotificationData",
     "get_provider_class",
     "get_provider_class_from_sender",
+    "lookup_provider_class_from_sender",
+    "classify_notification",
     "ProviderError",
     "NonexistentProviderError",
     "Maintenance",
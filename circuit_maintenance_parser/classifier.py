@@ -0,0 +1,135 @@
+"""Definition of the ProviderClassifier, to pick the candidate providers of a notification from its content."""
+import logging
+import re
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple, Type
+
+from circuit_maintenance_parser.data import NotificationData
+from circuit_maintenance_parser.provider import GenericProvider, get_compiled_filters
+
+logger = logging.getLogger(__name__)
+
+# Backreferences and conditional groups, that refer to the groups of their own expression by number or by name
+GROUP_REFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+class FilterSignature:  # pylint: disable=too-few-public-methods
+    """Filter expression of a provider, from its `_include_filter` or `_exclude_filter`."""
+
+    __slots__ = ("pattern", "provider_position", "exclude")
+
+    def __init__(self, pattern: Pattern, provider_position: int, exclude: bool):
+        """Initialize the FilterSignature with the compiled expression of the provider."""
+        self.pattern = pattern
+        self.provider_position = provider_position
+        self.exclude = exclude
+
+    @property
+    def expression(self) -> str:
+        """Return the filter expression."""
+        return self.pattern.pattern
+
+    @property
+    def is_combinable(self) -> bool:
+        """Whether the expression matches the same once embedded in a regex with other expressions.
+
+        The expressions with global inline flags, such as `(?i)`, named groups, backreferences or conditional groups
+        are not, as their flags must start the regex, and their groups are renamed or renumbered.
+        """
+        return (
+            not self.pattern.flags & ~re.UNICODE
+            and not self.pattern.groupindex
+            and not GROUP_REFERENCE_RE.search(self.expression)
+        )
+
+
+class ProviderClassifier:
+    """Classify notifications among multiple providers, using their include and exclude filters.
+
+    The filter expressions of all the providers are compiled, per data type, into a single regex, so the content of
+    each `DataPart` is scanned once instead of once per provider and expression. The combined regex stops at every
+    position where any expression matches, and there it checks all of them with a lookahead, so it finds the same
+    expressions that searching each one separately would find. The few expressions that can't be combined, see
+    `FilterSignature.is_combinable`, are searched separately with their own compiled pattern.
+
+    Attributes:
+        providers: Providers to classify the notifications among, in order of preference.
+    """
+
+    def __init__(self, providers: Iterable[Type[GenericProvider]]):
+        """Compile the filters of the providers."""
+        self.providers = list(providers)
+        signatures: Dict[str, List[FilterSignature]] = {}
+        for provider_position, provider in enumerate(self.providers):
+            include_filters, exclude_filters = get_compiled_filters(provider)
+            for exclude, filters in ((False, include_filters), (True, exclude_filters)):
+                for data_type, patterns in filters.items():
+                    for pattern in patterns:
+                        signatures.setdefault(data_type, []).append(
+                            FilterSignature(pattern, provider_position, exclude)
+                        )
+
+        # Per data type, the combined regex, if any, of the combinable signatures, and the signatures searched apart
+        self._matchers: Dict[str, Tuple[Optional[Pattern], List[FilterSignature], List[FilterSignature]]] = {}
+        for data_type, data_type_signatures in signatures.items():
+            combined = [signature for signature in data_type_signatures if signature.is_combinable]
+            separate = [signature for signature in data_type_signatures if not signature.is_combinable]
+            self._matchers[data_type] = (self.compile_signatures(combined) if combined else None, combined, separate)
+
+    @staticmethod
+    def compile_signatures(signatures: List[FilterSignature]) -> Pattern:
+        """Compile the expressions of the signatures into a single regex, with a named group per expression."""
+        any_expression = "|".join(f"(?:{signature.expression})" for signature in signatures)
+        each_expression = "".join(
+            f"(?:(?=(?P<_{idx}>{signature.expression})))?" for idx, signature in enumerate(signatures)
+        )
+        return re.compile(f"(?=(?:{any_expression})){each_expression}")
+
+    @staticmethod
+    def find_signatures(matcher: Optional[Pattern], signatures_count: int, text: str) -> Set[int]:
+        """Return the positions of the signatures whose expression is found in the text, scanning it once."""
+        if matcher is None:
+            return set()
+        pending = set(range(signatures_count))
+        found = set()
+        for match in matcher.finditer(text):
+            for idx in list(pending):
+                if match.start(f"_{idx}") != -1:
+                    found.add(idx)
+                    pending.discard(idx)
+            if not pending:
+                break
+        return found
+
+    def classify(self, data: NotificationData) -> List[Type[GenericProvider]]:
+        """Return the providers whose include filter matches the notification, ranked by the number of matches.
+
+        The providers whose exclude filter matches are not returned, as the exclusion takes precedence. Providers with
+        the same number of matches keep their order in `providers`.
+        """
+        include_matches: Dict[int, int] = {}
+        excluded: Set[int] = set()
+        for data_part in data.data_parts:
+            if data_part.type not in self._matchers:
+                continue
+            matcher, signatures, separate_signatures = self._matchers[data_part.type]
+            text = data_part.memoize(
+                GenericProvider.get_filter_text, partial(GenericProvider.get_filter_text, data_part)
+            )
+            found_signatures = [signatures[idx] for idx in self.find_signatures(matcher, len(signatures), text)]
+            found_signatures.extend(signature for signature in separate_signatures if signature.pattern.search(text))
+            for signature in found_signatures:
+                if signature.exclude:
+                    excluded.add(signature.provider_position)
+                else:
+                    include_matches[signature.provider_position] = (
+                        include_matches.get(signature.provider_position, 0) + 1
+                    )
+
+        ranking = sorted(
+            (position for position in include_matches if position not in excluded),
+            key=lambda position: (-include_matches[position], position),
+        )
+        candidates = [self.providers[position] for position in ranking]
+        logger.debug("Candidate providers: %s", ", ".join(provider.__name__ for provider in candidates))
+        return candidates
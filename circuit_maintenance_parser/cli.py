@@ -1,20 +1,26 @@
 """CLI for circuit-maintenance-parser."""
 import logging
 import sys
-import email
+from typing import Iterable, Optional
+
 import click
 
-from . import SUPPORTED_PROVIDERS, init_provider
+from . import SUPPORTED_PROVIDER_NAMES, init_provider
 from .provider import ProviderError
 from .data import NotificationData
 
 
 @click.command()
 @click.option("--data-file", required=True, help="File containing raw data to parse.")
-@click.option("--data-type", required=False, help="Type of notification data. Default: Icalendar", default="ical")
+@click.option(
+    "--data-type",
+    required=False,
+    help="Type of notification data (e.g. ical, html, email, mbox or maildir). Default: Icalendar",
+    default="ical",
+)
 @click.option(
     "--provider-type",
-    type=click.Choice([provider.get_provider_type() for provider in SUPPORTED_PROVIDERS]),
+    type=click.Choice(SUPPORTED_PROVIDER_NAMES),
     default="genericprovider",
     help="Provider type.",
 )
@@ -29,28 +35,49 @@ def main(provider_type, data_file, data_type, verbose):
         click.echo(f"Provider type {provider} is not supported.", err=True)
         sys.exit(1)
 
-    if data_type == "email":
-        if str.lower(data_file[-3:]) == "eml":
-            with open(data_file, encoding="utf-8") as email_file:
-                msg = email.message_from_file(email_file)
-            data = NotificationData.init_from_emailmessage(msg)
-        else:
-            click.echo("File format not supported, only *.eml", err=True)
-            sys.exit(1)
+    # Archives routinely contain other messages than notifications, so their failures don't stop the processing
+    is_archive = data_type in ("mbox", "maildir")
+    failures = 0
+    idx = 0
+    for position, data in enumerate(load_notifications(data_type, data_file)):
+        source = f"message #{position} of {data_file}" if is_archive else data_file
+        if data is None:
+            click.echo(f"Notification data could not be initialized from {source}.", err=True)
+            if not is_archive:
+                sys.exit(1)
+            failures += 1
+            continue
 
-    else:
-        with open(data_file, "rb") as raw_filename:
-            raw_bytes = raw_filename.read()
-        data = NotificationData.init_from_raw(data_type, raw_bytes)
+        try:
+            parsed_notifications = provider.get_maintenances(data)
+        except ProviderError as exc:
+            click.echo(f"Provider processing failed for {source}: {exc}", err=True)
+            if not is_archive:
+                sys.exit(1)
+            failures += 1
+            continue
 
-    try:
-        parsed_notifications = provider.get_maintenances(data)
-    except ProviderError as exc:
-        click.echo(f"Provider processing failed: {exc}", err=True)
+        for parsed_notification in parsed_notifications:
+            click.secho(f"Circuit Maintenance Notification #{idx}", fg="green", bold=True)
+            click.secho(parsed_notification.to_json(), fg="yellow")
+            click.secho(f"Metadata #{idx}", fg="green", bold=True)
+            click.secho(parsed_notification.metadata, fg="blue")
+            idx += 1
+
+    if failures:
+        click.echo(f"{failures} messages of {data_file} could not be processed.", err=True)
         sys.exit(1)
 
-    for idx, parsed_notification in enumerate(parsed_notifications):
-        click.secho(f"Circuit Maintenance Notification #{idx}", fg="green", bold=True)
-        click.secho(parsed_notification.to_json(), fg="yellow")
-        click.secho(f"Metadata #{idx}", fg="green", bold=True)
-        click.secho(parsed_notification.metadata, fg="blue")
+
+def load_notifications(data_type: str, data_file: str) -> Iterable[Optional[NotificationData]]:
+    """Return the notifications of the data file, or None for the ones that could not be initialized."""
+    if data_type == "email":
+        if str.lower(data_file[-3:]) != "eml":
+            click.echo("File format not supported, only *.eml", err=True)
+            sys.exit(1)
+        return [NotificationData.init_from_email_file(data_file)]
+    if data_type == "mbox":
+        return NotificationData.iter_from_mbox(data_file, skip_failed=False)
+    if data_type == "maildir":
+        return NotificationData.iter_from_maildir(data_file, skip_failed=False)
+    return [NotificationData.init_from_file(data_type, data_file)]
@@ -1,32 +1,371 @@
 """Definition of Data classes."""
+import hashlib
 import logging
-from typing import List, NamedTuple, Optional, Type, Set
+import mailbox
+import mmap
+import re
+import struct
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, TypeVar, Union
+from pathlib import Path
 
 import email
-from pydantic import BaseModel
+from email.feedparser import BytesFeedParser
+from email.parser import BytesHeaderParser
 from circuit_maintenance_parser.constants import EMAIL_HEADER_SUBJECT, EMAIL_HEADER_DATE
 
 
 logger = logging.getLogger(__name__)
 
+MemoizedValue = TypeVar("MemoizedValue")
 
-class DataPart(NamedTuple):
-    """Simplest data unit to be parsed."""
+# Size of the chunks of raw bytes fed to the email parser
+EMAIL_FEED_CHUNK_SIZE = 8192
+# Size, in bytes, of the digest used to identify each DataPart
+DATA_PART_DIGEST_SIZE = 16
+# Default maximum nesting depth of the email parts taken into account, such as in a chain of forwarded emails
+EMAIL_MAX_DEPTH = 20
+# Headers returned by default by `NotificationData.peek_headers`, enough to route a notification to a provider
+EMAIL_ROUTING_HEADERS = ("From", "Subject", "Date", "Message-ID")
+# The blank line that ends the email headers block
+EMAIL_HEADERS_END_RE = re.compile(rb"\r?\n\r?\n")
+# Binary serialization of NotificationData: magic, format version and number of data parts
+SERIALIZATION_MAGIC = b"CMPN"
+SERIALIZATION_VERSION = 1
+SERIALIZATION_HEADER = struct.Struct(">4sBI")
+# Binary serialization of each DataPart: length of the type, of the charset and of the content, followed by them
+SERIALIZATION_DATA_PART_HEADER = struct.Struct(">HHQ")
 
-    # type is an arbitrary string that is used to match the DataPart to the Parser class, that contains _data_types
-    type: str
-    content: bytes
 
+def normalize_data_type(data_type: str) -> str:
+    """Return the data type without parameters, such as `; charset=utf-8`, and in lower case."""
+    return data_type.split(";", 1)[0].strip().lower()
 
-class NotificationData(BaseModel, extra="forbid"):
-    """Base class for Notification Data types."""
 
-    data_parts: List[DataPart] = []
+class DataPart:
+    """Simplest data unit to be parsed.
+
+    A `DataPart` created from an email message part keeps the undecoded MIME part, and its `content` is only decoded
+    (base64, quoted-printable) the first time it's accessed, typically by a matching `Parser`. This way, the parts that
+    are never consumed, such as unrelated attachments, are not decoded at all.
+
+    Each `DataPart` also exposes a `digest` of its type and content, computed once, that is used to compare and hash
+    it, and that can be used as a cache key.
+
+    The `content` can be `bytes` or a `memoryview`, for instance over a memory mapped file, to avoid copying it.
+
+    The `charset` of the content, when known, such as the MIME `charset` parameter of an email message part, allows
+    decoding it without guessing its encoding.
+
+    While the memoization is enabled, see `NotificationData.memoization()`, the values derived from the content, such
+    as its decoded text, are computed only once and shared by all the filters and parsers using them.
+    """
+
+    __slots__ = ("type", "charset", "_content", "_email_part", "_digest", "_memo", "_memo_releases")
+
+    def __init__(
+        self,
+        type: str,  # pylint: disable=redefined-builtin
+        content: Optional[Union[bytes, memoryview, str]] = None,
+        email_part: Optional[email.message.Message] = None,
+        charset: Optional[str] = None,
+    ):
+        """Initialize the DataPart from its content or from the email message part holding the encoded content.
+
+        A `str` content is encoded as UTF-8.
+        """
+        if not isinstance(type, str):
+            raise TypeError(f"DataPart type must be a string, not {type.__class__.__name__}.")
+        if content is None and email_part is None:
+            raise ValueError("DataPart requires a content or an email message part.")
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+            charset = charset or "utf-8"
+        elif content is not None and not isinstance(content, (bytes, memoryview)):
+            raise TypeError(f"DataPart content must be bytes, memoryview or str, not {content.__class__.__name__}.")
+
+        # type is an arbitrary string that is used to match the DataPart to the Parser class, that contains _data_types
+        self.type = type
+        self.charset = charset
+        self._content = content
+        self._email_part = email_part
+        self._digest: Optional[str] = None
+        self._memo: Optional[Dict[Any, Any]] = None
+        self._memo_releases: List[Callable[[], Any]] = []
+
+    @classmethod
+    def from_email_part(cls, email_part: email.message.Message) -> "DataPart":
+        """Create a DataPart from an email message part, without decoding its payload yet."""
+        return cls(email_part.get_content_type(), email_part=email_part, charset=email_part.get_content_charset())
+
+    @property
+    def content(self) -> Union[bytes, memoryview]:
+        """Return the decoded content, decoding the email message part payload on first access."""
+        if self._content is None:
+            self._content = self._email_part.get_payload(decode=True)  # type: ignore[union-attr,assignment]
+            # The email part is not needed anymore once its payload has been decoded
+            self._email_part = None
+        return self._content  # type: ignore[return-value]
+
+    @property
+    def digest(self) -> str:
+        """Return the hex digest of the DataPart type and content, computing it on first access."""
+        if self._digest is None:
+            hasher = hashlib.blake2b(digest_size=DATA_PART_DIGEST_SIZE)
+            hasher.update(self.type.encode())
+            hasher.update(b"\0")
+            hasher.update(self.content)
+            self._digest = hasher.hexdigest()
+        return self._digest
+
+    def memoize(
+        self,
+        key: Any,
+        function: Callable[[], MemoizedValue],
+        release: Optional[Callable[[MemoizedValue], Any]] = None,
+    ) -> MemoizedValue:
+        """Return the value of `function` for this DataPart, computing it only once per `key` while memoization is on.
+
+        Args:
+            key: Hashable identifier of the computed value, usually the function deriving it from the content.
+            function: Callable without arguments that computes the value.
+            release (optional): Callable that frees the memoized value, called with it when the memoization is
+                disabled. For instance, to free the memory of a parsed document shared by multiple parsers.
+
+        Returns:
+            The memoized value, or the value just computed if the memoization is not enabled.
+        """
+        memo = self._memo
+        if memo is None:
+            return function()
+        try:
+            return memo[key]
+        except KeyError:
+            value = memo[key] = function()
+            if release is not None:
+                self._memo_releases.append(partial(release, value))
+            return value
+
+    def enable_memoization(self) -> bool:
+        """Enable the memoization, returning False if it was already enabled."""
+        if self._memo is not None:
+            return False
+        self._memo = {}
+        return True
+
+    def disable_memoization(self):
+        """Disable the memoization, releasing and dropping the memoized values."""
+        self._memo = None
+        while self._memo_releases:
+            self._memo_releases.pop()()
+
+    def release(self):
+        """Release the content when it's a memoryview, so the underlying buffer can be freed."""
+        if isinstance(self._content, memoryview):
+            self._content.release()
+
+    def __eq__(self, other) -> bool:
+        """Compare DataParts by their digest, so by type and content."""
+        if not isinstance(other, DataPart):
+            return NotImplemented
+        return self.digest == other.digest
+
+    def __hash__(self) -> int:
+        """Hash the DataPart by its digest, so by type and content."""
+        return hash(self.digest)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the type and the content, so a DataPart can be unpacked as `data_type, content = data_part`."""
+        return iter((self.type, self.content))
+
+    def __getitem__(self, index):
+        """Return the type (0) or the content (1), as the fields of the `(type, content)` tuple of a DataPart."""
+        return (self.type, self.content)[index]
+
+    def __len__(self) -> int:
+        """Return the number of `(type, content)` fields of a DataPart."""
+        return 2
+
+    def __repr__(self) -> str:
+        """Representation of the DataPart."""
+        return f"DataPart(type={self.type!r}, content={self.content!r})"
+
+
+class NotificationData:
+    """Base class for Notification Data types.
+
+    It's a lightweight container, instead of a pydantic model, so no validation runs every time a notification is
+    created: each `DataPart` already checks its own type and content.
+
+    When initialized from a file, the content is memory mapped instead of read, and it can be released as soon as the
+    notification has been processed, using the instance as a context manager or calling `release()`.
+
+    The positions of the data parts are indexed by their normalized type, so the `Processors` can look up the parts
+    matching each `Parser` without comparing every part with every parser.
+    """
+
+    __slots__ = ("data_parts", "_mapped_files", "_data_types_index")
+
+    def __init__(self, data_parts: Optional[Iterable[Union[DataPart, Tuple[str, Union[bytes, str]]]]] = None):
+        """Initialize the NotificationData with a copy of the given data parts.
+
+        The data parts can also be given as `(type, content)` tuples, that are converted into `DataPart`.
+
+        Raises:
+            TypeError: If a data part is neither a `DataPart` nor a `(type, content)` tuple.
+        """
+        self.data_parts: List[DataPart] = (
+            [self._as_data_part(data_part) for data_part in data_parts] if data_parts is not None else []
+        )
+        self._mapped_files: List[mmap.mmap] = []
+        self._data_types_index: Optional[Tuple[int, Dict[str, List[int]]]] = None
+
+    @staticmethod
+    def _as_data_part(data_part: Union[DataPart, Tuple[str, Union[bytes, str]]]) -> DataPart:
+        """Return the data part as a `DataPart`, converting a `(type, content)` tuple."""
+        if isinstance(data_part, DataPart):
+            return data_part
+        if isinstance(data_part, tuple) and len(data_part) == 2:
+            return DataPart(*data_part)
+        raise TypeError(
+            f"NotificationData data parts must be DataPart or (type, content) tuples, not {data_part.__class__.__name__}."
+        )
+
+    def get_data_types_index(self) -> Dict[str, List[int]]:
+        """Return the positions of the data parts for each normalized data type.
+
+        The index is built the first time it's needed, and built again if data parts have been added since then.
+        """
+        if self._data_types_index is None or self._data_types_index[0] != len(self.data_parts):
+            data_types_index: Dict[str, List[int]] = {}
+            for position, data_part in enumerate(self.data_parts):
+                data_types_index.setdefault(normalize_data_type(data_part.type), []).append(position)
+            self._data_types_index = (len(self.data_parts), data_types_index)
+        return self._data_types_index[1]
+
+    def __eq__(self, other) -> bool:
+        """Compare NotificationData by their data parts."""
+        if not isinstance(other, NotificationData):
+            return NotImplemented
+        return self.data_parts == other.data_parts
+
+    def __repr__(self) -> str:
+        """Representation of the NotificationData."""
+        return f"{self.__class__.__name__}(data_parts={self.data_parts!r})"
+
+    def __enter__(self) -> "NotificationData":
+        """Use the NotificationData as a context manager, releasing its content on exit."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Release the content when leaving the context."""
+        self.release()
+
+    @contextmanager
+    def memoization(self) -> Iterator["NotificationData"]:
+        """Enable, within the context, the memoization of the values derived from the content of each DataPart.
+
+        The memoized values are dropped when leaving the context, so they don't outlive, for instance, the
+        `get_maintenances` call that enabled it. Nested contexts share the memoized values of the outer one.
+        """
+        memoizing_data_parts = [data_part for data_part in self.data_parts if data_part.enable_memoization()]
+        try:
+            yield self
+        finally:
+            for data_part in memoizing_data_parts:
+                data_part.disable_memoization()
+
+    def release(self):
+        """Release the memoryview contents and close the memory mapped files backing them."""
+        for data_part in self.data_parts:
+            data_part.release()
+        for mapped_file in self._mapped_files:
+            try:
+                mapped_file.close()
+            except BufferError:
+                logger.warning("Memory mapped file can't be closed yet, some of its content is still referenced.")
+        self._mapped_files.clear()
 
     def add_data_part(self, data_type: str, data_content: bytes):
         """Add a DataPart element into the instance data_parts."""
         self.data_parts.append(DataPart(data_type, data_content))
 
+    @property
+    def fingerprint(self) -> str:
+        """Return a hex digest identifying the notification by the digests of its data parts, in any order.
+
+        It can be used as a cache key for the whole notification.
+        """
+        hasher = hashlib.blake2b(digest_size=DATA_PART_DIGEST_SIZE)
+        for data_part_digest in sorted(data_part.digest for data_part in self.data_parts):
+            hasher.update(data_part_digest.encode())
+        return hasher.hexdigest()
+
+    def to_bytes(self) -> bytes:
+        """Serialize the data parts into a compact binary format, to be loaded with `from_bytes`.
+
+        The format is a header, with a magic value, the format version and the number of data parts, followed by each
+        data part: the lengths of its type, charset and content, and then the type, charset and content themselves.
+        """
+        chunks: List[Union[bytes, memoryview]] = [
+            SERIALIZATION_HEADER.pack(SERIALIZATION_MAGIC, SERIALIZATION_VERSION, len(self.data_parts))
+        ]
+        for data_part in self.data_parts:
+            data_type = data_part.type.encode()
+            charset = (data_part.charset or "").encode()
+            content = data_part.content
+            chunks.append(SERIALIZATION_DATA_PART_HEADER.pack(len(data_type), len(charset), len(content)))
+            chunks.extend((data_type, charset, content))
+        return b"".join(chunks)
+
+    @classmethod
+    def from_bytes(
+        cls: Type["NotificationData"], serialized_data: Union[bytes, memoryview, mmap.mmap]
+    ) -> "NotificationData":
+        """Load a NotificationData serialized with `to_bytes`, without parsing the original notification again.
+
+        The content of each data part is a copy when `serialized_data` is `bytes`, and a memoryview slice of it, without
+        copying it, otherwise.
+
+        Raises:
+            ValueError: If `serialized_data` is not a valid serialized NotificationData.
+        """
+        buffer = memoryview(serialized_data)
+        try:
+            magic, version, data_parts_count = SERIALIZATION_HEADER.unpack_from(buffer)
+            if magic != SERIALIZATION_MAGIC or version != SERIALIZATION_VERSION:
+                raise ValueError(f"Not a serialized NotificationData with format version {SERIALIZATION_VERSION}.")
+
+            data_parts = []
+            offset = SERIALIZATION_HEADER.size
+            for _ in range(data_parts_count):
+                data_part, offset = cls._read_data_part(buffer, offset, copy=isinstance(serialized_data, bytes))
+                data_parts.append(data_part)
+        except (struct.error, UnicodeDecodeError) as exc:
+            raise ValueError("Serialized NotificationData is not valid.") from exc
+
+        if offset != len(buffer):
+            raise ValueError("Serialized NotificationData has unexpected trailing data.")
+        return cls(data_parts=data_parts)
+
+    @staticmethod
+    def _read_data_part(buffer: memoryview, offset: int, copy: bool) -> Tuple[DataPart, int]:
+        """Read a serialized DataPart starting at `offset`, returning it and the offset of the next one."""
+        field_sizes = SERIALIZATION_DATA_PART_HEADER.unpack_from(buffer, offset)
+        offset += SERIALIZATION_DATA_PART_HEADER.size
+        fields = []
+        for field_size in field_sizes:
+            field_end = offset + field_size
+            fields.append(buffer[offset:field_end])
+            offset = field_end
+        if len(fields[2]) != field_sizes[2]:
+            raise ValueError("Serialized NotificationData is truncated.")
+        data_part = DataPart(
+            str(fields[0], "utf-8"), bytes(fields[2]) if copy else fields[2], charset=str(fields[1], "ascii") or None
+        )
+        return data_part, offset
+
     @classmethod
     def init_from_raw(
         cls: Type["NotificationData"], data_type: str, data_content: bytes
@@ -39,55 +378,222 @@ class NotificationData(BaseModel, extra="forbid"):
         return None
 
     @classmethod
-    def init_from_email_bytes(cls: Type["NotificationData"], raw_email_bytes: bytes) -> Optional["NotificationData"]:
-        """Initialize the data_parts from an email defined as raw bytes.."""
+    def init_from_file(
+        cls: Type["NotificationData"], data_type: str, path: Union[str, Path]
+    ) -> Optional["NotificationData"]:
+        """Initialize the data_parts with only one DataPart object, with the memory mapped content of a file."""
         try:
-            raw_email_string = raw_email_bytes.decode("utf-8")
-            email_message = email.message_from_string(raw_email_string)
-            return cls.init_from_emailmessage(email_message)
+            with open(path, "rb") as data_file:
+                mapped_file = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+            data = cls(data_parts=[DataPart(data_type, memoryview(mapped_file))])
+            data._mapped_files.append(mapped_file)  # pylint: disable=protected-access
+            return data
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Error found initializing data from file: %s, %s", data_type, path)
+        return None
+
+    @classmethod
+    def init_from_email_file(
+        cls: Type["NotificationData"], path: Union[str, Path], max_depth: int = EMAIL_MAX_DEPTH
+    ) -> Optional["NotificationData"]:
+        """Initialize the data_parts from an email file, that is memory mapped instead of read while parsing it."""
+        try:
+            with open(path, "rb") as email_file:
+                with mmap.mmap(email_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                    return cls.init_from_email_bytes(mapped_file, max_depth=max_depth)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Error found initializing data from email file: %s", path)
+        return None
+
+    @classmethod
+    def init_from_email_bytes(
+        cls: Type["NotificationData"],
+        raw_email_bytes: Union[bytes, memoryview, mmap.mmap],
+        max_depth: int = EMAIL_MAX_DEPTH,
+    ) -> Optional["NotificationData"]:
+        """Initialize the data_parts from an email defined as raw bytes, or any other bytes-like object.
+
+        The bytes are fed in chunks to a `BytesFeedParser`, so the full message is never decoded as a single string
+        and non UTF-8 8bit bodies are kept as they come, instead of failing the decoding.
+        """
+        try:
+            feed_parser = BytesFeedParser()
+            for chunk_start in range(0, len(raw_email_bytes), EMAIL_FEED_CHUNK_SIZE):
+                chunk_end = chunk_start + EMAIL_FEED_CHUNK_SIZE
+                feed_parser.feed(bytes(raw_email_bytes[chunk_start:chunk_end]))
+            email_message = feed_parser.close()
+            return cls.init_from_emailmessage(email_message, max_depth=max_depth)
         except Exception:  # pylint: disable=broad-except
             logger.exception("Error found initializing data from email raw bytes: %s", raw_email_bytes)
         return None
 
     @classmethod
-    def walk_email(cls, email_message, data_parts):
-        """Recursive walk_email using Set to not duplicate data entries."""
-        for part in email_message.walk():
-            if "image" in part.get_content_type():
+    def iter_from_mbox(
+        cls: Type["NotificationData"], path: Union[str, Path], skip_failed: bool = True
+    ) -> Iterator[Optional["NotificationData"]]:
+        """Lazily yield a NotificationData for each message stored in an mbox archive.
+
+        Messages are loaded one at a time, so the memory used doesn't grow with the size of the archive.
+
+        Args:
+            path: Path of the mbox archive.
+            skip_failed: Log and skip the messages that can't be initialized, instead of yielding None for them.
+        """
+        yield from cls._iter_from_mailbox(mailbox.mbox(path, create=False), skip_failed)
+
+    @classmethod
+    def iter_from_maildir(
+        cls: Type["NotificationData"], path: Union[str, Path], skip_failed: bool = True
+    ) -> Iterator[Optional["NotificationData"]]:
+        """Lazily yield a NotificationData for each message stored in a Maildir folder.
+
+        Messages are loaded one at a time, so the memory used doesn't grow with the size of the folder.
+
+        Args:
+            path: Path of the Maildir folder.
+            skip_failed: Log and skip the messages that can't be initialized, instead of yielding None for them.
+        """
+        yield from cls._iter_from_mailbox(mailbox.Maildir(path, factory=None, create=False), skip_failed)
+
+    @classmethod
+    def _iter_from_mailbox(
+        cls: Type["NotificationData"], mail_box: mailbox.Mailbox, skip_failed: bool
+    ) -> Iterator[Optional["NotificationData"]]:
+        """Yield a NotificationData per message of a mailbox, reading only one raw message at a time."""
+        try:
+            for key in mail_box.iterkeys():
+                data = cls.init_from_email_bytes(mail_box.get_bytes(key))
+                if data is None and skip_failed:
+                    logger.warning("Skipping message %s from mailbox, it could not be initialized.", key)
+                    continue
+                yield data
+        finally:
+            mail_box.close()
+
+    @classmethod
+    def walk_email(cls, email_message, data_parts: Set[DataPart], max_depth: int = EMAIL_MAX_DEPTH) -> int:
+        """Walk all the email message parts in a single iterative pass, using a Set to not duplicate data entries.
+
+        Adding the `DataPart` of each part to the Set compares their decoded content, so all the payloads are decoded.
+
+        Args:
+            email_message: The `email.message.Message` to walk.
+            data_parts: Set where the `DataPart` of each non container part is added.
+            max_depth: Maximum nesting depth of the parts to take into account, deeper parts are skipped.
+
+        Returns:
+            The number of visited parts.
+        """
+        email_data_parts: Dict[Tuple, DataPart] = {}
+        visited_parts = cls._walk_email_parts(email_message, email_data_parts, max_depth)
+        data_parts.update(email_data_parts.values())
+        return visited_parts
+
+    @classmethod
+    def _walk_email_parts(cls, email_message, data_parts: Dict[Tuple, DataPart], max_depth: int) -> int:
+        """Walk all the email message parts in a single iterative pass, using a Dict to not duplicate data entries.
+
+        Each part is visited once, including the ones within forwarded (`message/rfc822`) messages. Entries are
+        deduplicated by their content type and their encoded payload, so the payloads are not decoded here.
+
+        Returns:
+            The number of visited parts.
+        """
+        visited_parts = 0
+        pending_parts = [(email_message, 0)]
+        while pending_parts:
+            part, depth = pending_parts.pop()
+            visited_parts += 1
+            content_type = part.get_content_type()
+            if "image" in content_type:
                 # Not interested in parsing images/QRs yet
                 continue
 
-            if "multipart" in part.get_content_type():
-                for inner_part in part.get_payload():
-                    if isinstance(inner_part, email.message.Message):
-                        cls.walk_email(inner_part, data_parts)
-            elif "message/rfc822" in part.get_content_type():
-                if isinstance(part.get_payload(), email.message.Message):
-                    cls.walk_email(part.get_payload(), data_parts)
-            else:
-                data_parts.add(DataPart(part.get_content_type(), part.get_payload(decode=True)))
+            if part.is_multipart():
+                # Both multipart and message/rfc822 parts contain a list of inner parts
+                if depth >= max_depth:
+                    logger.warning("Skipping email parts nested deeper than %s levels.", max_depth)
+                    continue
+                # Stacked in reverse order to visit them in their original order
+                pending_parts.extend(
+                    (inner_part, depth + 1)
+                    for inner_part in reversed(part.get_payload())
+                    if isinstance(inner_part, email.message.Message)
+                )
+            elif "multipart" not in content_type and "message/rfc822" not in content_type:
+                part_key = (content_type, part.get("content-transfer-encoding"), part.get_payload())
+                data_parts.setdefault(part_key, DataPart.from_email_part(part))
+
+        return visited_parts
+
+    @classmethod
+    def peek_headers(
+        cls: Type["NotificationData"],
+        raw_email_bytes: Union[bytes, memoryview, mmap.mmap],
+        headers: Iterable[str] = EMAIL_ROUTING_HEADERS,
+    ) -> Dict[str, Optional[str]]:
+        """Return some decoded headers of an email defined as raw bytes, without parsing its body.
+
+        Only the bytes before the first blank line are parsed, so the cost doesn't depend on the size of the body and
+        the notifications can be routed, or dropped, before decoding their MIME parts.
+
+        Args:
+            raw_email_bytes: The raw email, as bytes or any other bytes-like object.
+            headers: Names of the headers to return.
+
+        Returns:
+            Dict with the decoded value of each header, or None if it's not present.
+        """
+        headers_end = EMAIL_HEADERS_END_RE.search(raw_email_bytes)
+        headers_block = raw_email_bytes[: headers_end.end()] if headers_end else raw_email_bytes
+        email_headers = BytesHeaderParser().parsebytes(bytes(headers_block))
+        peeked_headers: Dict[str, Optional[str]] = {}
+        for header_name in headers:
+            header_value = email_headers[header_name]
+            if header_value is None:
+                peeked_headers[header_name] = None
+                continue
+            try:
+                peeked_headers[header_name] = cls.decode_email_header(header_value)
+            except (LookupError, UnicodeError, email.errors.HeaderParseError):
+                peeked_headers[header_name] = str(header_value)
+        return peeked_headers
+
+    @staticmethod
+    def decode_email_header(header_value) -> str:
+        """Get the Unicode representation of an email header value."""
+        if isinstance(header_value, email.header.Header):
+            # Raw 8bit headers parsed from bytes come wrapped in a Header with an `unknown-8bit` charset, and they are
+            # decoded as UTF-8 before looking for RFC2047 encoded words.
+            header_value = "".join(
+                chunk.decode("utf-8", errors="replace") for chunk, _ in email.header.decode_header(header_value)
+            )
+        # decode_header() handles conversion from RFC2047 ASCII representation of non-ASCII content to
+        #   a list of (string, charset) tuples.
+        # make_header() merges these back into a single Header object containing this text
+        # str() gets the simple Unicode representation of the Header.
+        return str(email.header.make_header(email.header.decode_header(header_value)))
 
     @classmethod
-    def init_from_emailmessage(cls: Type["NotificationData"], email_message) -> Optional["NotificationData"]:
-        """Initialize the data_parts from an email.message.Email object."""
+    def init_from_emailmessage(
+        cls: Type["NotificationData"], email_message, max_depth: int = EMAIL_MAX_DEPTH
+    ) -> Optional["NotificationData"]:
+        """Initialize the data_parts from an email.message.Email object, up to `max_depth` levels of nested parts."""
         try:
-            data_parts: Set[DataPart] = set()
-            cls.walk_email(email_message, data_parts)
+            email_data_parts: Dict[Tuple, DataPart] = {}
+            cls._walk_email_parts(email_message, email_data_parts, max_depth)
+            data_parts = list(email_data_parts.values())
 
             # Adding extra headers that are interesting to be parsed
-            data_parts.add(
+            data_parts.append(
                 DataPart(
-                    EMAIL_HEADER_SUBJECT,
-                    # decode_header() handles conversion from RFC2047 ASCII representation of non-ASCII content to
-                    #   a list of (string, charset) tuples.
-                    # make_header() merges these back into a single Header object containing this text
-                    # str() gets the simple Unicode representation of the Header.
-                    str(email.header.make_header(email.header.decode_header(email_message["Subject"]))).encode(),
+                    EMAIL_HEADER_SUBJECT, cls.decode_email_header(email_message["Subject"]).encode(), charset="utf-8"
                 )
             )
-            data_parts.add(DataPart(EMAIL_HEADER_DATE, email_message["Date"].encode()))
+            data_parts.append(DataPart(EMAIL_HEADER_DATE, email_message["Date"].encode(), charset="utf-8"))
             # Ensure the data parts are processed in a consistent order
-            return cls(data_parts=sorted(data_parts, key=lambda part: part.type))
+            data_parts.sort(key=lambda part: part.type)
+            return cls(data_parts=data_parts)
         except Exception:  # pylint: disable=broad-except
             logger.exception("Error found initializing data from email message: %s", email_message)
         return None
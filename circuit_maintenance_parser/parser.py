@@ -5,25 +5,31 @@ import base64
 import calendar
 import datetime
 import quopri
-from typing import Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple, TypeVar, Union
 from email.utils import parsedate_tz, mktime_tz
 import hashlib
 
-import bs4  # type: ignore
-from bs4.element import ResultSet  # type: ignore
-
 from pydantic import BaseModel, PrivateAttr
-from icalendar import Calendar  # type: ignore
 
+from circuit_maintenance_parser.data import DataPart
 from circuit_maintenance_parser.errors import ParserError
 from circuit_maintenance_parser.output import Status, Impact, CircuitImpact
 from circuit_maintenance_parser.constants import EMAIL_HEADER_SUBJECT, EMAIL_HEADER_DATE
-from circuit_maintenance_parser.utils import Geolocator
+from circuit_maintenance_parser.utils import Geolocator, parse_datetime
+
+# The HTML and iCalendar libraries are imported by the parsers on first use, so importing the library stays fast
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup  # type: ignore
+    from bs4.element import ResultSet  # type: ignore
+    from icalendar import Calendar  # type: ignore
+    from lxml.html import HtmlElement  # type: ignore
 
 # pylint: disable=no-member
 
 logger = logging.getLogger(__name__)
 
+DecodedValue = TypeVar("DecodedValue")
+
 
 class Parser(BaseModel):
     """Parser class.
@@ -39,6 +45,9 @@ class Parser(BaseModel):
     # TODO: move it to where it is used, Cogent parser
     _geolocator = Geolocator()
 
+    # DataPart being parsed by `parse_data_part`, whose memoized values are shared with other parsers and filters
+    _data_part: Optional[DataPart] = PrivateAttr(None)
+
     @classmethod
     def get_data_types(cls) -> List[str]:
         """Return the expected data type."""
@@ -84,6 +93,45 @@ class Parser(BaseModel):
         logger.debug("Successful parsing for %s", self.__class__.__name__)
         return result
 
+    def parse_data_part(self, data_part: DataPart) -> List[Dict]:
+        """Execute parsing of the content of a DataPart.
+
+        The values derived from its content with `memoize_raw`, such as its decoded text, are shared with the other
+        parsers of the same DataPart while its memoization is enabled.
+        """
+        self._data_part = data_part
+        try:
+            return self.parse(data_part.content, data_part.type)  # type: ignore[arg-type]
+        finally:
+            self._data_part = None
+
+    def memoize_raw(
+        self,
+        function: Callable[[bytes], DecodedValue],
+        raw: bytes,
+        release: Optional[Callable[[DecodedValue], Any]] = None,
+        key: Optional[Hashable] = None,
+    ) -> DecodedValue:
+        """Return `function(raw)`, memoized in the DataPart being parsed when `raw` is its content.
+
+        The optional `release` callable frees the memoized value once the memoization of the DataPart ends, and the
+        optional `key` identifies the value in the memo instead of `function`, when it is not enough to do so.
+        """
+        data_part = self._data_part
+        if data_part is None or raw is not data_part.content:
+            return function(raw)
+        return data_part.memoize(function if key is None else key, lambda: function(raw), release)
+
+    def parse_date(self, timestr: str, field: str, dayfirst: bool = False) -> datetime.datetime:
+        """Parse a date as `dateutil.parser.parse` does, with the `strptime` format learned for this field of the parser.
+
+        Args:
+            timestr: Date to parse.
+            field: Name of the parsed field, such as "start", identifying with the parser the format of its dates.
+            dayfirst (optional): Whether the day comes before the month in ambiguous dates, as in `dateutil`.
+        """
+        return parse_datetime(timestr, (self.__class__.__name__, field), dayfirst)
+
     @staticmethod
     def dt2ts(date_time: datetime.datetime) -> int:
         """Converts a datetime object to UTC timestamp. Naive datetime will be considered UTC."""
@@ -100,12 +148,14 @@ class ICal(Parser):
 
     def parser_hook(self, raw: bytes, content_type: str):
         """Execute parsing."""
+        from icalendar import Calendar  # type: ignore # pylint: disable=import-outside-toplevel
+
         # iCalendar data sometimes comes encoded with base64
         # TODO: add a test case
         try:
             gcal = Calendar.from_ical(base64.b64decode(raw))
         except ValueError:
-            gcal = Calendar.from_ical(raw)
+            gcal = Calendar.from_ical(bytes(raw))
 
         if not gcal:
             raise ParserError("Not a valid iCalendar data received")
@@ -113,7 +163,7 @@ class ICal(Parser):
         return self.parse_ical(gcal)
 
     @staticmethod
-    def parse_ical(gcal: Calendar) -> List[Dict]:
+    def parse_ical(gcal: "Calendar") -> List[Dict]:
         """Standard ICalendar parsing."""
         result = []
         for component in gcal.walk():
@@ -166,10 +216,21 @@ class ICal(Parser):
 
 
 class Html(Parser):
-    """Html parser."""
+    """Html parser.
+
+    The DOM passed to `parse_html` is built by the HTML backend of the parser: "bs4", the default, builds a
+    `bs4.BeautifulSoup` DOM, and "lxml" builds an `lxml.html` tree, much faster to build and to query with precompiled
+    XPath expressions.
+    """
 
     _data_types = PrivateAttr(["text/html", "html"])
 
+    # HTML backend building the DOM passed to `parse_html`, "bs4" or "lxml"
+    _html_backend = PrivateAttr("bs4")
+
+    # Names of the only tags, with their descendants, of the BeautifulSoup DOM passed to `parse_html`, if restricted
+    _parse_only_tags: Optional[Tuple[str, ...]] = PrivateAttr(None)
+
     @staticmethod
     def remove_hex_characters(string):
         """Convert any hex characters to standard ascii."""
@@ -178,19 +239,133 @@ class Html(Parser):
     def parser_hook(self, raw: bytes, content_type: str):
         """Execute parsing."""
         result = []
-        soup = bs4.BeautifulSoup(quopri.decodestring(raw), features="lxml")
+        dom = self.get_dom(raw)
         # Even we have not noticed any HTML notification with more than one maintenance yet, we define the
         # return of `parse_html` as an Iterable object to accommodate this potential case.
-        for data in self.parse_html(soup):
+        for data in self.parse_html(dom):
             result.append(data)
 
         return result
 
+    def get_dom(self, raw: bytes) -> Union["BeautifulSoup", "HtmlElement"]:
+        """Return the DOM of the HTML content built by the HTML backend of the parser."""
+        if self._html_backend == "bs4":
+            return self.get_soup(raw)
+        if self._html_backend == "lxml":
+            return self.get_lxml_tree(raw)
+        raise ValueError(f"Unsupported HTML backend {self._html_backend}, expected 'bs4' or 'lxml'")
+
+    def get_soup(self, raw: bytes) -> "BeautifulSoup":
+        """Return the DOM of the HTML content.
+
+        The DOM of a DataPart is parsed only once while its memoization is enabled, and it's shared by all the HTML
+        parsers of the DataPart, so they must not modify it. It's decomposed when the memoization ends, to free its
+        memory.
+
+        If the parser declares its `_parse_only_tags`, the DOM only contains those tags, and it's shared by the parsers
+        declaring the same tags.
+        """
+        if self._parse_only_tags is None:
+            return self.memoize_raw(Html.parse_soup, raw, Html.release_soup)
+        parse_only_tags = tuple(sorted(set(self._parse_only_tags)))
+        return self.memoize_raw(
+            lambda raw: Html.parse_soup(raw, parse_only_tags),
+            raw,
+            Html.release_soup,
+            key=(Html.parse_soup, parse_only_tags),
+        )
+
+    @staticmethod
+    def parse_soup(raw: bytes, parse_only_tags: Optional[Tuple[str, ...]] = None) -> "BeautifulSoup":
+        """Parse the DOM of the HTML content, after decoding it from quoted-printable.
+
+        Args:
+            raw: HTML content.
+            parse_only_tags (optional): Names of the only tags, with their descendants, to build in the DOM, skipping
+                the rest of the document.
+        """
+        import bs4  # type: ignore # pylint: disable=import-outside-toplevel
+
+        parse_only = bs4.SoupStrainer(list(parse_only_tags)) if parse_only_tags else None
+        return bs4.BeautifulSoup(quopri.decodestring(raw), features="lxml", parse_only=parse_only)
+
+    @staticmethod
+    def release_soup(soup: "BeautifulSoup"):
+        """Free the memory of a DOM, destroying it."""
+        soup.decompose()
+
+    def get_lxml_tree(self, raw: bytes) -> "HtmlElement":
+        """Return the lxml.html tree of the HTML content.
+
+        As the DOM of `get_soup`, the tree of a DataPart is parsed only once while its memoization is enabled, and it's
+        shared by all the HTML parsers of the DataPart using the "lxml" backend, so they must not modify it.
+        """
+        return self.memoize_raw(Html.parse_lxml_tree, raw)
+
+    @staticmethod
+    def parse_lxml_tree(raw: bytes) -> "HtmlElement":
+        """Parse the lxml.html tree of the HTML content, after decoding it from quoted-printable.
+
+        As BeautifulSoup does, the content is decoded as UTF-8 when possible, leaving lxml to detect any other encoding.
+        """
+        import lxml.html  # type: ignore # pylint: disable=import-outside-toplevel
+
+        content = quopri.decodestring(raw)
+        try:
+            return lxml.html.document_fromstring(content.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError):
+            # ValueError is raised by lxml for text with an XML encoding declaration
+            return lxml.html.document_fromstring(content)
+
+    @staticmethod
+    def get_lxml_string(element: "HtmlElement") -> Optional[str]:
+        """Return the only string of an lxml.html element, or None, as the `string` of a `bs4.element.Tag`."""
+        while True:
+            children = list(element)
+            if element.text:
+                return None if children else element.text
+            if len(children) != 1 or children[0].tail:
+                return None
+            element = children[0]
+
+    @staticmethod
+    def get_lxml_text(node: Union["HtmlElement", str]) -> str:
+        """Return the text of an lxml.html element, or the string itself, as the `text` of a `bs4.element.Tag`."""
+        return node if isinstance(node, str) else node.text_content()
+
+    @staticmethod
+    def iter_lxml_contents(element: "HtmlElement") -> Iterator[Union["HtmlElement", str]]:
+        """Iterate over the child elements and strings of an lxml.html element, as the `contents` of a `bs4.element.Tag`.
+
+        Comments are skipped, but not their tails.
+        """
+        if element.text:
+            yield element.text
+        for child in element:
+            if isinstance(child.tag, str):
+                yield child
+            if child.tail:
+                yield child.tail
+
+    @staticmethod
+    def iter_lxml_next_siblings(element: "HtmlElement") -> Iterator[Union["HtmlElement", str]]:
+        """Iterate over the next sibling elements and strings of an lxml.html element, as `bs4.element.Tag.next_siblings`.
+
+        Comments are skipped, but not their tails.
+        """
+        if element.tail:
+            yield element.tail
+        for sibling in element.itersiblings():
+            if isinstance(sibling.tag, str):
+                yield sibling
+            if sibling.tail:
+                yield sibling.tail
+
     def parse_html(
         self,
-        soup: ResultSet,
+        soup: "ResultSet",
     ) -> List[Dict]:
-        """Custom HTML parsing."""
+        """Custom HTML parsing of the DOM built by the HTML backend of the parser."""
         raise NotImplementedError
 
     @staticmethod
@@ -231,7 +406,7 @@ class EmailSubjectParser(Parser):
     def parser_hook(self, raw: bytes, content_type: str):
         """Execute parsing."""
         result = []
-        for data in self.parse_subject(self.bytes_to_string(raw).replace("\r", "").replace("\n", "")):
+        for data in self.parse_subject(self.memoize_raw(self.bytes_to_string, raw).replace("\r", "").replace("\n", "")):
             result.append(data)
         return result
 
@@ -276,7 +451,7 @@ class Text(Parser):
     def parser_hook(self, raw: bytes, content_type: str):
         """Execute parsing."""
         result = []
-        text = self.get_text_hook(raw)
+        text = self.memoize_raw(self.get_text_hook, raw)
         for data in self.parse_text(text):
             result.append(data)
         return result
@@ -284,7 +459,7 @@ class Text(Parser):
     @staticmethod
     def get_text_hook(raw: bytes) -> str:
         """Can be overwritten by subclasses."""
-        return raw.decode()
+        return str(raw, "utf-8")
 
     def parse_text(self, text) -> List[Dict]:
         """Custom text parsing."""
@@ -341,10 +516,10 @@ class LLM(Parser):
         """Execute parsing."""
         result = []
         if content_type in ["html", "text/html"]:
-            soup = bs4.BeautifulSoup(quopri.decodestring(raw), features="lxml")
+            soup = self.memoize_raw(Html.parse_soup, raw, Html.release_soup)
             content = soup.text
         elif content_type in ["text/plain"]:
-            content = self.get_text_hook(raw)
+            content = self.memoize_raw(self.get_text_hook, raw)
 
         for data in self.parse_content(content):
             result.append(data)
@@ -353,7 +528,7 @@ class LLM(Parser):
     @staticmethod
     def get_text_hook(raw: bytes) -> str:
         """Can be overwritten by subclasses."""
-        return raw.decode()
+        return str(raw, "utf-8")
 
     @staticmethod
     def get_key_with_string(dictionary: dict, string: str):
@@ -1,14 +1,16 @@
 """AquaComms parser."""
 import logging
-import re
 from datetime import datetime
 
 from circuit_maintenance_parser.parser import EmailSubjectParser, Html, Impact, CircuitImpact, Status
+from circuit_maintenance_parser.utils import register_regex
 
 # pylint: disable=too-many-nested-blocks, too-many-branches
 
 logger = logging.getLogger(__name__)
 
+SUBJECT_RE = register_regex(r"ISSUE=([0-9]+).PROJ=([0-9]+)")
+
 
 class SubjectParserAquaComms1(EmailSubjectParser):
     """Parser for Seaborn subject string, email type 1."""
@@ -19,7 +21,7 @@ class SubjectParserAquaComms1(EmailSubjectParser):
         Subject: Aqua Comms Planned Outage Work ISSUE=111111 PROJ=999
         """
         data = {}
-        search = re.search(r"ISSUE=([0-9]+).PROJ=([0-9]+)", subject)
+        search = SUBJECT_RE.search(subject)
         if search:
             data["maintenance_id"] = search.group(1)
             data["account"] = search.group(2)
@@ -2,18 +2,23 @@
 import hashlib
 import logging
 import quopri
-import re
 
 import bs4  # type: ignore
 
-from dateutil import parser
 
 from circuit_maintenance_parser.parser import CircuitImpact, EmailSubjectParser, Impact, Status, Text
+from circuit_maintenance_parser.utils import register_regex
 
 # pylint: disable=too-many-nested-blocks, too-many-branches
 
 logger = logging.getLogger(__name__)
 
+ACCOUNT_ID_RE = register_regex(r"\[AWS Account ?I?D?: ([0-9]+)\]")
+MAINTENANCE_WINDOW_RE = register_regex(
+    r"([A-Z][a-z]{2}, [0-9]{1,2} [A-Z][a-z]{2,9} [0-9]{4} [0-9]{2}:[0-9]{2}:[0-9]{2} [A-Z]{2,3}) to ([A-Z][a-z]{2}, [0-9]{1,2} [A-Z][a-z]{2,9} [0-9]{4} [0-9]{2}:[0-9]{2}:[0-9]{2} [A-Z]{2,3})"
+)
+CIRCUIT_ID_RE = register_regex(r"[a-z]{5}-[a-z0-9]{8}")
+
 
 class SubjectParserAWS1(EmailSubjectParser):
     """Subject parser for AWS notifications."""
@@ -24,7 +29,7 @@ class SubjectParserAWS1(EmailSubjectParser):
         Example: AWS Direct Connect Planned Maintenance Notification [AWS Account: 00000001]
         """
         data = {}
-        search = re.search(r"\[AWS Account ?I?D?: ([0-9]+)\]", subject)
+        search = ACCOUNT_ID_RE.search(subject)
         if search:
             data["account"] = search.group(1)
         return [data]
@@ -67,20 +72,17 @@ class TextParserAWS1(Text):
         for line in text.splitlines():
             if "planned maintenance" in line.lower() or "maintenance has been scheduled" in line.lower():
                 data["summary"] = line
-                search = re.search(
-                    r"([A-Z][a-z]{2}, [0-9]{1,2} [A-Z][a-z]{2,9} [0-9]{4} [0-9]{2}:[0-9]{2}:[0-9]{2} [A-Z]{2,3}) to ([A-Z][a-z]{2}, [0-9]{1,2} [A-Z][a-z]{2,9} [0-9]{4} [0-9]{2}:[0-9]{2}:[0-9]{2} [A-Z]{2,3})",
-                    line,
-                )
+                search = MAINTENANCE_WINDOW_RE.search(line)
                 if search:
-                    data["start"] = self.dt2ts(parser.parse(search.group(1)))
-                    data["end"] = self.dt2ts(parser.parse(search.group(2)))
+                    data["start"] = self.dt2ts(self.parse_date(search.group(1), "start"))
+                    data["end"] = self.dt2ts(self.parse_date(search.group(2), "end"))
                     maintenace_id += str(data["start"])
                     maintenace_id += str(data["end"])
                 if "may become unavailable" in line.lower():
                     impact = Impact.OUTAGE
                 elif "has been cancelled" in line.lower():
                     status = Status.CANCELLED
-            elif re.match(r"[a-z]{5}-[a-z0-9]{8}", line):
+            elif CIRCUIT_ID_RE.match(line):
                 maintenace_id += line
                 data["circuits"].append(CircuitImpact(circuit_id=line, impact=impact))
         # No maintenance ID found in emails, so a hash value is being generated using the start,
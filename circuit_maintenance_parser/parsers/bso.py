@@ -3,7 +3,6 @@
 import logging
 from typing import Dict
 
-from dateutil import parser
 from bs4.element import ResultSet, Tag  # type: ignore
 
 from circuit_maintenance_parser.parser import Html, Impact, CircuitImpact, Status
@@ -55,12 +54,12 @@ class HtmlParserBSO1(Html):
                 # Some BSO maintenance notifications contain multiple timeslots
                 # We will get the earliest as the start time and the latest as the end time
                 elif "Timeslot start time" in " ".join(span_element.text.strip().split()):
-                    start_ts = self.dt2ts(parser.parse(span_elements[idz + 1].text.strip()))
+                    start_ts = self.dt2ts(self.parse_date(span_elements[idz + 1].text.strip(), "start"))
                     # Keep the earliest start time
                     if "start" not in data or data["start"] > start_ts:
                         data["start"] = start_ts
                 elif "Timeslot end time" in " ".join(span_element.text.strip().split()):
-                    end_ts = self.dt2ts(parser.parse(span_elements[idz + 1].text.strip()))
+                    end_ts = self.dt2ts(self.parse_date(span_elements[idz + 1].text.strip(), "end"))
                     # Keep the latest end time
                     if "end" not in data or data["end"] < end_ts:
                         data["end"] = end_ts
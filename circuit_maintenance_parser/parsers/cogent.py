@@ -1,15 +1,25 @@
 """Cogent parser."""
 import logging
-import re
 from typing import Dict
 from datetime import datetime
 from pytz import timezone, UTC
 from bs4.element import ResultSet  # type: ignore
 
 from circuit_maintenance_parser.parser import CircuitImpact, EmailSubjectParser, Html, Impact, Status, Text
+from circuit_maintenance_parser.utils import register_regex
 
 logger = logging.getLogger(__name__)
 
+SUBJECT_ID_RE = register_regex(r".* ([\d-]+)")
+DEAR_RE = register_regex(r"Dear (.*),")
+START_1_RE = register_regex(r"Start time: ([A-Za-z\d: ]*) [()A-Za-z\s]+ (\d+/\d+/\d+)")
+END_1_RE = register_regex(r"End time: ([A-Za-z\d: ]*) [()A-Za-z\s]+ (\d+/\d+/\d+)")
+LOCATION_RE = register_regex(r"[^Cogent].*?((\b[A-Z][a-z\s-]+)+, ([A-Za-z-]+[\s-]))")
+WORK_ORDER_RE = register_regex("Work order number: (.*)")
+ORDER_ID_RE = register_regex(r"Order ID\(s\) impacted: (.*)")
+START_2_RE = register_regex(r"Start time: (.*) \([A-Za-z\s]+\) (\d+/\d+/\d+)")
+END_2_RE = register_regex(r"End time: (.*) \([A-Za-z\s]+\) (\d+/\d+/\d+)")
+
 # pylint: disable=too-many-branches
 
 
@@ -38,7 +48,7 @@ class SubjectParserCogent1(EmailSubjectParser):
         else:
             data["status"] = Status("NO-CHANGE")
 
-        match = re.search(r".* ([\d-]+)", subject)
+        match = SUBJECT_ID_RE.search(subject)
         if match:
             circuit_id = match.group(1)
             data["circuits"].append(CircuitImpact(impact=Impact("OUTAGE"), circuit_id=circuit_id.strip()))
@@ -81,20 +91,20 @@ class TextParserCogent1(Text):
 
         for line in lines:
             if line.startswith("Dear"):
-                match = re.search(r"Dear (.*),", line)
+                match = DEAR_RE.search(line)
                 if match:
                     data["account"] = match.group(1)
             elif line.startswith("Start time:"):
-                match = re.search(r"Start time: ([A-Za-z\d: ]*) [()A-Za-z\s]+ (\d+/\d+/\d+)", line)
+                match = START_1_RE.search(line)
                 if match:
                     start_str = " ".join(match.groups())
             elif line.startswith("End time:"):
-                match = re.search(r"End time: ([A-Za-z\d: ]*) [()A-Za-z\s]+ (\d+/\d+/\d+)", line)
+                match = END_1_RE.search(line)
                 if match:
                     end_str = " ".join(match.groups())
             elif line.startswith("Cogent customers receiving service"):
                 data["summary"] = line
-                match = re.search(r"[^Cogent].*?((\b[A-Z][a-z\s-]+)+, ([A-Za-z-]+[\s-]))", line)
+                match = LOCATION_RE.search(line)
                 if match:
                     local_timezone = timezone(self._geolocator.city_timezone(match.group(1).strip()))
 
@@ -131,12 +141,12 @@ class TextParserCogent1(Text):
                         utc_end,
                     )
             elif line.startswith("Work order number:"):
-                match = re.search("Work order number: (.*)", line)
+                match = WORK_ORDER_RE.search(line)
                 if match:
                     data["maintenance_id"] = match.group(1)
             elif line.startswith("Order ID(s) impacted:"):
                 data["circuits"] = []
-                match = re.search(r"Order ID\(s\) impacted: (.*)", line)
+                match = ORDER_ID_RE.search(line)
                 if match:
                     for circuit_id in match.group(1).split(","):
                         data["circuits"].append(CircuitImpact(impact=Impact("OUTAGE"), circuit_id=circuit_id.strip()))
@@ -165,19 +175,19 @@ class HtmlParserCogent1(Html):
                 if line.endswith("Network Maintenance"):
                     data["summary"] = line
                 elif line.startswith("Dear"):
-                    match = re.search(r"Dear (.*),", line)
+                    match = DEAR_RE.search(line)
                     if match:
                         data["account"] = match.group(1)
                 elif line.startswith("Start time:"):
-                    match = re.search(r"Start time: (.*) \([A-Za-z\s]+\) (\d+/\d+/\d+)", line)
+                    match = START_2_RE.search(line)
                     if match:
                         start_str = " ".join(match.groups())
                 elif line.startswith("End time:"):
-                    match = re.search(r"End time: (.*) \([A-Za-z\s]+\) (\d+/\d+/\d+)", line)
+                    match = END_2_RE.search(line)
                     if match:
                         end_str = " ".join(match.groups())
                 elif line.startswith("Cogent customers receiving service"):
-                    match = re.search(r"[^Cogent].*?((\b[A-Z][a-z\s-]+)+, ([A-Za-z-]+[\s-]))", line)
+                    match = LOCATION_RE.search(line)
                     if match:
                         parsed_timezone = self._geolocator.city_timezone(match.group(1).strip())
                         local_timezone = timezone(parsed_timezone)
@@ -208,12 +218,12 @@ class HtmlParserCogent1(Html):
                             utc_end,
                         )
                 elif line.startswith("Work order number:"):
-                    match = re.search("Work order number: (.*)", line)
+                    match = WORK_ORDER_RE.search(line)
                     if match:
                         data["maintenance_id"] = match.group(1)
                 elif line.startswith("Order ID(s) impacted:"):
                     data["circuits"] = []
-                    match = re.search(r"Order ID\(s\) impacted: (.*)", line)
+                    match = ORDER_ID_RE.search(line)
                     if match:
                         for circuit_id in match.group(1).split(","):
                             data["circuits"].append(
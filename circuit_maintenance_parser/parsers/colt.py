@@ -1,16 +1,23 @@
 """Colt parser."""
 
 import logging
-import re
 import csv
 import io
 
-from dateutil import parser
 from circuit_maintenance_parser.output import Status, Impact, CircuitImpact
 from circuit_maintenance_parser.parser import EmailSubjectParser, Csv
+from circuit_maintenance_parser.utils import register_regex
 
 logger = logging.getLogger(__name__)
 
+OCN_NUMBER_RE = register_regex(r"\d+")
+SUBJECT_1_RE = register_regex(
+    r"(?:\[.+\]\s)?([A-Za-z\s]+):?\s+?(CRQ\w+-\w+)\s(\d+/\d+/\d+\s\d+:\d+:\d+\s+[A-Z]+).+?(\d+/\d+/\d+\s\d+:\d+:\d+\s+[A-Z]+).+?([A-Z]+)"
+)
+SUBJECT_2_RE = register_regex(
+    r"(?:\[.+\]\s+)?([A-Za-z]+)\s+([\w\s]+)[\s-]+?(CRQ\w+-\w+).+?(\d+/\d+/\d+\s\d+:\d+:\d+\s+[A-Z]+).+?(\d+/\d+/\d+\s\d+:\d+:\d+\s[A-Z]+).+"
+)
+
 # pylint: disable=too-many-branches
 
 
@@ -21,12 +28,12 @@ class CsvParserColt1(Csv):
     def parse_csv(raw):
         """Execute parsing."""
         data = {"circuits": []}
-        with io.StringIO(raw.decode("utf-16")) as csv_data:
+        with io.StringIO(str(raw, "utf-16")) as csv_data:
             parsed_csv = csv.DictReader(csv_data, dialect=csv.excel_tab)
             for row in parsed_csv:
                 data["circuits"].append(CircuitImpact(impact=Impact("OUTAGE"), circuit_id=row["Circuit ID"].strip()))
                 if not data.get("account"):
-                    search = re.search(r"\d+", row["OCN"].strip())
+                    search = OCN_NUMBER_RE.search(row["OCN"].strip())
                     if search:
                         data["account"] = search.group()
         return [data]
@@ -44,14 +51,11 @@ class SubjectParserColt1(EmailSubjectParser):
         - MAINTENANCE ALERT: CRQ1-87654321 18/10/2022 20:00:00 GMT - 19/10/2022 00:00:00 GMT - COMPLETED
         """
         data = {}
-        search = re.search(
-            r"(?:\[.+\]\s)?([A-Za-z\s]+):?\s+?(CRQ\w+-\w+)\s(\d+/\d+/\d+\s\d+:\d+:\d+\s+[A-Z]+).+?(\d+/\d+/\d+\s\d+:\d+:\d+\s+[A-Z]+).+?([A-Z]+)",
-            subject,
-        )
+        search = SUBJECT_1_RE.search(subject)
         if search:
             data["maintenance_id"] = search.group(2)
-            data["start"] = self.dt2ts(parser.parse(search.group(3), dayfirst=True))
-            data["end"] = self.dt2ts(parser.parse(search.group(4), dayfirst=True))
+            data["start"] = self.dt2ts(self.parse_date(search.group(3), "start", dayfirst=True))
+            data["end"] = self.dt2ts(self.parse_date(search.group(4), "end", dayfirst=True))
             status = search.group(5).strip()
             if status == "START":
                 data["status"] = Status("IN-PROCESS")
@@ -75,17 +79,14 @@ class SubjectParserColt2(EmailSubjectParser):
         - Colt Third Party Maintenance Notification - CRQ1-87654321 [12/11/2022 05:00:00 GMT - 12/11/2022 17:00:00 GMT] for EXAMPLE, 654321
         """
         data = {}
-        search = re.search(
-            r"(?:\[.+\]\s+)?([A-Za-z]+)\s+([\w\s]+)[\s-]+?(CRQ\w+-\w+).+?(\d+/\d+/\d+\s\d+:\d+:\d+\s+[A-Z]+).+?(\d+/\d+/\d+\s\d+:\d+:\d+\s[A-Z]+).+",
-            subject,
-        )
+        search = SUBJECT_2_RE.search(subject)
         if search:
             if search.group(1).upper() == "CANCELLATION":
                 data["status"] = Status("CANCELLED")
             else:
                 data["status"] = Status("CONFIRMED")
             data["maintenance_id"] = search.group(3)
-            data["start"] = self.dt2ts(parser.parse(search.group(4), dayfirst=True))
-            data["end"] = self.dt2ts(parser.parse(search.group(5), dayfirst=True))
+            data["start"] = self.dt2ts(self.parse_date(search.group(4), "start", dayfirst=True))
+            data["end"] = self.dt2ts(self.parse_date(search.group(5), "end", dayfirst=True))
             data["summary"] = search.group(2).strip()
         return [data]
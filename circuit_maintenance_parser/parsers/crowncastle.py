@@ -1,14 +1,17 @@
 """Crown Castle Fiber parser."""
 import logging
-import re
 from datetime import datetime
 
 from circuit_maintenance_parser.parser import Html, Impact, CircuitImpact, Status
+from circuit_maintenance_parser.utils import register_regex
 
 # pylint: disable=too-many-nested-blocks, too-many-branches
 
 logger = logging.getLogger(__name__)
 
+DEAR_RE = register_regex(r"^Dear (.*),")
+NEWLINES_RE = register_regex(r"[\n\r]")
+
 
 class HtmlParserCrownCastle1(Html):
     """Notifications Parser for Crown Castle Fiber notifications."""
@@ -22,7 +25,7 @@ class HtmlParserCrownCastle1(Html):
 
         for paragraph in soup.find_all("p"):
             for pstring in paragraph.strings:
-                search = re.match(r"^Dear (.*),", pstring)
+                search = DEAR_RE.match(pstring)
                 if search:
                     data["account"] = search.group(1)
 
@@ -60,7 +63,7 @@ class HtmlParserCrownCastle1(Html):
             if val == "Description:" or val.startswith("Work Description:"):
                 for sibling in strong.parent.next_siblings:
                     summary = "".join(sibling.strings)
-                    summary = re.sub(r"[\n\r]", "", summary)
+                    summary = NEWLINES_RE.sub("", summary)
                     if summary != "":
                         data["summary"] = summary
                         break
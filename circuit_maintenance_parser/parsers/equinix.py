@@ -1,12 +1,13 @@
 """Circuit Maintenance Parser for Equinix Email Notifications."""
 from typing import Any, Dict, List
-import re
 
 from bs4.element import ResultSet  # type: ignore
-from dateutil import parser
 
 from circuit_maintenance_parser.output import Impact
 from circuit_maintenance_parser.parser import Html, EmailSubjectParser, Status
+from circuit_maintenance_parser.utils import register_regex
+
+MAINTENANCE_ID_RE = register_regex(r"\[([^[]*)\]$")
 
 
 class HtmlParserEquinix(Html):
@@ -76,8 +77,8 @@ class HtmlParserEquinix(Html):
                 # Note this detailed time does not contain the year..
                 start_end_time = raw_time.split("-")
                 if len(start_end_time) == 2:
-                    data["start"] = self.dt2ts(parser.parse(start_end_time[0].strip() + f" {start_year}"))
-                    data["end"] = self.dt2ts(parser.parse(start_end_time[1].strip() + f" {end_year}"))
+                    data["start"] = self.dt2ts(self.parse_date(start_end_time[0].strip() + f" {start_year}", "start"))
+                    data["end"] = self.dt2ts(self.parse_date(start_end_time[1].strip() + f" {end_year}", "end"))
             # all circuits in the notification share the same impact
             if "IMPACT:" in b_elem:
                 impact_line = b_elem.next_sibling
@@ -153,7 +154,7 @@ class SubjectParserEquinix(EmailSubjectParser):
             List[Dict]: Returns the data object with summary and status fields.
         """
         data = {}
-        maintenance_id = re.search(r"\[([^[]*)\]$", subject)
+        maintenance_id = MAINTENANCE_ID_RE.search(subject)
         if maintenance_id:
             data["maintenance_id"] = maintenance_id[1]
         data["summary"] = subject.strip().replace("\n", "")
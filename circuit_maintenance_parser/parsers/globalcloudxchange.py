@@ -1,6 +1,5 @@
 """Circuit Maintenance Parser for Equinix Email Notifications."""
 
-import re
 from datetime import datetime
 from typing import Any, Dict, List
 
@@ -8,6 +7,12 @@ from bs4.element import ResultSet  # type: ignore
 
 from circuit_maintenance_parser.output import Impact
 from circuit_maintenance_parser.parser import EmailSubjectParser, Html, Status
+from circuit_maintenance_parser.utils import register_regex
+
+DEAR_RE = register_regex("Dear (.*),")
+SUBJECT_RE = register_regex(
+    r"^([A-Z0-9]+) \| (\w+) \| ([\w\s]+) \| ([\w\s]+) \| (\d+-[A-Za-z]{3}-\d{4} \d{2}:\d{2}) \(GMT\) - (\d+-[A-Za-z]{3}-\d{4} \d{2}:\d{2}) \(GMT\)$"
+)
 
 
 class HtmlParserGcx1(Html):
@@ -26,7 +31,7 @@ class HtmlParserGcx1(Html):
 
         for div in soup.find_all("div"):
             for pstring in div.strings:
-                search = re.search("Dear (.*),", pstring)
+                search = DEAR_RE.search(pstring)
                 if search:
                     data["account"] = search.group(1)
 
@@ -59,10 +64,7 @@ class SubjectParserGcx1(EmailSubjectParser):
             List[Dict]: Returns the data object with summary and status fields.
         """
         data = {}
-        search = re.search(
-            r"^([A-Z0-9]+) \| (\w+) \| ([\w\s]+) \| ([\w\s]+) \| (\d+-[A-Za-z]{3}-\d{4} \d{2}:\d{2}) \(GMT\) - (\d+-[A-Za-z]{3}-\d{4} \d{2}:\d{2}) \(GMT\)$",
-            subject,
-        )
+        search = SUBJECT_RE.search(subject)
         if search:
             data["maintenance_id"] = search.group(1)
             date_format = date_format = "%d-%b-%Y %H:%M"
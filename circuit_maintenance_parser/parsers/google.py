@@ -1,14 +1,16 @@
 """Google parser."""
 import logging
-import re
 from datetime import datetime
 
 from circuit_maintenance_parser.parser import Html, Impact, CircuitImpact, Status
+from circuit_maintenance_parser.utils import register_regex
 
 # pylint: disable=too-many-nested-blocks, too-many-branches
 
 logger = logging.getLogger(__name__)
 
+REFERENCE_RE = register_regex(r" - Reference (.*)$")
+
 
 class HtmlParserGoogle1(Html):
     """Notifications Parser for Google notifications."""
@@ -37,7 +39,7 @@ class HtmlParserGoogle1(Html):
                 data["circuits"].append(CircuitImpact(circuit_id=cid, impact=Impact.OUTAGE))
 
         summary = list(soup.find("div").find("div").strings)[-1].strip()
-        match = re.search(r" - Reference (.*)$", summary)
+        match = REFERENCE_RE.search(summary)
         data["summary"] = summary
         data["maintenance_id"] = match[1]
 
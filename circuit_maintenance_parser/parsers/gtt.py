@@ -1,20 +1,24 @@
 """GTT parser."""
 import logging
-import re
 
-from dateutil import parser
+from pydantic import PrivateAttr
 
 from circuit_maintenance_parser.parser import Html, Impact, CircuitImpact, Status
+from circuit_maintenance_parser.utils import register_regex
 
 # pylint: disable=too-many-branches
 
 
 logger = logging.getLogger(__name__)
 
+TICKET_RE = register_regex(r".+: ([0-9]+) - ([A-Z][a-z]+)")
+
 
 class HtmlParserGTT1(Html):
     """Notifications Parser for EXA (formerly GTT) notifications."""
 
+    _parse_only_tags = PrivateAttr(("table",))
+
     def parse_html(self, soup):
         """Execute parsing."""
         data = {}
@@ -29,7 +33,7 @@ class HtmlParserGTT1(Html):
                     # Match example: `Planned Work Notification: 6048019 - Cancelled`
                     # Group 1 matches the maintenance ID
                     # Group 2 matches the status of the notification
-                    groups = re.search(r".+: ([0-9]+) - ([A-Z][a-z]+)", td_element.text.strip())
+                    groups = TICKET_RE.search(td_element.text.strip())
                     if groups:
                         data["maintenance_id"] = groups.groups()[0]
                         status = groups.groups()[1]
@@ -53,17 +57,17 @@ class HtmlParserGTT1(Html):
                     next_td = td_element.next_sibling.next_sibling
                     strong = next_td.contents[1]
                     if strong.string:
-                        start = parser.parse(strong.string)
+                        start = self.parse_date(strong.string, "start")
                     else:
-                        start = parser.parse(strong.contents[1].string)
+                        start = self.parse_date(strong.contents[1].string, "start")
                     data["start"] = self.dt2ts(start)
                 elif "End" in td_element.text:
                     next_td = td_element.next_sibling.next_sibling
                     strong = next_td.contents[1]
                     if strong.string:
-                        end = parser.parse(strong.string)
+                        end = self.parse_date(strong.string, "end")
                     else:
-                        end = parser.parse(strong.contents[1].string)
+                        end = self.parse_date(strong.contents[1].string, "end")
                     data["end"] = self.dt2ts(end)
             num_columns = len(table.find_all("th"))
             if num_columns:
@@ -1,16 +1,17 @@
 """HGC parser."""
 import logging
-import re
 
-from dateutil import parser
 
 from circuit_maintenance_parser.parser import EmailSubjectParser, Html, Impact, CircuitImpact, Status
+from circuit_maintenance_parser.utils import register_regex
 
 # pylint: disable=too-many-branches
 
 
 logger = logging.getLogger(__name__)
 
+SUBJECT_RE = register_regex(r"^.+\((.+)\)")
+
 
 class SubjectParserHGC1(EmailSubjectParser):
     """HGC subject parser."""
@@ -23,7 +24,7 @@ class SubjectParserHGC1(EmailSubjectParser):
             HGC Maintenance Work Notification - Network to Code | CIR0000001 | TIC00000000000001
         """
         data = {}
-        search = re.search(r"^.+\((.+)\)", subject.replace("\n", ""))
+        search = SUBJECT_RE.search(subject.replace("\n", ""))
         if search:
             data["maintenance_id"] = search.group(1)
         else:
@@ -68,9 +69,9 @@ class HtmlParserHGC1(Html):
                 elif "customer" in td_element.text.lower():
                     data["account"] = td_elements[idx + 2].text.strip()
                 elif "maintenance window start date" in td_element.text.lower():
-                    data["start"] = self.dt2ts(parser.parse(td_elements[idx + 2].text.strip()))
+                    data["start"] = self.dt2ts(self.parse_date(td_elements[idx + 2].text.strip(), "start"))
                 elif "maintenance window end date" in td_element.text.lower():
-                    data["end"] = self.dt2ts(parser.parse(td_elements[idx + 2].text.strip()))
+                    data["end"] = self.dt2ts(self.parse_date(td_elements[idx + 2].text.strip(), "end"))
                 elif "description" in td_element.text.lower():
                     data["summary"] = td_elements[idx + 2].text.strip()
                 elif "service impact" in td_element.text.lower():
@@ -107,9 +108,9 @@ class HtmlParserHGC2(Html):
             elif "customer:" in span_element.text.lower():
                 data["account"] = span_element.text.split(":")[1].strip()
             elif "maintenance window start date" in span_element.text.lower():
-                data["start"] = self.dt2ts(parser.parse(span_element.text.split(":")[1].strip()))
+                data["start"] = self.dt2ts(self.parse_date(span_element.text.split(":")[1].strip(), "start"))
             elif "maintenance window end date" in span_element.text.lower():
-                data["end"] = self.dt2ts(parser.parse(span_element.text.split(":")[1].strip()))
+                data["end"] = self.dt2ts(self.parse_date(span_element.text.split(":")[1].strip(), "end"))
             elif "description:" in span_element.text.lower():
                 data["summary"] = span_element.text.split(":")[1].strip()
             elif "service impact:" in span_element.text.lower():
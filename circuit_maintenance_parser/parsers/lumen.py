@@ -1,11 +1,11 @@
 """Lumen parser."""
 import logging
-from typing import Dict
+from typing import Dict, Iterable, List, Union
 
 from copy import deepcopy
-from dateutil import parser
-import bs4  # type: ignore
-from bs4.element import ResultSet  # type: ignore
+from lxml import etree  # type: ignore
+from lxml.html import HtmlElement  # type: ignore
+from pydantic import PrivateAttr
 
 from circuit_maintenance_parser.parser import CircuitImpact, Html, Impact, Status
 
@@ -14,16 +14,22 @@ from circuit_maintenance_parser.parser import CircuitImpact, Html, Impact, Statu
 
 logger = logging.getLogger(__name__)
 
+SPANS_XPATH = etree.XPath("//span")
+TABLES_XPATH = etree.XPath("//table")
+CELLS_XPATH = etree.XPath(".//td")
+
 
 class HtmlParserLumen1(Html):
     """Notifications Parser for Lumen notifications."""
 
+    _html_backend = PrivateAttr("lxml")
+
     def parse_html(self, soup):
         """Execute parsing."""
         maintenances = []
         data = {}
-        self.parse_spans(soup.find_all("span"), data)
-        self.parse_tables(soup.find_all("table"), data)
+        self.parse_spans(SPANS_XPATH(soup), data)
+        self.parse_tables(TABLES_XPATH(soup), data)
 
         # Iterates over multiple windows and duplicates other maintenance info to a new dictionary while also updating start and end times for the specific window.
         for window in data["windows"]:
@@ -37,60 +43,62 @@ class HtmlParserLumen1(Html):
 
         return maintenances
 
-    def parse_spans(self, spans: ResultSet, data: Dict):
+    def parse_spans(self, spans: List[HtmlElement], data: Dict):
         """Parse Span tag."""
         for line in spans:
-            if isinstance(line, bs4.element.Tag):
-                line_text = line.text.lower().strip()
-                if line_text.startswith("scheduled maintenance #:") or line_text.startswith(
-                    "scheduled maintenance window #:"
-                ):
-                    data["maintenance_id"] = line_text.split("#: ")[-1]
-                elif line_text.startswith("summary:"):
-                    siblings = line.next_siblings
-                    if not line.next_sibling:
-                        siblings = line.parent.next_sibling
-                    for sibling in siblings:
-                        text_sibling = sibling.text.strip() if isinstance(sibling, bs4.element.Tag) else sibling.strip()
-                        if text_sibling != "":
-                            data["summary"] = text_sibling
-                            break
-                elif line_text.startswith("updates:"):
-                    for sibling in line.next_siblings:
-                        text_sibling = sibling.text.strip() if isinstance(sibling, bs4.element.Tag) else sibling.strip()
-                        if text_sibling != "":
-                            if (
-                                "This maintenance is scheduled" in text_sibling
-                                or "The scheduled maintenance work has begun" in text_sibling
-                            ):
-                                data["status"] = Status("IN-PROCESS")
-                            if "GMT" in text_sibling:
-                                stamp = parser.parse(text_sibling.split(" GMT")[0])
-                                data["stamp"] = self.dt2ts(stamp)
-                            break
-
-    def parse_tables(self, tables: ResultSet, data: Dict):  # pylint: disable=too-many-locals
+            line_text = line.text_content().lower().strip()
+            if line_text.startswith("scheduled maintenance #:") or line_text.startswith(
+                "scheduled maintenance window #:"
+            ):
+                data["maintenance_id"] = line_text.split("#: ")[-1]
+            elif line_text.startswith("summary:"):
+                siblings: Iterable[Union[HtmlElement, str]] = self.iter_lxml_next_siblings(line)
+                if not line.tail and line.getnext() is None:
+                    parent_sibling = next(self.iter_lxml_next_siblings(line.getparent()))
+                    siblings = (
+                        parent_sibling if isinstance(parent_sibling, str) else self.iter_lxml_contents(parent_sibling)
+                    )
+                for sibling in siblings:
+                    text_sibling = self.get_lxml_text(sibling).strip()
+                    if text_sibling != "":
+                        data["summary"] = text_sibling
+                        break
+            elif line_text.startswith("updates:"):
+                for sibling in self.iter_lxml_next_siblings(line):
+                    text_sibling = self.get_lxml_text(sibling).strip()
+                    if text_sibling != "":
+                        if (
+                            "This maintenance is scheduled" in text_sibling
+                            or "The scheduled maintenance work has begun" in text_sibling
+                        ):
+                            data["status"] = Status("IN-PROCESS")
+                        if "GMT" in text_sibling:
+                            stamp = self.parse_date(text_sibling.split(" GMT")[0], "stamp")
+                            data["stamp"] = self.dt2ts(stamp)
+                        break
+
+    def parse_tables(self, tables: List[HtmlElement], data: Dict):  # pylint: disable=too-many-locals
         """Parse Table tag."""
         # Initialise multiple windows list that will be used in parse_html
         data["windows"] = []
 
         circuits = []
         for table in tables:
-            cells = table.find_all("td")
+            cells = [self.get_lxml_string(cell) for cell in CELLS_XPATH(table)]
             if not cells:
                 continue
-            if cells[0].string == "Start" and cells[1].string == "End":
+            if cells[0] == "Start" and cells[1] == "End":
                 num_columns = 2
                 for idx in range(num_columns, len(cells), num_columns):
-                    if "GMT" in cells[idx].string and "GMT" in cells[idx + 1].string:
-                        start = parser.parse(cells[idx].string.split(" GMT")[0])
+                    if "GMT" in cells[idx] and "GMT" in cells[idx + 1]:
+                        start = self.parse_date(cells[idx].split(" GMT")[0], "start")
                         start_ts = self.dt2ts(start)
-                        end = parser.parse(cells[idx + 1].string.split(" GMT")[0])
+                        end = self.parse_date(cells[idx + 1].split(" GMT")[0], "end")
                         end_ts = self.dt2ts(end)
                         data["windows"].append((start_ts, end_ts))
                         break
 
-            elif cells[0].string == "Customer Name":
+            elif cells[0] == "Customer Name":
                 # There are tables with 8 columns or 9 columns with "Status" at the end
                 num_columns = 1
                 if len(cells) % 10 == 0:
@@ -103,9 +111,9 @@ class HtmlParserLumen1(Html):
                 for idx in range(num_columns, len(cells), num_columns):
                     # Account and Status are defined per Circuit ID but we understand that are consistent
                     if "account" not in data:
-                        data["account"] = cells[idx].string
+                        data["account"] = cells[idx]
                     if num_columns == 10:
-                        status_string = cells[idx + 9].string
+                        status_string = cells[idx + 9]
                         if status_string == "Completed":
                             data["status"] = Status("COMPLETED")
                         elif status_string == "Postponed":
@@ -122,13 +130,13 @@ class HtmlParserLumen1(Html):
 
                     # The table can include "Circuit ID" or "Alt Circuit ID" as columns +1 and +2.
                     # Use the Circuit ID if available, else the Alt Circuit ID if available
-                    circuit_id = cells[idx + 1].string
+                    circuit_id = cells[idx + 1]
                     if circuit_id in ("_", "N/A"):
-                        circuit_id = cells[idx + 2].string
+                        circuit_id = cells[idx + 2]
                     if circuit_id not in ("_", "N/A"):
                         data_circuit["circuit_id"] = circuit_id
 
-                    impact = cells[idx + 6].string
+                    impact = cells[idx + 6]
                     if "outage" in impact.lower():
                         data_circuit["impact"] = Impact("OUTAGE")
                         circuits.append(CircuitImpact(**data_circuit))
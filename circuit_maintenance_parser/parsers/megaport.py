@@ -1,16 +1,19 @@
 """Megaport parser."""
 import logging
-import re
 from typing import Dict
 
-from dateutil import parser
 from bs4.element import ResultSet  # type: ignore
 
 from circuit_maintenance_parser.parser import Html, Impact, CircuitImpact, Status
+from circuit_maintenance_parser.utils import register_regex
 
 
 logger = logging.getLogger(__name__)
 
+HI_RE = register_regex("Hi (.*)")
+START_RE = register_regex("Start Date and Time: (.*) UTC")
+END_RE = register_regex("End Date and Time: (.*) UTC")
+
 # pylint: disable=too-many-branches
 
 
@@ -38,20 +41,20 @@ class HtmlParserMegaport1(Html):
                     data["maintenance_id"] = p_elem.find("b").string
                     data["status"] = Status("CONFIRMED")
                 elif p_text.startswith("Hi "):
-                    re_search = re.search("Hi (.*)", p_text)
+                    re_search = HI_RE.search(p_text)
                     if re_search is not None:
                         data["account"] = re_search.group(1)
                 elif p_text.startswith("Purpose of Maintenance:"):
                     data["summary"] = p_text.split("Purpose of Maintenance: ")[-1]
                 elif p_text.startswith("Start Date and Time:"):
-                    re_search = re.search("Start Date and Time: (.*) UTC", p_text)
+                    re_search = START_RE.search(p_text)
                     if re_search:
-                        start = parser.parse(re_search.group(1))
+                        start = self.parse_date(re_search.group(1), "start")
                         data["start"] = self.dt2ts(start)
                 elif p_text.startswith("End Date and Time:"):
-                    re_search = re.search("End Date and Time: (.*) UTC", p_text)
+                    re_search = END_RE.search(p_text)
                     if re_search:
-                        end = parser.parse(re_search.group(1))
+                        end = self.parse_date(re_search.group(1), "end")
                         data["end"] = self.dt2ts(end)
 
             circuit_table = tr_elem.find("table")
@@ -1,7 +1,7 @@
 """Momentum parser."""
 import logging
 
-from dateutil import parser
+from pydantic import PrivateAttr
 
 from circuit_maintenance_parser.errors import ParserError
 from circuit_maintenance_parser.parser import EmailSubjectParser, Html, Impact, CircuitImpact, Status
@@ -54,6 +54,8 @@ class HtmlParserMomentum1(Html):
     </div>
     """
 
+    _parse_only_tags = PrivateAttr(("p",))
+
     def parse_html(self, soup):
         """Execute parsing."""
         data = {}
@@ -72,8 +74,8 @@ class HtmlParserMomentum1(Html):
                     for circuit_id in line.split(": ")[1].split(", "):
                         data["circuits"].append(CircuitImpact(impact=Impact("OUTAGE"), circuit_id=circuit_id))
                 elif "Maintenance start date/time" in line:
-                    data["start"] = self.dt2ts(parser.parse(line.split("time:")[1]))
+                    data["start"] = self.dt2ts(self.parse_date(line.split("time:")[1], "start"))
                 elif "Maintenance finish date/time" in line:
-                    data["end"] = self.dt2ts(parser.parse(line.split("time:")[1]))
+                    data["end"] = self.dt2ts(self.parse_date(line.split("time:")[1], "end"))
                 elif "Reason for Maintenance" in line:
                     data["summary"] = line.split(":")[1].strip()
@@ -1,16 +1,21 @@
 """Netflix parser."""
 import hashlib
 import logging
-import re
-
-from dateutil import parser
 
 from circuit_maintenance_parser.parser import CircuitImpact, Impact, Status, Text
+from circuit_maintenance_parser.utils import register_regex
 
 # pylint: disable=too-many-nested-blocks, too-many-branches
 
 logger = logging.getLogger(__name__)
 
+ASN_RE = register_regex(r" \((AS[0-9]+)\),$")
+DATETIME_RE = register_regex(r" ([0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2})\+00:00 UTC")
+MINUTES_RE = register_regex(r" ([0-9]+) minutes")
+HOURS_RE = register_regex(r" ([0-9]+) hours")
+IPV4_RE = register_regex(r"^[.0-9]+$")
+IPV6_RE = register_regex(r"^[0-9a-f:]+$")
+
 
 class TextParserNetflix1(Text):
     """Parse text body of Netflix AS2906 (not 40027) email."""
@@ -47,24 +52,24 @@ class TextParserNetflix1(Text):
         maintenance_id = ""
 
         for line in text.splitlines():
-            search = re.search(r" \((AS[0-9]+)\),$", line)
+            search = ASN_RE.search(line)
             if search:
                 data["account"] = search.group(1)
             if " maintenance in " in line:
                 data["summary"] = line.lstrip()
-                search = re.search(r" ([0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2})\+00:00 UTC", line)
+                search = DATETIME_RE.search(line)
                 if search:
-                    data["start"] = self.dt2ts(parser.parse(search.group(1)))
-            search = re.search(r" ([0-9]+) minutes", line)
+                    data["start"] = self.dt2ts(self.parse_date(search.group(1), "start"))
+            search = MINUTES_RE.search(line)
             if search:
                 minutes = int(search.group(1))
-            search = re.search(r" ([0-9]+) hours", line)
+            search = HOURS_RE.search(line)
             if search:
                 hours = int(search.group(1))
-            if re.search(r"^[.0-9]+$", line.lstrip()):
+            if IPV4_RE.search(line.lstrip()):
                 data["circuits"].append(CircuitImpact(circuit_id=line.lstrip(), impact=impact))
                 maintenance_id += line + "/"
-            if re.search(r"^[0-9a-f:]+$", line.lstrip()):
+            if IPV6_RE.search(line.lstrip()):
                 data["circuits"].append(CircuitImpact(circuit_id=line.lstrip(), impact=impact))
                 maintenance_id += line + "/"
 
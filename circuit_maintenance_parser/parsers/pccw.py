@@ -6,6 +6,10 @@ from datetime import datetime
 from bs4.element import ResultSet  # type: ignore
 from circuit_maintenance_parser.output import Status
 from circuit_maintenance_parser.parser import Html, EmailSubjectParser
+from circuit_maintenance_parser.utils import register_regex
+
+CUSTOMER_NAME_RE = register_regex("Customer Name :", re.IGNORECASE)
+DATE_TIME_RE = register_regex("Date Time :", re.IGNORECASE)
 
 
 class HtmlParserPCCW(Html):
@@ -36,12 +40,12 @@ class HtmlParserPCCW(Html):
 
     def _extract_account(self, soup: ResultSet) -> str:
         """Extract customer account from soup."""
-        customer_field = soup.find(string=re.compile("Customer Name :", re.IGNORECASE))
+        customer_field = soup.find(string=CUSTOMER_NAME_RE.compiled)
         return customer_field.split(":")[1].strip()
 
     def _extract_maintenance_window(self, soup: ResultSet) -> Tuple[datetime, datetime]:
         """Extract start and end times from maintenance window."""
-        datetime_field = soup.find(string=re.compile("Date Time :", re.IGNORECASE))
+        datetime_field = soup.find(string=DATE_TIME_RE.compiled)
         time_parts = (
             datetime_field.lower().replace("date time :", "-").replace("to", "-").replace("gmt", "-").split("-")
         )
@@ -1,16 +1,18 @@
 """Seaborn parser."""
 import logging
-import re
 
-from dateutil import parser
 
 from circuit_maintenance_parser.parser import CircuitImpact, Html, Impact, Status, EmailSubjectParser
+from circuit_maintenance_parser.utils import register_regex
 
 # pylint: disable=too-many-branches
 
 
 logger = logging.getLogger(__name__)
 
+SUBJECT_1_RE = register_regex(r".+\[([^#]+)\].([0-9]+).+")
+SUBJECT_2_RE = register_regex(r".+\[## ([0-9]+) ##\].+")
+
 
 class SubjectParserSeaborn1(EmailSubjectParser):
     """Parser for Seaborn subject string, email type 1.
@@ -22,7 +24,7 @@ class SubjectParserSeaborn1(EmailSubjectParser):
     def parse_subject(self, subject):
         """Parse subject of email file."""
         data = {}
-        search = re.search(r".+\[([^#]+)\].([0-9]+).+", subject)
+        search = SUBJECT_1_RE.search(subject)
         if search:
             data["account"] = search.group(1)
             data["maintenance_id"] = search.group(2)
@@ -39,7 +41,7 @@ class SubjectParserSeaborn2(EmailSubjectParser):
     def parse_subject(self, subject):
         """Parse subject of email file."""
         data = {}
-        search = re.search(r".+\[## ([0-9]+) ##\].+", subject)
+        search = SUBJECT_2_RE.search(subject)
         if search:
             data["account"] = search.group(1)
         return [data]
@@ -73,8 +75,8 @@ class HtmlParserSeaborn1(Html):
             elif "SCHEDULE" in element.text:
                 schedule = p_elements[index + 1].text
                 start, end = schedule.split(" - ")
-                data["start"] = self.dt2ts(parser.parse(start))
-                data["end"] = self.dt2ts(parser.parse(end))
+                data["start"] = self.dt2ts(self.parse_date(start, "start"))
+                data["end"] = self.dt2ts(self.parse_date(end, "end"))
                 data["status"] = Status("CONFIRMED")
             elif "AFFECTED CIRCUIT" in element.text:
                 circuit_id = element.text.split(": ")[1]
@@ -114,10 +116,10 @@ class HtmlParserSeaborn2(Html):
                 data["maintenance_id"] = element.text.split(":")[1]
             elif "Start date" in element.text:
                 start = element.text.split(": ")[1]
-                data["start"] = self.dt2ts(parser.parse(start))
+                data["start"] = self.dt2ts(self.parse_date(start, "start"))
             elif "Finish date" in element.text:
                 end = element.text.split(": ")[1]
-                data["end"] = self.dt2ts(parser.parse(end))
+                data["end"] = self.dt2ts(self.parse_date(end, "end"))
             elif "Circuit impacted" in element.text:
                 circuit_id = self.remove_hex_characters(element.text).split(":")[1]
                 data["circuits"].append(CircuitImpact(impact=Impact("OUTAGE"), circuit_id=circuit_id))
@@ -1,6 +1,5 @@
 """Sparkle parser."""
 import logging
-from dateutil import parser
 
 from circuit_maintenance_parser.errors import ParserError
 from circuit_maintenance_parser.parser import CircuitImpact, Html, Impact, Status
@@ -71,12 +70,12 @@ class HtmlParserSparkle1(Html):
                         ticket["maintenance_id"] = ticket_id
                         if "start date/time" in tr_elements[idx + 1].text.lower():
                             start = self.clean_string(tr_elements[idx + 1].find_all("td")[1].text)
-                            ticket["start"] = self.dt2ts(parser.parse(start))
+                            ticket["start"] = self.dt2ts(self.parse_date(start, "start"))
                         else:
                             raise ParserError("Unable to find start time for ticket " + ticket_id)
                         if "end date/time" in tr_elements[idx + 2].text.lower():
                             end = self.clean_string(tr_elements[idx + 2].find_all("td")[1].text)
-                            ticket["end"] = self.dt2ts(parser.parse(end))
+                            ticket["end"] = self.dt2ts(self.parse_date(end, "end"))
                         else:
                             raise ParserError("Unable to find end time for ticket " + ticket_id)
                         idx += 2
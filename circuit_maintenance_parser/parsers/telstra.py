@@ -1,11 +1,10 @@
 """Telstra parser."""
 import logging
 from typing import Dict, List
-import re
-from dateutil import parser
 from bs4.element import ResultSet  # type: ignore
 
 from circuit_maintenance_parser.parser import Html, Impact, CircuitImpact, Status
+from circuit_maintenance_parser.utils import register_regex
 
 
 # pylint: disable=too-many-branches
@@ -13,6 +12,9 @@ from circuit_maintenance_parser.parser import Html, Impact, CircuitImpact, Statu
 
 logger = logging.getLogger(__name__)
 
+DATETIME_RE = register_regex(r"\d{2}\s[a-zA-Z]{3}\s\d{4}\s\d{2}[:]\d{2}[:]\d{2}")
+ATTENTION_RE = register_regex("[^attention ].*")
+
 
 class HtmlParserTelstra1(Html):
     """Notifications Parser for Telstra notifications."""
@@ -53,9 +55,9 @@ class HtmlParserTelstra1(Html):
                     data["maintenance_id"] = th_sibling.string
                 elif th_text == "Maintenance Window:":
                     text_dates = th_sibling.string.split("(UTC) to ")
-                    start = parser.parse(text_dates[0])
+                    start = self.parse_date(text_dates[0], "start")
                     data["start"] = self.dt2ts(start)
-                    end = parser.parse(text_dates[1].strip("(UTC)"))
+                    end = self.parse_date(text_dates[1].strip("(UTC)"), "end")
                     data["end"] = self.dt2ts(end)
                 elif th_text == "Service(s) Impacted:":
                     data["circuits"] = []
@@ -96,17 +98,17 @@ class HtmlParserTelstra2(Html):
                 data["maintenance_id"] = strong_sibling.string.strip()
             elif strong_text == "Start time":
                 text_start = strong_sibling.string
-                regex = re.search(r"\d{2}\s[a-zA-Z]{3}\s\d{4}\s\d{2}[:]\d{2}[:]\d{2}", text_start)
+                regex = DATETIME_RE.search(text_start)
                 if regex is not None:
-                    start = parser.parse(regex.group())
+                    start = self.parse_date(regex.group(), "start")
                     data["start"] = self.dt2ts(start)
                 else:
                     data["start"] = "Not defined"
             elif strong_text == "End time":
                 text_end = strong_sibling.string
-                regex = re.search(r"\d{2}\s[a-zA-Z]{3}\s\d{4}\s\d{2}[:]\d{2}[:]\d{2}", text_end)
+                regex = DATETIME_RE.search(text_end)
                 if regex is not None:
-                    end = parser.parse(regex.group())
+                    end = self.parse_date(regex.group(), "end")
                     data["end"] = self.dt2ts(end)
                 else:
                     data["end"] = "is not defined"
@@ -134,7 +136,7 @@ class HtmlParserTelstra2(Html):
                 # TODO: We should find a more consistent way to parse the status of a maintenance note
                 p_text = p_element.text.lower()
                 if "attention" in p_text:
-                    regex = re.search("[^attention ].*", p_text.strip())
+                    regex = ATTENTION_RE.search(p_text.strip())
                     if regex is not None:
                         data["account"] = regex.group()
                     else:
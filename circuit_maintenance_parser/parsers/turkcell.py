@@ -1,17 +1,18 @@
 """Turkcell parser."""
 import logging
-import re
 from typing import Dict
 
 from bs4.element import ResultSet  # type: ignore
-from dateutil import parser
 
 from circuit_maintenance_parser.parser import Html, Impact, CircuitImpact, Status
+from circuit_maintenance_parser.utils import register_regex
 
 # pylint: disable=too-many-nested-blocks, too-many-branches
 
 logger = logging.getLogger(__name__)
 
+CIRCUIT_ROW_RE = register_regex(r".+[ \t]([0-1]+\|.+\|.+\|.+)")
+
 
 class HtmlParserTurkcell1(Html):
     """Notifications Parser for Turkcell notifications."""
@@ -98,9 +99,9 @@ class HtmlParserTurkcell1(Html):
             if "Maintenance Number" in td_element.text.strip():
                 data["maintenance_id"] = td_elements[idx + 1].text.strip()
             elif "Start" in td_element.text.strip():
-                data["start"] = self.dt2ts(parser.parse(td_elements[idx + 1].text.strip()))
+                data["start"] = self.dt2ts(self.parse_date(td_elements[idx + 1].text.strip(), "start"))
             elif "End" in td_element.text.strip():
-                data["end"] = self.dt2ts(parser.parse(td_elements[idx + 1].text.strip()))
+                data["end"] = self.dt2ts(self.parse_date(td_elements[idx + 1].text.strip(), "end"))
             elif "Impact of the maintenance" in td_element.text.strip():
                 data["summary"] = td_elements[idx + 1].span.text.strip()
                 if len(tables) == 1:
@@ -109,7 +110,7 @@ class HtmlParserTurkcell1(Html):
                     for element in p_elements:
                         # Example match:
                         #   Eth-Trunk1.1               up      up       111111111111111|01-CUSTOMER|LOCATION|LINK
-                        groups = re.search(r".+[ \t]([0-1]+\|.+\|.+\|.+)", element.text.strip())
+                        groups = CIRCUIT_ROW_RE.search(element.text.strip())
                         if groups:
                             details = groups.group(1).split("|")
                             data["circuits"].append(CircuitImpact(impact=Impact("OUTAGE"), circuit_id=details[0]))
@@ -1,43 +1,54 @@
 """Verizon parser."""
 import logging
-import re
-from typing import Dict
-from dateutil import parser
-from bs4.element import ResultSet  # type: ignore
+from typing import Dict, List
+from lxml import etree  # type: ignore
+from lxml.html import HtmlElement  # type: ignore
+
+from pydantic import PrivateAttr
 
 from circuit_maintenance_parser.parser import Html, Impact, CircuitImpact, Status
+from circuit_maintenance_parser.utils import register_regex
 
 logger = logging.getLogger(__name__)
 
 # pylint: disable=too-many-branches
 
+TABLES_XPATH = etree.XPath("//table")
+MAINTENANCE_ROWS_XPATH = etree.XPath("(.//tbody)[1]//tr")
+ROWS_XPATH = etree.XPath(".//tr")
+CELLS_XPATH = etree.XPath(".//td")
+P_XPATH = etree.XPath(".//p")
+DEAR_RE = register_regex(r"Dear (.*),")
+
 
 class HtmlParserVerizon1(Html):
     """Notifications Parser for Verizon notifications."""
 
+    _html_backend = PrivateAttr("lxml")
+
     def parse_html(self, soup):
         """Execute parsing."""
         data = {}
         logger.debug("Parsing Verizon HTML notification.")
-        self.parse_tables(soup.find_all("table"), data)
-        self.parse_p(soup.find_all("p"), data)
+        self.parse_tables(TABLES_XPATH(soup), data)
+        self.parse_p(P_XPATH(soup), data)
         return [data]
 
-    def parse_tables(self, tables: ResultSet, data: Dict):  # pylint: disable=too-many-locals
+    def parse_tables(self, tables: List[HtmlElement], data: Dict):  # pylint: disable=too-many-locals
         """Parse <table> tag."""
         maintenance_table = tables[0]
         circuit_table = tables[1]
         circuits = []
 
         data["status"] = Status("CONFIRMED")
-        for row in maintenance_table.find("tbody").find_all("tr"):
-            cells = row.find_all("td")
+        for row in MAINTENANCE_ROWS_XPATH(maintenance_table):
+            cells = CELLS_XPATH(row)
             cells_text = []
             for cell in cells:
-                p_tags = cell.find_all("p")
+                p_tags = P_XPATH(cell)
                 cell_text = ""
                 for p_tag in p_tags:
-                    cell_text += p_tag.text.strip()
+                    cell_text += p_tag.text_content().strip()
                 cells_text.append(cell_text)
             if not cells_text:
                 continue
@@ -52,14 +63,14 @@ class HtmlParserVerizon1(Html):
                     data["status"] = Status("RE-SCHEDULED")
             elif cells_text[0].startswith("Maintenance Date/Time (GMT):"):
                 maintenance_time = cells_text[1].split("-")
-                start = parser.parse(maintenance_time[0].strip())
-                end = parser.parse(maintenance_time[1].strip())
+                start = self.parse_date(maintenance_time[0].strip(), "start")
+                end = self.parse_date(maintenance_time[1].strip(), "end")
                 data["start"] = self.dt2ts(start)
                 data["end"] = self.dt2ts(end)
 
-        for row in circuit_table.find_all("tr"):
-            cells = row.find_all("td")
-            cells_text = [cell.string.strip() for cell in cells if cell.string]
+        for row in ROWS_XPATH(circuit_table):
+            cells_string = [self.get_lxml_string(cell) for cell in CELLS_XPATH(row)]
+            cells_text = [cell_string.strip() for cell_string in cells_string if cell_string]
             if not cells_text or cells_text[0].startswith("Company Name"):
                 continue
             circuit_id = cells_text[1]
@@ -67,11 +78,11 @@ class HtmlParserVerizon1(Html):
         data["circuits"] = circuits
 
     @staticmethod
-    def parse_p(p_tags: ResultSet, data: Dict):
+    def parse_p(p_tags: List[HtmlElement], data: Dict):
         """Parse <p> tag."""
         for p_tag in p_tags:
-            p_text = p_tag.text.strip()
-            match = re.match(r"Dear (.*),", p_text)
+            p_text = p_tag.text_content().strip()
+            match = DEAR_RE.match(p_text)
             if match:
                 data["account"] = match.group(1)
                 break
@@ -1,21 +1,26 @@
 """Zayo parser."""
 import logging
-import re
 from copy import deepcopy
-from typing import Dict
+from typing import Dict, List
 
-import bs4  # type: ignore
-from bs4.element import ResultSet  # type: ignore
-
-from dateutil import parser
+from lxml import etree  # type: ignore
+from lxml.html import HtmlElement  # type: ignore
+from pydantic import PrivateAttr
 
 from circuit_maintenance_parser.parser import CircuitImpact, EmailSubjectParser, Html, Impact, Status
+from circuit_maintenance_parser.utils import register_regex
 
 # pylint: disable=too-many-nested-blocks,no-member, too-many-branches
 
 
 logger = logging.getLogger(__name__)
 
+B_XPATH = etree.XPath("//b")
+TABLES_XPATH = etree.XPath("//table")
+HEADERS_XPATH = etree.XPath(".//th")
+CELLS_XPATH = etree.XPath(".//td")
+SUBJECT_SEPARATOR_RE = register_regex(r"\*+")
+
 
 class SubjectParserZayo1(EmailSubjectParser):
     """Parser for Zayo subject string, email type 1.
@@ -33,7 +38,7 @@ class SubjectParserZayo1(EmailSubjectParser):
     def parse_subject(self, subject):
         """Parse subject of email message."""
         data = {}
-        tokens = re.split(r"\*+", subject)
+        tokens = SUBJECT_SEPARATOR_RE.split(subject)
         if len(tokens) == 4:
             data["account"] = tokens[1]
         data["maintenance_id"] = tokens[-2].split(" ")[1]
@@ -43,18 +48,20 @@ class SubjectParserZayo1(EmailSubjectParser):
 class HtmlParserZayo1(Html):
     """Notifications Parser for Zayo notifications."""
 
+    _html_backend = PrivateAttr("lxml")
+
     def parse_html(self, soup):
         """Execute parsing."""
         maintenances = []
         data = {}
-        self.parse_bs(soup.find_all("b"), data)
-        self.parse_tables(soup.find_all("table"), data)
+        self.parse_bs(B_XPATH(soup), data)
+        self.parse_tables(TABLES_XPATH(soup), data)
 
         if not data:
             return [{}]
 
         if "status" not in data:
-            text = soup.get_text()
+            text = soup.text_content()
             if "will be commencing momentarily" in text:
                 data["status"] = Status("IN-PROCESS")
             elif "has been completed" in text or "has closed" in text:
@@ -70,53 +77,57 @@ class HtmlParserZayo1(Html):
 
         return maintenances
 
-    def parse_bs(self, btags: ResultSet, data: dict):
+    def parse_bs(self, btags: List[HtmlElement], data: dict):
         """Parse B tag."""
         for line in btags:
-            if isinstance(line, bs4.element.Tag):
-                if line.text.lower().strip().startswith("maintenance ticket #:"):
-                    data["maintenance_id"] = self.clean_line(line.next_sibling)
-                elif "serves as official notification" in line.text.lower():
-                    if "will be performing maintenance" in line.text.lower():
-                        data["status"] = Status("CONFIRMED")
-                    elif "has cancelled" in line.text.lower():
-                        data["status"] = Status("CANCELLED")
-                elif "activity date" in line.text.lower():
-                    logger.info("Found 'activity date': %s", line.text)
-
-                    if "windows" not in data:
-                        data["windows"] = []
-
-                    for sibling in line.next_siblings:
-                        text = sibling.text if isinstance(sibling, bs4.element.Tag) else sibling
-                        logger.debug("Checking for GMT date/timestamp in sibling: %s", text)
-
-                        if "( GMT )" in text:
-                            window = self.clean_line(sibling).strip("( GMT )").split(" to ")
-                            start = parser.parse(window.pop(0))
-                            end = parser.parse(window.pop(0))
-                            start_ts = self.dt2ts(start)
-                            end_ts = self.dt2ts(end)
-                            data["windows"].append((start_ts, end_ts))
-                            break
-                elif line.text.lower().strip().startswith("reason for maintenance:"):
-                    data["summary"] = self.clean_line(line.next_sibling)
-                elif line.text.lower().strip().startswith("date notice sent:"):
-                    stamp = parser.parse(self.clean_line(line.next_sibling))
-                    data["stamp"] = self.dt2ts(stamp)
-                elif line.text.lower().strip().startswith("customer:"):
-                    data["account"] = self.clean_line(line.next_sibling)
-
-    def parse_tables(self, tables: ResultSet, data: Dict):
+            line_text = line.text_content()
+            if line_text.lower().strip().startswith("maintenance ticket #:"):
+                data["maintenance_id"] = self.get_next_sibling_text(line)
+            elif "serves as official notification" in line_text.lower():
+                if "will be performing maintenance" in line_text.lower():
+                    data["status"] = Status("CONFIRMED")
+                elif "has cancelled" in line_text.lower():
+                    data["status"] = Status("CANCELLED")
+            elif "activity date" in line_text.lower():
+                logger.info("Found 'activity date': %s", line_text)
+
+                if "windows" not in data:
+                    data["windows"] = []
+
+                for sibling in self.iter_lxml_next_siblings(line):
+                    text = self.get_lxml_text(sibling)
+                    logger.debug("Checking for GMT date/timestamp in sibling: %s", text)
+
+                    if "( GMT )" in text:
+                        window = text.strip().strip("( GMT )").split(" to ")
+                        start = self.parse_date(window.pop(0), "start")
+                        end = self.parse_date(window.pop(0), "end")
+                        start_ts = self.dt2ts(start)
+                        end_ts = self.dt2ts(end)
+                        data["windows"].append((start_ts, end_ts))
+                        break
+            elif line_text.lower().strip().startswith("reason for maintenance:"):
+                data["summary"] = self.get_next_sibling_text(line)
+            elif line_text.lower().strip().startswith("date notice sent:"):
+                stamp = self.parse_date(self.get_next_sibling_text(line), "stamp")
+                data["stamp"] = self.dt2ts(stamp)
+            elif line_text.lower().strip().startswith("customer:"):
+                data["account"] = self.get_next_sibling_text(line)
+
+    def get_next_sibling_text(self, line: HtmlElement) -> str:
+        """Return the stripped text of the next sibling element or string of a tag."""
+        return self.get_lxml_text(next(self.iter_lxml_next_siblings(line))).strip()
+
+    def parse_tables(self, tables: List[HtmlElement], data: Dict):
         """Parse Table tag."""
         circuits = []
         for table in tables:
-            head_row = table.find_all("th")
+            head_row = HEADERS_XPATH(table)
             if len(head_row) < 5:
                 logger.warning("Less table headers than expected: %s", head_row)
                 continue
 
-            table_headers = [self.clean_line(line) for line in head_row[:5]]
+            table_headers = [line.text_content().strip() for line in head_row[:5]]
             expected_headers_ref = (
                 [
                     "Circuit Id",
@@ -145,15 +156,15 @@ class HtmlParserZayo1(Html):
                 logger.warning("Table headers are not as expected: %s", head_row)
                 continue
 
-            data_rows = table.find_all("td")
+            data_rows = CELLS_XPATH(table)
             if len(data_rows) % 5 != 0:
                 raise AssertionError("Table format is not correct")
 
             number_of_circuits = int(len(data_rows) / 5)
             for idx in range(number_of_circuits):
                 data_circuit = {}
-                data_circuit["circuit_id"] = self.clean_line(data_rows[0 + 5 * idx])
-                impact = self.clean_line(data_rows[1 + 5 * idx])
+                data_circuit["circuit_id"] = data_rows[0 + 5 * idx].text_content().strip()
+                impact = data_rows[1 + 5 * idx].text_content().strip()
                 if "hard down" in impact.lower():
                     data_circuit["impact"] = Impact("OUTAGE")
                 elif "no expected impact" in impact.lower():
@@ -1,14 +1,14 @@
 """Definition of Processor class."""
 import logging
 import traceback
-import itertools
+from functools import lru_cache
 
-from typing import Iterable, Type, Dict, List
+from typing import AbstractSet, FrozenSet, Iterable, Type, Dict, List, Tuple, Union
 
 from pydantic import BaseModel, ValidationError
 
 from circuit_maintenance_parser.output import Maintenance, Metadata
-from circuit_maintenance_parser.data import NotificationData
+from circuit_maintenance_parser.data import DataPart, NotificationData, normalize_data_type
 from circuit_maintenance_parser.parser import Parser, LLM
 from circuit_maintenance_parser.errors import ParserError, ProcessorError
 
@@ -16,6 +16,18 @@ from circuit_maintenance_parser.errors import ParserError, ProcessorError
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def get_normalized_data_types(data_parser: Type[Parser]) -> Tuple[str, ...]:
+    """Return the normalized data types supported by a Parser class, computed once per class."""
+    return tuple(normalize_data_type(data_type) for data_type in data_parser.get_data_types())
+
+
+@lru_cache(maxsize=None)
+def get_supported_data_types(data_parsers: Tuple[Type[Parser], ...]) -> FrozenSet[str]:
+    """Return the normalized data types supported by any of the Parser classes, computed once per combination."""
+    return frozenset(data_type for data_parser in data_parsers for data_type in get_normalized_data_types(data_parser))
+
+
 class GenericProcessor(BaseModel, extra="forbid"):
     """Base class for the Processors.
 
@@ -53,27 +65,16 @@ class GenericProcessor(BaseModel, extra="forbid"):
         self.extended_data = extended_data
         maintenances_data: List = []
 
-        # First, we generate a dictionary with the key `Parser` and `DataPart` if the data type from the first is
-        # supported by the second. This avoids reusing the same Parser for different data types if supported.
-        data_part_and_parser_combinations = {
-            data_parser: data_part
-            for (data_part, data_parser) in itertools.product(data.data_parts, self.data_parsers)
-            if data_part.type in data_parser.get_data_types()
-        }
+        data_part_and_parser_combinations = self.get_data_part_and_parser_combinations(data)
 
         if not data_part_and_parser_combinations:
-            error_message = (
-                f"None of the supported parsers for processor {self.__class__.__name__} ("
-                f"{', '.join([data_parser.__name__ for data_parser in self.data_parsers])}) was matching any of the "
-                f"provided data types ({', '.join([data_part.type for data_part in data.data_parts])})."
-            )
-
-            logger.debug(error_message)
-            raise ProcessorError(error_message)
+            unsupported_data_error = self.get_unsupported_data_error(data)
+            logger.debug(unsupported_data_error)
+            raise unsupported_data_error
 
         for data_parser, data_part in data_part_and_parser_combinations.items():
             try:
-                self.process_hook(data_parser().parse(data_part.content, data_part.type), maintenances_data)
+                self.process_hook(self.parse_data_part(data_parser, data_part), maintenances_data)
 
             except (ParserError, ValidationError) as exc:
                 error_message = "Parser class %s from %s was not successful.\n%s"
@@ -84,6 +85,67 @@ class GenericProcessor(BaseModel, extra="forbid"):
 
         return maintenances_data
 
+    @staticmethod
+    def parse_data_part(data_parser: Type[Parser], data_part: DataPart) -> List[Dict]:
+        """Return the data parsed from a DataPart by a Parser, parsing it only once while its memoization is enabled.
+
+        The Processors of a Provider often share some Parsers, so the Processors tried after a failed one reuse the
+        results, or the errors, of the Parsers already run. Each call gets its own copy of the parsed dictionaries, as
+        the Processors add keys to them.
+        """
+
+        def parse() -> Union[List[Dict], ParserError, ValidationError]:
+            try:
+                return data_parser().parse_data_part(data_part)
+            except (ParserError, ValidationError) as exc:
+                return exc
+
+        parsed_data = data_part.memoize((GenericProcessor.parse_data_part, data_parser), parse)
+        if isinstance(parsed_data, (ParserError, ValidationError)):
+            # The traceback of the first failure has been already logged, and it would grow with every raise
+            raise parsed_data.with_traceback(None)
+        return [dict(maintenance_data) for maintenance_data in parsed_data]
+
+    def get_data_part_and_parser_combinations(self, data: NotificationData) -> Dict[Type[Parser], DataPart]:
+        """Return a dictionary with the key `Parser` and the `DataPart` whose data type is supported by it.
+
+        This avoids reusing the same Parser for different data types if supported: when multiple data parts match a
+        Parser, the last one is used. The Parsers are ordered by the position of the first data part they match.
+        The data parts are looked up in the data types index of the `NotificationData`, one lookup per data type of
+        each Parser.
+        """
+        data_types_index = data.get_data_types_index()
+        parser_matches = []
+        for parser_position, data_parser in enumerate(self.data_parsers):
+            data_part_positions = [
+                data_part_position
+                for data_type in get_normalized_data_types(data_parser)
+                for data_part_position in data_types_index.get(data_type, [])
+            ]
+            if data_part_positions:
+                parser_matches.append(
+                    (min(data_part_positions), parser_position, data_parser, data.data_parts[max(data_part_positions)])
+                )
+
+        parser_matches.sort(key=lambda parser_match: parser_match[:2])
+        return {data_parser: data_part for _, _, data_parser, data_part in parser_matches}
+
+    def supports_data_types(self, data_types: AbstractSet[str]) -> bool:
+        """Return whether any of the `data_parsers` supports any of the normalized data types.
+
+        A `Processor` that doesn't support any data type of a notification can't process it, so it can be skipped
+        without trying it.
+        """
+        return not get_supported_data_types(tuple(self.data_parsers)).isdisjoint(data_types)
+
+    def get_unsupported_data_error(self, data: NotificationData) -> ProcessorError:
+        """Return the error for a notification without any data type supported by the `data_parsers`."""
+        return ProcessorError(
+            f"None of the supported parsers for processor {self.__class__.__name__} ("
+            f"{', '.join([data_parser.__name__ for data_parser in self.data_parsers])}) was matching any of the "
+            f"provided data types ({', '.join([data_part.type for data_part in data.data_parts])})."
+        )
+
     def process_hook(self, maintenances_extracted_data: List, maintenances_data: List):
         """Custom method per processor to accumulate the data from each DataPart."""
         raise NotImplementedError
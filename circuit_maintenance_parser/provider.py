@@ -1,54 +1,88 @@
 """Definition of Provider class as the entry point to the library."""
 
+import codecs
 import logging
 import os
 import re
 import traceback
-from typing import Dict, Iterable, List
+from collections import Counter, defaultdict
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, AbstractSet, Any, Dict, Iterable, List, Mapping, Optional, Pattern, Tuple, Type, Union
 
-import chardet
 from pydantic import BaseModel, PrivateAttr
 
-from circuit_maintenance_parser.constants import EMAIL_HEADER_SUBJECT
-from circuit_maintenance_parser.data import NotificationData
+from circuit_maintenance_parser.data import DataPart, NotificationData
 from circuit_maintenance_parser.errors import ProcessorError, ProviderError
 from circuit_maintenance_parser.output import Maintenance
 from circuit_maintenance_parser.parser import EmailDateParser, ICal
-from circuit_maintenance_parser.parsers.aquacomms import HtmlParserAquaComms1, SubjectParserAquaComms1
-from circuit_maintenance_parser.parsers.aws import SubjectParserAWS1, TextParserAWS1
-from circuit_maintenance_parser.parsers.bso import HtmlParserBSO1
-from circuit_maintenance_parser.parsers.cogent import HtmlParserCogent1, SubjectParserCogent1, TextParserCogent1
-from circuit_maintenance_parser.parsers.colt import CsvParserColt1, SubjectParserColt1, SubjectParserColt2
-from circuit_maintenance_parser.parsers.crowncastle import HtmlParserCrownCastle1
-from circuit_maintenance_parser.parsers.equinix import HtmlParserEquinix, SubjectParserEquinix
-from circuit_maintenance_parser.parsers.globalcloudxchange import HtmlParserGcx1, SubjectParserGcx1
-from circuit_maintenance_parser.parsers.google import HtmlParserGoogle1
-from circuit_maintenance_parser.parsers.gtt import HtmlParserGTT1
-from circuit_maintenance_parser.parsers.hgc import HtmlParserHGC1, HtmlParserHGC2, SubjectParserHGC1
-from circuit_maintenance_parser.parsers.lumen import HtmlParserLumen1
-from circuit_maintenance_parser.parsers.megaport import HtmlParserMegaport1
-from circuit_maintenance_parser.parsers.momentum import HtmlParserMomentum1, SubjectParserMomentum1
-from circuit_maintenance_parser.parsers.netflix import TextParserNetflix1
-from circuit_maintenance_parser.parsers.openai import OpenAIParser
-from circuit_maintenance_parser.parsers.pccw import HtmlParserPCCW, SubjectParserPCCW
-from circuit_maintenance_parser.parsers.seaborn import (
-    HtmlParserSeaborn1,
-    HtmlParserSeaborn2,
-    SubjectParserSeaborn1,
-    SubjectParserSeaborn2,
-)
-from circuit_maintenance_parser.parsers.sparkle import HtmlParserSparkle1
-from circuit_maintenance_parser.parsers.tata import HtmlParserTata, SubjectParserTata
-from circuit_maintenance_parser.parsers.telstra import HtmlParserTelstra1, HtmlParserTelstra2
-from circuit_maintenance_parser.parsers.turkcell import HtmlParserTurkcell1
-from circuit_maintenance_parser.parsers.verizon import HtmlParserVerizon1
-from circuit_maintenance_parser.parsers.windstream import HtmlParserWindstream1
-from circuit_maintenance_parser.parsers.zayo import HtmlParserZayo1, SubjectParserZayo1
 from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor, SimpleProcessor
+from circuit_maintenance_parser.providers import import_provider_class
 from circuit_maintenance_parser.utils import rgetattr
 
 logger = logging.getLogger(__name__)
 
+# Number of bytes, from the beginning of the content, used to guess the encoding of a DataPart without a known charset
+CHARDET_PREFIX_SIZE = 4096
+
+# Number of DataParts decoded by `GenericProvider.filter_check` using each charset source, "mime" or "chardet"
+charset_detection_stats: Counter = Counter()
+
+# Number of notifications successfully processed by each Processor, by its position in `_processors`, per provider type
+processor_success_stats: Dict[str, Counter] = defaultdict(Counter)
+
+# Filter expressions, compiled, per data type
+CompiledFilters = Dict[str, List[Pattern]]
+
+
+def compile_filters(filters: Mapping[str, Iterable[Union[str, Pattern]]]) -> CompiledFilters:
+    """Compile the filter expressions of each data type, keeping the ones already compiled."""
+    return {
+        data_type: [re.compile(expression) for expression in expressions] for data_type, expressions in filters.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def get_compiled_filters(provider_class: Type["GenericProvider"]) -> Tuple[CompiledFilters, CompiledFilters]:
+    """Return the include and exclude filters of a Provider class, compiled once per class.
+
+    The filters are part of the class definition, so they are frozen on first use and later changes to the
+    `_include_filter` and `_exclude_filter` defaults are not taken into account.
+    """
+    return (
+        compile_filters(provider_class.get_default_include_filters()),
+        compile_filters(provider_class.get_default_exclude_filters()),
+    )
+
+
+class LLMFallbackPolicy(BaseModel):
+    """Policy to fall back to the LLM-powered Parsers when none of the `_processors` of a Provider is successful.
+
+    Attributes:
+        processors: `Processors` using LLM-powered `Parsers`, tried in order only after all the `_processors` of the
+            Provider have failed.
+        max_attempts: Maximum number of `processors` tried per notification, to keep the latency and the cost of the
+            LLM calls bounded. Default: 1.
+    """
+
+    processors: List[GenericProcessor]
+    max_attempts: int = 1
+
+    @classmethod
+    def from_env(cls) -> Optional["LLMFallbackPolicy"]:
+        """Return the policy for the LLM integrations configured in the environment, or None if there is none."""
+        if os.getenv("PARSER_OPENAI_API_KEY"):
+            # pylint: disable-next=import-outside-toplevel
+            from circuit_maintenance_parser.parsers.openai import OpenAIParser
+
+            return cls(processors=[CombinedProcessor(data_parsers=[EmailDateParser, OpenAIParser])])
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_llm_fallback_policy() -> Optional[LLMFallbackPolicy]:
+    """Return the LLM fallback policy of the environment, created once and shared by all the Providers."""
+    return LLMFallbackPolicy.from_env()
+
 
 class GenericProvider(BaseModel):
     """Base class for the Providers.
@@ -61,10 +95,18 @@ class GenericProvider(BaseModel):
             that will be used. Default: `[SimpleProcessor(data_parsers=[ICal])]`.
         _default_organizer (optional): Defines a default `organizer`, an email address, to be used to create a
             `Maintenance` in absence of the information in the original notification.
+        _sender_domain_lookup (optional): If enabled, `lookup_provider_class_from_sender` also matches the senders
+            of the domain of the `_default_organizer`. It must be disabled when that domain is a company-wide mail
+            domain, instead of one dedicated to the notifications. Default: enabled.
         _include_filter (optional): Dictionary that defines matching regex per data type to take a notification into
             account.
         _exclude_filter (optional): Dictionary that defines matching regex per data type to NOT take a notification
             into account.
+        _adaptive_processor_order (optional): If enabled, the `_processors` are tried in order of how many
+            notifications of the provider type each one has processed, instead of in declaration order. Default: enabled
+            if the `PARSER_ADAPTIVE_PROCESSOR_ORDER` environment variable is set.
+        _llm_fallback_policy (optional): `LLMFallbackPolicy` with the LLM-powered `Processors` to try when all the
+            `_processors` fail. Default: the one of the environment, from `get_llm_fallback_policy`.
 
     Notes:
         - If a notification matches both the `_include_filter` and `_exclude_filter`, the exclusion takes precedence and
@@ -77,34 +119,48 @@ class GenericProvider(BaseModel):
 
     _processors: List[GenericProcessor] = PrivateAttr([SimpleProcessor(data_parsers=[ICal])])
     _default_organizer: str = PrivateAttr("unknown")
+    _sender_domain_lookup: bool = PrivateAttr(True)
 
     _include_filter: Dict[str, List[str]] = PrivateAttr({})
     _exclude_filter: Dict[str, List[str]] = PrivateAttr({})
 
+    _adaptive_processor_order: bool = PrivateAttr(
+        default_factory=lambda: bool(os.getenv("PARSER_ADAPTIVE_PROCESSOR_ORDER"))
+    )
+    _llm_fallback_policy: Optional[LLMFallbackPolicy] = PrivateAttr(default_factory=get_llm_fallback_policy)
+
     def include_filter_check(self, data: NotificationData) -> bool:
         """If `_include_filter` is defined, it verifies that the matching criteria is met."""
-        if self.get_default_include_filters():
-            return self.filter_check(self.get_default_include_filters(), data, "include")
+        include_filters, _ = get_compiled_filters(self.__class__)
+        if include_filters:
+            return self._filter_check_compiled(include_filters, data, "include")
         return True
 
     def exclude_filter_check(self, data: NotificationData) -> bool:
         """If `_exclude_filter` is defined, it verifies that the matching criteria is met."""
-        if self.get_default_exclude_filters():
-            return self.filter_check(self.get_default_exclude_filters(), data, "exclude")
+        _, exclude_filters = get_compiled_filters(self.__class__)
+        if exclude_filters:
+            return self._filter_check_compiled(exclude_filters, data, "exclude")
         return False
 
     @staticmethod
     def filter_check(filter_dict: Dict, data: NotificationData, filter_type: str) -> bool:
-        """Generic filter check."""
+        """Generic filter check, with the filter expressions, as strings or compiled, per data type."""
+        return GenericProvider._filter_check_compiled(compile_filters(filter_dict), data, filter_type)
+
+    @staticmethod
+    def _filter_check_compiled(filter_dict: CompiledFilters, data: NotificationData, filter_type: str) -> bool:
+        """Generic filter check, with the filter expressions already compiled per data type."""
         data_part_content = None
         for data_part in data.data_parts:
             filter_data_type = data_part.type
             if filter_data_type not in filter_dict:
                 continue
 
-            data_part_encoding = chardet.detect(data_part.content).get("encoding", "utf-8")
-            data_part_content = data_part.content.decode(data_part_encoding).replace("\r", "").replace("\n", "")
-            if any(re.search(filter_re, data_part_content) for filter_re in filter_dict[filter_data_type]):
+            data_part_content = data_part.memoize(
+                GenericProvider.get_filter_text, partial(GenericProvider.get_filter_text, data_part)
+            )
+            if any(filter_re.search(data_part_content) for filter_re in filter_dict[filter_data_type]):
                 logger.debug("Matching %s filter expression for %s.", filter_type, data_part_content)
                 return True
 
@@ -118,37 +174,119 @@ class GenericProvider(BaseModel):
             )
         return False
 
-    def get_maintenances(self, data: NotificationData) -> Iterable[Maintenance]:
-        """Main entry method that will use the defined `_processors` in order to extract the `Maintenances` from data."""
-        provider_name = self.__class__.__name__
-        error_message = ""
-        related_exceptions = []
+    @staticmethod
+    def get_filter_text(data_part: DataPart) -> str:
+        """Return the decoded content of a DataPart, in a single line, as matched by the filters."""
+        return GenericProvider.get_data_part_text(data_part).replace("\r", "").replace("\n", "")
 
-        if self.exclude_filter_check(data) or not self.include_filter_check(data):
-            logger.debug("Skipping notification %s due filtering policy for %s.", data, self.__class__.__name__)
-            return []
+    @staticmethod
+    def get_data_part_text(data_part: DataPart) -> str:
+        """Decode the content of a DataPart with its charset, guessing it from the first bytes only if unknown.
 
-        if os.getenv("PARSER_OPENAI_API_KEY"):
-            self._processors.append(CombinedProcessor(data_parsers=[EmailDateParser, OpenAIParser]))
+        As the first bytes may be plain ASCII while the rest of the content is not, the content is decoded with the
+        guessed charset only if it's valid for all of it, trying UTF-8 otherwise, and only as a last resort it's
+        decoded replacing the invalid bytes, with the charset guessed from all of it.
 
-        for processor in self._processors:
+        The charset source used is counted in `charset_detection_stats`.
+        """
+        if data_part.charset:
             try:
-                return processor.process(data, self.get_extended_data())
-            except ProcessorError as exc:
+                data_part_text = str(data_part.content, codecs.lookup(data_part.charset).name)
+                charset_detection_stats["mime"] += 1
+                return data_part_text
+            except (LookupError, UnicodeDecodeError):
+                logger.debug(
+                    "DataPart %s content can't be decoded with its charset %s.", data_part.type, data_part.charset
+                )
+
+        import chardet  # pylint: disable=import-outside-toplevel
+
+        data_part_encoding = chardet.detect(bytes(data_part.content[:CHARDET_PREFIX_SIZE])).get("encoding") or "utf-8"
+        charset_detection_stats["chardet"] += 1
+        for encoding in (data_part_encoding, "utf-8"):
+            try:
+                return str(data_part.content, encoding)
+            except (LookupError, UnicodeDecodeError):
+                continue
+
+        data_part_encoding = chardet.detect(bytes(data_part.content)).get("encoding") or "utf-8"
+        return str(data_part.content, data_part_encoding, errors="replace")
+
+    def get_maintenances(self, data: NotificationData) -> Iterable[Maintenance]:
+        """Main entry method that will use the defined `_processors` in order to extract the `Maintenances` from data."""
+        # The values derived from each DataPart, such as its decoded text, are shared by the filters and parsers
+        with data.memoization():
+            provider_name = self.__class__.__name__
+            error_message = ""
+            related_exceptions = []
+
+            if self.exclude_filter_check(data) or not self.include_filter_check(data):
+                logger.debug("Skipping notification %s due filtering policy for %s.", data, self.__class__.__name__)
+                return []
+
+            # The processors without any parser for the data types of the notification are skipped without trying them
+            data_types = data.get_data_types_index().keys()
+            for processor_position, processor in self.get_execution_plan(data_types):
                 process_error_message = (
                     f"- Processor {processor.__class__.__name__} from {provider_name} failed due to: %s\n"
                 )
-                logger.debug(process_error_message, traceback.format_exc())
+                if not processor.supports_data_types(data_types):
+                    unsupported_data_error = processor.get_unsupported_data_error(data)
+                    logger.debug(process_error_message, unsupported_data_error)
+                    error_message += process_error_message % unsupported_data_error
+                    related_exceptions.append(unsupported_data_error)
+                    continue
+
+                try:
+                    maintenances = processor.process(data, self.get_extended_data())
+                except ProcessorError as exc:
+                    logger.debug(process_error_message, traceback.format_exc())
+
+                    related_exc = rgetattr(exc, "__cause__")
+                    error_message += process_error_message % related_exc
+                    related_exceptions.append(exc)
+                    continue
+
+                if processor_position is not None:
+                    processor_success_stats[self.get_provider_type()][processor_position] += 1
+                return maintenances
+
+            raise ProviderError(
+                (f"Failed creating Maintenance notification for {provider_name}.\nDetails:\n{error_message}"),
+                related_exceptions=related_exceptions,
+            )
 
-                related_exc = rgetattr(exc, "__cause__")
-                error_message += process_error_message % related_exc
-                related_exceptions.append(exc)
-                continue
+    def get_execution_plan(self, data_types: AbstractSet[str]) -> List[Tuple[Optional[int], GenericProcessor]]:
+        """Return the processors to try, in order, with their position in `_processors` or None if LLM fallbacks.
 
-        raise ProviderError(
-            (f"Failed creating Maintenance notification for {provider_name}.\nDetails:\n{error_message}"),
-            related_exceptions=related_exceptions,
-        )
+        The processors of the `_llm_fallback_policy` come after all the `_processors`, up to its `max_attempts`
+        processors supporting the data types of the notification.
+        """
+        execution_plan: List[Tuple[Optional[int], GenericProcessor]] = [
+            (processor_position, self._processors[processor_position])
+            for processor_position in self.get_processors_order()
+        ]
+        if self._llm_fallback_policy:
+            llm_attempts = 0
+            for processor in self._llm_fallback_policy.processors:
+                if llm_attempts >= self._llm_fallback_policy.max_attempts:
+                    break
+                if processor.supports_data_types(data_types):
+                    llm_attempts += 1
+                execution_plan.append((None, processor))
+        return execution_plan
+
+    def get_processors_order(self) -> List[int]:
+        """Return the positions of the `_processors` in the order they have to be tried.
+
+        With `_adaptive_processor_order`, the processors that have processed more notifications of the provider type,
+        as counted in `processor_success_stats`, are tried first. Processors with the same count keep their order.
+        """
+        processors_order = list(range(len(self._processors)))
+        if self._adaptive_processor_order:
+            success_counts = processor_success_stats[self.get_provider_type()]
+            processors_order.sort(key=lambda processor_position: -success_counts[processor_position])
+        return processors_order
 
     @classmethod
     def get_default_organizer(cls) -> str:
@@ -159,6 +297,15 @@ class GenericProvider(BaseModel):
             # TODO: This exception handling is required for Pydantic 1.x compatibility. To be removed when the dependency is deprecated.
             return cls()._default_organizer
 
+    @classmethod
+    def get_default_sender_domain_lookup(cls) -> bool:
+        """Expose sender_domain_lookup as class attribute."""
+        try:
+            return cls._sender_domain_lookup.get_default()  # type: ignore
+        except AttributeError:
+            # TODO: This exception handling is required for Pydantic 1.x compatibility. To be removed when the dependency is deprecated.
+            return cls()._sender_domain_lookup
+
     @classmethod
     def get_default_processors(cls) -> List[GenericProcessor]:
         """Expose default_processors as class attribute."""
@@ -200,335 +347,39 @@ class GenericProvider(BaseModel):
         return cls.__name__.lower()
 
 
-####################
-# PROVIDERS        #
-####################
-
-
-class AquaComms(GenericProvider):
-    """AquaComms provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserAquaComms1, SubjectParserAquaComms1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("tickets@aquacomms.com")
-
-
-class Arelion(GenericProvider):
-    """Arelion (formerly Telia Carrier) provider custom class."""
-
-    _exclude_filter = PrivateAttr({EMAIL_HEADER_SUBJECT: ["Disturbance Information"]})
-
-    _default_organizer = PrivateAttr("support@arelion.com")
-
-
-class AWS(GenericProvider):
-    """AWS provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, TextParserAWS1, SubjectParserAWS1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("aws-account-notifications@amazon.com")
-
-
-class BSO(GenericProvider):
-    """BSO provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserBSO1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("network-servicedesk@bso.co")
-
-
-class Cogent(GenericProvider):
-    """Cogent provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserCogent1]),
-            CombinedProcessor(data_parsers=[EmailDateParser, TextParserCogent1, SubjectParserCogent1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("support@cogentco.com")
-
-
-class Colt(GenericProvider):
-    """Cogent provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, CsvParserColt1, SubjectParserColt1]),
-            CombinedProcessor(data_parsers=[EmailDateParser, CsvParserColt1, SubjectParserColt2]),
-        ]
-    )
-    _default_organizer = PrivateAttr("PlannedWorks@colt.net")
-
-
-class CrownCastle(GenericProvider):
-    """Crown Castle Fiber provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserCrownCastle1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("fiberchangemgmt@crowncastle.com")
-
-
-class Equinix(GenericProvider):
-    """Equinix provider custom class."""
-
-    _include_filter = PrivateAttr({EMAIL_HEADER_SUBJECT: ["Network Maintenance"]})
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[HtmlParserEquinix, SubjectParserEquinix, EmailDateParser]),
-        ]
-    )
-    _default_organizer = PrivateAttr("servicedesk@equinix.com")
-
-
-class EUNetworks(GenericProvider):
-    """EUNetworks provider custom class."""
-
-    _default_organizer = "noc@eunetworks.com"
-
-
-class GlobalCloudXchange(GenericProvider):
-    """Global Cloud Xchange provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, SubjectParserGcx1, HtmlParserGcx1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("Gnoc@globalcloudxchange.com")
-
-
-class Google(GenericProvider):
-    """Google provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserGoogle1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("noc-noreply@google.com")
-
-
-class GTT(GenericProvider):
-    """EXA (formerly GTT) provider custom class."""
-
-    # "Planned Work Notification", "Emergency Work Notification"
-    _include_filter = PrivateAttr(
-        {"Icalendar": ["BEGIN"], "ical": ["BEGIN"], EMAIL_HEADER_SUBJECT: ["Work Notification"]}
-    )
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            SimpleProcessor(data_parsers=[ICal]),
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserGTT1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("InfraCo.CM@exainfra.net")
-
-
-class HGC(GenericProvider):
-    """HGC provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserHGC1, SubjectParserHGC1]),
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserHGC2, SubjectParserHGC1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("HGCINOCPW@hgc.com.hk")
-
-
-class Lumen(GenericProvider):
-    """Lumen provider custom class."""
-
-    _include_filter = PrivateAttr({EMAIL_HEADER_SUBJECT: ["Scheduled Maintenance"]})
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserLumen1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("smc@lumen.com")
-
-
-class Megaport(GenericProvider):
-    """Megaport provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserMegaport1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("support@megaport.com")
-
-
-class Momentum(GenericProvider):
-    """Momentum provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserMomentum1, SubjectParserMomentum1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("maintenance@momentumtelecom.com")
-
-
-class Netflix(GenericProvider):
-    """Netflix provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [CombinedProcessor(data_parsers=[EmailDateParser, TextParserNetflix1])]
-    )
-    _default_organizer = PrivateAttr("cdnetops@netflix.com")
-
-
-class NTT(GenericProvider):
-    """NTT provider custom class."""
-
-    _default_organizer = PrivateAttr("noc@us.ntt.net")
-
-
-class PacketFabric(GenericProvider):
-    """PacketFabric provider custom class."""
-
-    _default_organizer = PrivateAttr("support@packetfabric.com")
-
-
-class PCCW(GenericProvider):
-    """PCCW provider custom class."""
-
-    _include_filter = PrivateAttr(
-        {
-            "Icalendar": ["BEGIN"],
-            "ical": ["BEGIN"],
-            EMAIL_HEADER_SUBJECT: [
-                "Completion - Planned Outage Notification",
-                "Completion - Urgent Maintenance Notification",
-            ],
-        }
-    )
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            SimpleProcessor(data_parsers=[ICal]),
-            CombinedProcessor(data_parsers=[HtmlParserPCCW, SubjectParserPCCW, EmailDateParser]),
-        ]
-    )
-    _default_organizer = "mailto:gsoc-planned-event@pccwglobal.com"
-
-
-class Seaborn(GenericProvider):
-    """Seaborn provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserSeaborn1, SubjectParserSeaborn1]),
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserSeaborn2, SubjectParserSeaborn2]),
-        ]
-    )
-    _default_organizer = PrivateAttr("inoc@superonline.net")
-
-
-class Sparkle(GenericProvider):
-    """Sparkle provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[HtmlParserSparkle1, EmailDateParser]),
-        ]
-    )
-    _default_organizer = PrivateAttr("TISAmericaNOC@tisparkle.com")
-
-
-class Tata(GenericProvider):
-    """Tata provider custom class."""
-
-    _include_filter = PrivateAttr({EMAIL_HEADER_SUBJECT: ["Planned Work Notification"]})
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[HtmlParserTata, SubjectParserTata, EmailDateParser]),
-        ]
-    )
-    _default_organizer = PrivateAttr("planned.activity@tatacommunications.com")
-
-
-class Telia(Arelion):
-    """Telia provider custom class."""
-
-    # Kept for compatibility purposes, but Telia is renamed Arelion
-
-
-class Telstra(GenericProvider):
-    """Telstra provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            SimpleProcessor(data_parsers=[ICal]),
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserTelstra2]),
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserTelstra1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("gpen@team.telstra.com")
-
-
-class Turkcell(GenericProvider):
-    """Turkcell provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserTurkcell1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("inoc@superonline.net")
-
-
-class Verizon(GenericProvider):
-    """Verizon provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserVerizon1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("NO-REPLY-sched-maint@EMEA.verizonbusiness.com")
-
-
-class Windstream(GenericProvider):
-    """Windstream provider custom class."""
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserWindstream1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("wci.maintenance.notifications@windstream.com")
-
-
-class Zayo(GenericProvider):
-    """Zayo provider custom class."""
-
-    _include_filter = {
-        "text/html": ["Maintenance Ticket #"],
-        "html": ["Maintenance Ticket #"],
-    }
-
-    _processors: List[GenericProcessor] = PrivateAttr(
-        [
-            CombinedProcessor(data_parsers=[EmailDateParser, SubjectParserZayo1, HtmlParserZayo1]),
-        ]
-    )
-    _default_organizer = PrivateAttr("mr@zayo.com")
+if TYPE_CHECKING:
+    # The Providers imported on first access by `__getattr__`, visible here to the static analysis tools
+    from circuit_maintenance_parser.providers.aquacomms import AquaComms  # noqa: F401
+    from circuit_maintenance_parser.providers.arelion import Arelion  # noqa: F401
+    from circuit_maintenance_parser.providers.aws import AWS  # noqa: F401
+    from circuit_maintenance_parser.providers.bso import BSO  # noqa: F401
+    from circuit_maintenance_parser.providers.cogent import Cogent  # noqa: F401
+    from circuit_maintenance_parser.providers.colt import Colt  # noqa: F401
+    from circuit_maintenance_parser.providers.crowncastle import CrownCastle  # noqa: F401
+    from circuit_maintenance_parser.providers.equinix import Equinix  # noqa: F401
+    from circuit_maintenance_parser.providers.eunetworks import EUNetworks  # noqa: F401
+    from circuit_maintenance_parser.providers.globalcloudxchange import GlobalCloudXchange  # noqa: F401
+    from circuit_maintenance_parser.providers.google import Google  # noqa: F401
+    from circuit_maintenance_parser.providers.gtt import GTT  # noqa: F401
+    from circuit_maintenance_parser.providers.hgc import HGC  # noqa: F401
+    from circuit_maintenance_parser.providers.lumen import Lumen  # noqa: F401
+    from circuit_maintenance_parser.providers.megaport import Megaport  # noqa: F401
+    from circuit_maintenance_parser.providers.momentum import Momentum  # noqa: F401
+    from circuit_maintenance_parser.providers.netflix import Netflix  # noqa: F401
+    from circuit_maintenance_parser.providers.ntt import NTT  # noqa: F401
+    from circuit_maintenance_parser.providers.packetfabric import PacketFabric  # noqa: F401
+    from circuit_maintenance_parser.providers.pccw import PCCW  # noqa: F401
+    from circuit_maintenance_parser.providers.seaborn import Seaborn  # noqa: F401
+    from circuit_maintenance_parser.providers.sparkle import Sparkle  # noqa: F401
+    from circuit_maintenance_parser.providers.tata import Tata  # noqa: F401
+    from circuit_maintenance_parser.providers.telia import Telia  # noqa: F401
+    from circuit_maintenance_parser.providers.telstra import Telstra  # noqa: F401
+    from circuit_maintenance_parser.providers.turkcell import Turkcell  # noqa: F401
+    from circuit_maintenance_parser.providers.verizon import Verizon  # noqa: F401
+    from circuit_maintenance_parser.providers.windstream import Windstream  # noqa: F401
+    from circuit_maintenance_parser.providers.zayo import Zayo  # noqa: F401
+
+
+def __getattr__(name: str) -> Any:
+    """Import on first access the Providers, defined in the `providers` package, to keep them importable from here."""
+    return import_provider_class(name)
@@ -0,0 +1,58 @@
+"""Registry of the Providers, each one defined in its own module and imported on demand.
+
+A Provider is defined in the module named after its provider type, the lowercase class name, so only the Parsers of
+the Providers in use, and their dependencies, are imported.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Type
+
+if TYPE_CHECKING:
+    from circuit_maintenance_parser.provider import GenericProvider
+
+# Class names of the Providers, in order of preference
+PROVIDER_CLASS_NAMES = (
+    "AquaComms",
+    "Arelion",
+    "AWS",
+    "BSO",
+    "Cogent",
+    "Colt",
+    "CrownCastle",
+    "Equinix",
+    "EUNetworks",
+    "GlobalCloudXchange",
+    "Google",
+    "GTT",
+    "HGC",
+    "Lumen",
+    "Megaport",
+    "Momentum",
+    "Netflix",
+    "NTT",
+    "PacketFabric",
+    "PCCW",
+    "Seaborn",
+    "Sparkle",
+    "Tata",
+    "Telia",
+    "Telstra",
+    "Turkcell",
+    "Verizon",
+    "Windstream",
+    "Zayo",
+)
+
+# Provider class name per provider type
+PROVIDER_CLASS_NAMES_BY_TYPE = {class_name.lower(): class_name for class_name in PROVIDER_CLASS_NAMES}
+
+
+def import_provider_class(class_name: str) -> Type["GenericProvider"]:
+    """Import the module of a registered Provider and return its class.
+
+    Raises:
+        AttributeError: if `class_name` is not a registered Provider.
+    """
+    if class_name not in PROVIDER_CLASS_NAMES:
+        raise AttributeError(f"{class_name} is not a registered provider")
+    return getattr(import_module(f"{__name__}.{class_name.lower()}"), class_name)
@@ -0,0 +1,21 @@
+"""AquaComms provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.aquacomms import HtmlParserAquaComms1, SubjectParserAquaComms1
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class AquaComms(GenericProvider):
+    """AquaComms provider custom class."""
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserAquaComms1, SubjectParserAquaComms1]),
+        ]
+    )
+    _default_organizer = PrivateAttr("tickets@aquacomms.com")
@@ -0,0 +1,14 @@
+"""Arelion provider."""
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.constants import EMAIL_HEADER_SUBJECT
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class Arelion(GenericProvider):
+    """Arelion (formerly Telia Carrier) provider custom class."""
+
+    _exclude_filter = PrivateAttr({EMAIL_HEADER_SUBJECT: ["Disturbance Information"]})
+
+    _default_organizer = PrivateAttr("support@arelion.com")
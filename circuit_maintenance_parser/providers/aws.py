@@ -0,0 +1,23 @@
+"""AWS provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.aws import SubjectParserAWS1, TextParserAWS1
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class AWS(GenericProvider):
+    """AWS provider custom class."""
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            CombinedProcessor(data_parsers=[EmailDateParser, TextParserAWS1, SubjectParserAWS1]),
+        ]
+    )
+    _default_organizer = PrivateAttr("aws-account-notifications@amazon.com")
+    # Company-wide mail domain, not only used by the notifications
+    _sender_domain_lookup = PrivateAttr(False)
@@ -0,0 +1,21 @@
+"""BSO provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.bso import HtmlParserBSO1
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class BSO(GenericProvider):
+    """BSO provider custom class."""
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserBSO1]),
+        ]
+    )
+    _default_organizer = PrivateAttr("network-servicedesk@bso.co")
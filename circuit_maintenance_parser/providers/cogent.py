@@ -0,0 +1,22 @@
+"""Cogent provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.cogent import HtmlParserCogent1, SubjectParserCogent1, TextParserCogent1
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class Cogent(GenericProvider):
+    """Cogent provider custom class."""
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserCogent1]),
+            CombinedProcessor(data_parsers=[EmailDateParser, TextParserCogent1, SubjectParserCogent1]),
+        ]
+    )
+    _default_organizer = PrivateAttr("support@cogentco.com")
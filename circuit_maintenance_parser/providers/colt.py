@@ -0,0 +1,22 @@
+"""Colt provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.colt import CsvParserColt1, SubjectParserColt1, SubjectParserColt2
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class Colt(GenericProvider):
+    """Cogent provider custom class."""
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            CombinedProcessor(data_parsers=[EmailDateParser, CsvParserColt1, SubjectParserColt1]),
+            CombinedProcessor(data_parsers=[EmailDateParser, CsvParserColt1, SubjectParserColt2]),
+        ]
+    )
+    _default_organizer = PrivateAttr("PlannedWorks@colt.net")
@@ -0,0 +1,21 @@
+"""CrownCastle provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.crowncastle import HtmlParserCrownCastle1
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class CrownCastle(GenericProvider):
+    """Crown Castle Fiber provider custom class."""
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserCrownCastle1]),
+        ]
+    )
+    _default_organizer = PrivateAttr("fiberchangemgmt@crowncastle.com")
@@ -0,0 +1,24 @@
+"""Equinix provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.constants import EMAIL_HEADER_SUBJECT
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.equinix import HtmlParserEquinix, SubjectParserEquinix
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class Equinix(GenericProvider):
+    """Equinix provider custom class."""
+
+    _include_filter = PrivateAttr({EMAIL_HEADER_SUBJECT: ["Network Maintenance"]})
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            CombinedProcessor(data_parsers=[HtmlParserEquinix, SubjectParserEquinix, EmailDateParser]),
+        ]
+    )
+    _default_organizer = PrivateAttr("servicedesk@equinix.com")
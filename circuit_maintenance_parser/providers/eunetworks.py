@@ -0,0 +1,9 @@
+"""EUNetworks provider."""
+
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class EUNetworks(GenericProvider):
+    """EUNetworks provider custom class."""
+
+    _default_organizer = "noc@eunetworks.com"
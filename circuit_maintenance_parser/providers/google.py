@@ -0,0 +1,23 @@
+"""Google provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.google import HtmlParserGoogle1
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class Google(GenericProvider):
+    """Google provider custom class."""
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserGoogle1]),
+        ]
+    )
+    _default_organizer = PrivateAttr("noc-noreply@google.com")
+    # Company-wide mail domain, not only used by the notifications
+    _sender_domain_lookup = PrivateAttr(False)
@@ -0,0 +1,28 @@
+"""GTT provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.constants import EMAIL_HEADER_SUBJECT
+from circuit_maintenance_parser.parser import EmailDateParser, ICal
+from circuit_maintenance_parser.parsers.gtt import HtmlParserGTT1
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor, SimpleProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class GTT(GenericProvider):
+    """EXA (formerly GTT) provider custom class."""
+
+    # "Planned Work Notification", "Emergency Work Notification"
+    _include_filter = PrivateAttr(
+        {"Icalendar": ["BEGIN"], "ical": ["BEGIN"], EMAIL_HEADER_SUBJECT: ["Work Notification"]}
+    )
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            SimpleProcessor(data_parsers=[ICal]),
+            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserGTT1]),
+        ]
+    )
+    _default_organizer = PrivateAttr("InfraCo.CM@exainfra.net")
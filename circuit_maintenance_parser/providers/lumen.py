@@ -0,0 +1,24 @@
+"""Lumen provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.constants import EMAIL_HEADER_SUBJECT
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.lumen import HtmlParserLumen1
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class Lumen(GenericProvider):
+    """Lumen provider custom class."""
+
+    _include_filter = PrivateAttr({EMAIL_HEADER_SUBJECT: ["Scheduled Maintenance"]})
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserLumen1]),
+        ]
+    )
+    _default_organizer = PrivateAttr("smc@lumen.com")
@@ -0,0 +1,21 @@
+"""Netflix provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.netflix import TextParserNetflix1
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class Netflix(GenericProvider):
+    """Netflix provider custom class."""
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [CombinedProcessor(data_parsers=[EmailDateParser, TextParserNetflix1])]
+    )
+    _default_organizer = PrivateAttr("cdnetops@netflix.com")
+    # Company-wide mail domain, not only used by the notifications
+    _sender_domain_lookup = PrivateAttr(False)
@@ -0,0 +1,11 @@
+"""NTT provider."""
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class NTT(GenericProvider):
+    """NTT provider custom class."""
+
+    _default_organizer = PrivateAttr("noc@us.ntt.net")
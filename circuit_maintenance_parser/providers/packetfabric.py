@@ -0,0 +1,11 @@
+"""PacketFabric provider."""
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class PacketFabric(GenericProvider):
+    """PacketFabric provider custom class."""
+
+    _default_organizer = PrivateAttr("support@packetfabric.com")
@@ -0,0 +1,34 @@
+"""PCCW provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.constants import EMAIL_HEADER_SUBJECT
+from circuit_maintenance_parser.parser import EmailDateParser, ICal
+from circuit_maintenance_parser.parsers.pccw import HtmlParserPCCW, SubjectParserPCCW
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor, SimpleProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class PCCW(GenericProvider):
+    """PCCW provider custom class."""
+
+    _include_filter = PrivateAttr(
+        {
+            "Icalendar": ["BEGIN"],
+            "ical": ["BEGIN"],
+            EMAIL_HEADER_SUBJECT: [
+                "Completion - Planned Outage Notification",
+                "Completion - Urgent Maintenance Notification",
+            ],
+        }
+    )
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            SimpleProcessor(data_parsers=[ICal]),
+            CombinedProcessor(data_parsers=[HtmlParserPCCW, SubjectParserPCCW, EmailDateParser]),
+        ]
+    )
+    _default_organizer = "mailto:gsoc-planned-event@pccwglobal.com"
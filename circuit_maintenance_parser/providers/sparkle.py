@@ -0,0 +1,21 @@
+"""Sparkle provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.sparkle import HtmlParserSparkle1
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class Sparkle(GenericProvider):
+    """Sparkle provider custom class."""
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            CombinedProcessor(data_parsers=[HtmlParserSparkle1, EmailDateParser]),
+        ]
+    )
+    _default_organizer = PrivateAttr("TISAmericaNOC@tisparkle.com")
@@ -0,0 +1,25 @@
+# pylint: disable=disallowed-name
+"""Tata provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.constants import EMAIL_HEADER_SUBJECT
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.tata import HtmlParserTata, SubjectParserTata
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class Tata(GenericProvider):
+    """Tata provider custom class."""
+
+    _include_filter = PrivateAttr({EMAIL_HEADER_SUBJECT: ["Planned Work Notification"]})
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            CombinedProcessor(data_parsers=[HtmlParserTata, SubjectParserTata, EmailDateParser]),
+        ]
+    )
+    _default_organizer = PrivateAttr("planned.activity@tatacommunications.com")
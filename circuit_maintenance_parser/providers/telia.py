@@ -0,0 +1,9 @@
+"""Telia provider."""
+
+from circuit_maintenance_parser.providers.arelion import Arelion
+
+
+class Telia(Arelion):
+    """Telia provider custom class."""
+
+    # Kept for compatibility purposes, but Telia is renamed Arelion
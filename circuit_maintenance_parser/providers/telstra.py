@@ -0,0 +1,23 @@
+"""Telstra provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.parser import EmailDateParser, ICal
+from circuit_maintenance_parser.parsers.telstra import HtmlParserTelstra1, HtmlParserTelstra2
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor, SimpleProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class Telstra(GenericProvider):
+    """Telstra provider custom class."""
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            SimpleProcessor(data_parsers=[ICal]),
+            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserTelstra2]),
+            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserTelstra1]),
+        ]
+    )
+    _default_organizer = PrivateAttr("gpen@team.telstra.com")
@@ -0,0 +1,21 @@
+"""Turkcell provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.turkcell import HtmlParserTurkcell1
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class Turkcell(GenericProvider):
+    """Turkcell provider custom class."""
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserTurkcell1]),
+        ]
+    )
+    _default_organizer = PrivateAttr("inoc@superonline.net")
@@ -0,0 +1,21 @@
+"""Verizon provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.verizon import HtmlParserVerizon1
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class Verizon(GenericProvider):
+    """Verizon provider custom class."""
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            CombinedProcessor(data_parsers=[EmailDateParser, HtmlParserVerizon1]),
+        ]
+    )
+    _default_organizer = PrivateAttr("NO-REPLY-sched-maint@EMEA.verizonbusiness.com")
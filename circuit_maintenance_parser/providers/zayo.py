@@ -0,0 +1,26 @@
+"""Zayo provider."""
+
+from typing import List
+
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser.parser import EmailDateParser
+from circuit_maintenance_parser.parsers.zayo import HtmlParserZayo1, SubjectParserZayo1
+from circuit_maintenance_parser.processor import CombinedProcessor, GenericProcessor
+from circuit_maintenance_parser.provider import GenericProvider
+
+
+class Zayo(GenericProvider):
+    """Zayo provider custom class."""
+
+    _include_filter = {
+        "text/html": ["Maintenance Ticket #"],
+        "html": ["Maintenance Ticket #"],
+    }
+
+    _processors: List[GenericProcessor] = PrivateAttr(
+        [
+            CombinedProcessor(data_parsers=[EmailDateParser, SubjectParserZayo1, HtmlParserZayo1]),
+        ]
+    )
+    _default_organizer = PrivateAttr("mr@zayo.com")
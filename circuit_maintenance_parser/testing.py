@@ -0,0 +1,18 @@
+"""Helpers building sample notifications, shared by the tests and the benchmarks."""
+import email
+from email.mime.message import MIMEMessage
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+
+def build_forwarded_email(forwarding_levels: int) -> email.message.Message:
+    """Build an email forwarding the same notification `forwarding_levels` times."""
+    email_message: email.message.Message = MIMEText("Maintenance notification", "plain")
+    for level in range(forwarding_levels):
+        forwarded_message = MIMEMultipart()
+        forwarded_message.attach(MIMEText(f"Forwarded notification {level}", "plain"))
+        forwarded_message.attach(MIMEMessage(email_message))
+        email_message = forwarded_message
+    email_message["Subject"] = "Fwd: Maintenance"
+    email_message["Date"] = "Sat, 30 Apr 2005 19:28:29 -0300"
+    return email_message
@@ -1,14 +1,13 @@
 """Utility functions for the library."""
 import os
 import logging
-from typing import Tuple, Dict, Union
+import re
+from collections import Counter
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple, Union
 import csv
 import datetime
 import pytz
 
-from geopy.exc import GeocoderUnavailable, GeocoderTimedOut, GeocoderServiceError  # type: ignore
-from geopy.geocoders import Nominatim  # type: ignore
-from timezonefinder import TimezoneFinder  # type: ignore
 import backoff  # type: ignore
 
 from .errors import ParserError
@@ -41,6 +40,9 @@ class Geolocator:
     def timezone(cls):  # pylint: disable=no-self-argument
         """Load the timezone resolver."""
         if cls._timezone is None:
+            # Imported on first use, as loading the timezone resolver is slow
+            from timezonefinder import TimezoneFinder  # type: ignore # pylint: disable=import-outside-toplevel
+
             cls._timezone = TimezoneFinder()
             logger.info("Loaded local timezone resolver.")
         return cls._timezone
@@ -90,18 +92,26 @@ class Geolocator:
         raise ValueError
 
     @staticmethod
-    @backoff.on_exception(
-        backoff.expo,
-        (GeocoderUnavailable, GeocoderTimedOut, GeocoderServiceError),
-        max_time=10,
-        logger=logger,
-    )
     def get_location_from_api(city: str) -> Tuple[float, float]:
         """Get location from API."""
-        geolocator = Nominatim(user_agent="circuit_maintenance")
-        location = geolocator.geocode(city)  # API call to OpenStreetMap web service
-        logger.debug("Resolved %s to %s from OpenStreetMap webservice.", city, location)
-        return (location.latitude, location.longitude)
+        # Imported on first use, as the geocoders are only needed when the local DB doesn't resolve the city
+        # pylint: disable-next=import-outside-toplevel
+        from geopy.exc import GeocoderUnavailable, GeocoderTimedOut, GeocoderServiceError  # type: ignore
+        from geopy.geocoders import Nominatim  # type: ignore # pylint: disable=import-outside-toplevel
+
+        @backoff.on_exception(
+            backoff.expo,
+            (GeocoderUnavailable, GeocoderTimedOut, GeocoderServiceError),
+            max_time=10,
+            logger=logger,
+        )
+        def geocode(city: str) -> Tuple[float, float]:
+            geolocator = Nominatim(user_agent="circuit_maintenance")
+            location = geolocator.geocode(city)  # API call to OpenStreetMap web service
+            logger.debug("Resolved %s to %s from OpenStreetMap webservice.", city, location)
+            return (location.latitude, location.longitude)
+
+        return geocode(city)
 
     def city_timezone(self, city: str) -> str:
         """Get the timezone for a given city.
@@ -130,6 +140,101 @@ class Geolocator:
         raise ParserError("Timezone resolution not properly initalized.")
 
 
+# Candidate `strptime` formats of `parse_datetime`, in order. Only formats whose parsed date is always the one of
+# `dateutil`, if they match, are candidates: months by name, or days and months in the order `dateutil` expects.
+DATETIME_FORMATS = (
+    "%d-%b-%Y %H:%M:%S",
+    "%d-%b-%Y %H:%M",
+    "%d-%b-%Y",
+    "%d %b %Y %H:%M:%S",
+    "%a, %d %b %Y %H:%M:%S",
+    "%A, %d %b %H:%M %Y",
+    "%b %d %Y %H:%M",
+    "%b %d, %Y %H:%M",
+)
+# `dateutil` only parses the years first as year, month, day if not `dayfirst`
+MONTH_FIRST_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %I:%M %p",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y %I:%M:%S %p",
+)
+DAY_FIRST_DATETIME_FORMATS = ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%d/%m/%Y %I:%M:%S %p")
+
+# Timezone suffixes that `dateutil` parses as UTC
+UTC_SUFFIXES = (" UTC", " GMT")
+
+# `strptime` format, and UTC suffix, learned by `parse_datetime` per key, or None if no candidate format matched
+learned_datetime_formats: Dict[Hashable, Optional[Tuple[str, str]]] = {}
+
+# Number of dates parsed by `parse_datetime` with a learned format ("hit"), with `dateutil` after a learned format
+# failed ("miss"), with `dateutil` without a learned format ("fallback"), and number of formats learned ("learned")
+datetime_format_stats: Counter = Counter()
+
+
+def parse_datetime(timestr: str, key: Hashable, dayfirst: bool = False) -> datetime.datetime:
+    """Parse a date as `dateutil.parser.parse` does, trying first the `strptime` format learned for its key.
+
+    The generic tokenizer of `dateutil` is slow, so the first time a key is seen, the candidate format that parses the
+    date as `dateutil` does is learned for the key, and tried first on later calls, falling back to `dateutil` when it
+    doesn't match. If no candidate matches, the key keeps using `dateutil`.
+
+    Args:
+        timestr: Date to parse.
+        key: Hashable identifier of the kind of dates to parse, such as the parser and the field of the date.
+        dayfirst (optional): Whether the day comes before the month in ambiguous dates, as in `dateutil`.
+    """
+    learned_format = learned_datetime_formats.get(key)
+    if learned_format is not None:
+        try:
+            result = strptime_with_utc_suffix(timestr, *learned_format)
+        except ValueError:
+            datetime_format_stats["miss"] += 1
+        else:
+            datetime_format_stats["hit"] += 1
+            return result
+    else:
+        datetime_format_stats["fallback"] += 1
+
+    # Imported on first use, as the parser of `dateutil` is slow to import
+    from dateutil import parser  # pylint: disable=import-outside-toplevel
+
+    result = parser.parse(timestr, dayfirst=dayfirst)
+    if learned_format is not None or key not in learned_datetime_formats:
+        learned_datetime_formats[key] = learn_datetime_format(timestr, result, dayfirst)
+        if learned_datetime_formats[key] is not None:
+            datetime_format_stats["learned"] += 1
+    return result
+
+
+def learn_datetime_format(timestr: str, expected: datetime.datetime, dayfirst: bool) -> Optional[Tuple[str, str]]:
+    """Return the candidate `strptime` format, and UTC suffix, that parses the date as `expected`, if any."""
+    utc_suffix = next((suffix for suffix in UTC_SUFFIXES if timestr.endswith(suffix)), "")
+    for datetime_format in DATETIME_FORMATS + (
+        DAY_FIRST_DATETIME_FORMATS if dayfirst else MONTH_FIRST_DATETIME_FORMATS
+    ):
+        try:
+            result = strptime_with_utc_suffix(timestr, datetime_format, utc_suffix)
+        except ValueError:
+            continue
+        if result == expected and result.tzinfo == expected.tzinfo:
+            return datetime_format, utc_suffix
+    return None
+
+
+def strptime_with_utc_suffix(timestr: str, datetime_format: str, utc_suffix: str) -> datetime.datetime:
+    """Parse a date with a `strptime` format, in UTC as `dateutil` does if it ends with the UTC suffix."""
+    if not utc_suffix:
+        return datetime.datetime.strptime(timestr, datetime_format)
+    if not timestr.endswith(utc_suffix):
+        raise ValueError(f"{timestr} doesn't end with {utc_suffix}")
+    from dateutil import tz  # pylint: disable=import-outside-toplevel
+
+    return datetime.datetime.strptime(timestr[: -len(utc_suffix)], datetime_format).replace(tzinfo=tz.UTC)
+
+
 def convert_timezone(time_str):
     """
     Converts a string representing a date/time in the format 'MM/DD/YY HH:MM Timezone' to a datetime object in UTC.
@@ -182,3 +287,94 @@ def rgetattr(obj, attr):
     if not nested_value:
         return obj
     return rgetattr(nested_value, attr)
+
+
+class RegisteredRegex:
+    """Regular expression of the `regex_registry`, compiled once, on first use or, if eager, on registration.
+
+    It exposes the matching methods of a compiled `re.Pattern`, so the parsers call them on the expressions they
+    register at module level instead of passing pattern strings to the `re` functions, which look them up in the
+    bounded cache of `re` on every call and compile them again once other expressions have evicted them.
+    """
+
+    __slots__ = ("pattern", "flags", "_compiled")
+
+    def __init__(self, pattern: str, flags: int = 0):
+        """Keep the pattern and flags to compile."""
+        self.pattern = pattern
+        self.flags = flags
+        self._compiled: Optional[re.Pattern] = None
+
+    def __repr__(self):
+        """Represent the expression as `re.compile` does."""
+        return f"{self.__class__.__name__}({self.pattern!r}, {self.flags!r})"
+
+    @property
+    def compiled(self) -> re.Pattern:
+        """Return the compiled pattern, compiling it on first use."""
+        if self._compiled is None:
+            self._compiled = re.compile(self.pattern, self.flags)
+        return self._compiled
+
+    @property
+    def is_compiled(self) -> bool:
+        """Whether the pattern has already been compiled."""
+        return self._compiled is not None
+
+    def search(self, string: str, *args) -> Optional[re.Match]:
+        """Equivalent of `re.search` with this expression."""
+        return (self._compiled or self.compiled).search(string, *args)
+
+    def match(self, string: str, *args) -> Optional[re.Match]:
+        """Equivalent of `re.match` with this expression."""
+        return (self._compiled or self.compiled).match(string, *args)
+
+    def fullmatch(self, string: str, *args) -> Optional[re.Match]:
+        """Equivalent of `re.fullmatch` with this expression."""
+        return (self._compiled or self.compiled).fullmatch(string, *args)
+
+    def findall(self, string: str, *args) -> List:
+        """Equivalent of `re.findall` with this expression."""
+        return (self._compiled or self.compiled).findall(string, *args)
+
+    def finditer(self, string: str, *args) -> Iterator[re.Match]:
+        """Equivalent of `re.finditer` with this expression."""
+        return (self._compiled or self.compiled).finditer(string, *args)
+
+    def sub(self, repl, string: str, count: int = 0) -> str:
+        """Equivalent of `re.sub` with this expression."""
+        return (self._compiled or self.compiled).sub(repl, string, count)
+
+    def split(self, string: str, maxsplit: int = 0) -> List:
+        """Equivalent of `re.split` with this expression."""
+        return (self._compiled or self.compiled).split(string, maxsplit)
+
+
+# Regular expressions registered by the parsers, by pattern and flags
+regex_registry: Dict[Tuple[str, int], RegisteredRegex] = {}
+
+
+def register_regex(pattern: str, flags: int = 0) -> RegisteredRegex:
+    """Return the registered regular expression of a pattern and flags, registering it if it's new.
+
+    Registered expressions are compiled on first use, unless the `PARSER_EAGER_REGEX_COMPILATION` environment variable
+    is set, which compiles them on registration, at import time, so no notification pays for their compilation.
+
+    Args:
+        pattern: Regular expression pattern, as for `re.compile`.
+        flags (optional): Regular expression flags, as for `re.compile`.
+    """
+    regex = regex_registry.get((pattern, flags))
+    if regex is None:
+        regex = regex_registry[(pattern, flags)] = RegisteredRegex(pattern, flags)
+    if os.getenv("PARSER_EAGER_REGEX_COMPILATION"):
+        regex.compiled  # pylint: disable=pointless-statement
+    return regex
+
+
+def compile_registered_regexes() -> int:
+    """Compile all the registered regular expressions not compiled yet, and return how many were compiled."""
+    pending = [regex for regex in regex_registry.values() if not regex.is_compiled]
+    for regex in pending:
+        regex.compiled  # pylint: disable=pointless-statement
+    return len(pending)
@@ -135,6 +135,24 @@ def pytest(context, local=INVOKE_LOCAL):
     run_cmd(context, exec_cmd, local)
 
 
+@task(
+    help={"name": "Name of a single benchmark to run, such as `email_parsing`. Default: all of them."},
+)
+def benchmark(context, local=INVOKE_LOCAL, name=None):
+    """Run the performance benchmarks from the `benchmarks` folder.
+
+    Args:
+        context (obj): Used to run specific commands
+        local (bool): Define as `True` to execute locally
+        name (str): Name of a single benchmark to run
+    """
+    if name:
+        exec_cmd = f"python benchmarks/{name}.py"
+    else:
+        exec_cmd = 'for benchmark in $(ls benchmarks/*.py | grep -v common.py); do python "$benchmark"; done'
+    run_cmd(context, exec_cmd, local)
+
+
 @task
 def black(context, local=INVOKE_LOCAL):
     """Run black to check that Python files adherence to black standards.
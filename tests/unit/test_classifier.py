@@ -0,0 +1,119 @@
+"""Tests for ProviderClassifier."""
+import os
+import re
+from pathlib import Path
+
+import pytest
+from pydantic import PrivateAttr
+
+from circuit_maintenance_parser import classify_notification
+from circuit_maintenance_parser.classifier import FilterSignature, ProviderClassifier
+from circuit_maintenance_parser.constants import EMAIL_HEADER_SUBJECT
+from circuit_maintenance_parser.data import NotificationData
+from circuit_maintenance_parser.provider import GenericProvider
+from circuit_maintenance_parser.providers.equinix import Equinix
+from circuit_maintenance_parser.providers.gtt import GTT
+from circuit_maintenance_parser.providers.pccw import PCCW
+from circuit_maintenance_parser.providers.tata import Tata
+from circuit_maintenance_parser.providers.zayo import Zayo
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+
+
+class ProviderA(GenericProvider):
+    """Fake Provider."""
+
+    _include_filter = PrivateAttr({EMAIL_HEADER_SUBJECT: ["Maintenance"], "text/html": ["Ticket"]})
+
+
+class ProviderB(GenericProvider):
+    """Fake Provider."""
+
+    _include_filter = PrivateAttr({EMAIL_HEADER_SUBJECT: ["Planned Maintenance"]})
+
+
+class ProviderC(GenericProvider):
+    """Fake Provider."""
+
+    _include_filter = PrivateAttr({EMAIL_HEADER_SUBJECT: ["Maintenance"]})
+    _exclude_filter = PrivateAttr({EMAIL_HEADER_SUBJECT: ["Cancelled"]})
+
+
+class ProviderD(GenericProvider):
+    """Fake Provider, with expressions that can't be combined with others."""
+
+    _include_filter = PrivateAttr({"text/html": ["(?i)maintenance", r"(?P<id>\d+)-(?P=id)"]})
+
+
+class ProviderE(GenericProvider):
+    """Fake Provider, with expressions that can't be combined with others."""
+
+    _include_filter = PrivateAttr({"text/html": [r"(\w+) \1", "Ticket"]})
+    _exclude_filter = PrivateAttr({"text/html": ["(?x) cancel led"]})
+
+
+@pytest.mark.parametrize(
+    "subject, html, expected_providers",
+    [
+        (b"Planned Maintenance", b"<p>Ticket 1</p>", [ProviderA, ProviderB, ProviderC]),
+        (b"Planned Maintenance", b"<p>Nothing</p>", [ProviderA, ProviderB, ProviderC]),
+        (b"Maintenance", b"<p>Ticket 1</p>", [ProviderA, ProviderC]),
+        (b"Cancelled Planned Maintenance", b"<p>Ticket 1</p>", [ProviderA, ProviderB]),
+        (b"Other notification", b"<p>Ticket 1</p>", [ProviderA]),
+        (b"Other notification", b"<p>Nothing</p>", []),
+    ],
+)
+def test_classify(subject, html, expected_providers):
+    """Tests the candidate providers, ranked by number of matches and without the excluded ones."""
+    data = NotificationData.init_from_raw(EMAIL_HEADER_SUBJECT, subject)
+    data.add_data_part("text/html", html)
+    assert ProviderClassifier([GenericProvider, ProviderA, ProviderB, ProviderC]).classify(data) == expected_providers
+
+
+def test_find_signatures_overlapping():
+    """Tests that the single pass finds overlapping expressions, as searching each one separately."""
+    signatures = [
+        FilterSignature(re.compile(expression), 0, False) for expression in ["abc", "bcd", "b", "xyz", "c.*e"]
+    ]
+    matcher = ProviderClassifier.compile_signatures(signatures)
+    assert ProviderClassifier.find_signatures(matcher, len(signatures), "abcde") == {0, 1, 2, 4}
+
+
+@pytest.mark.parametrize(
+    "html, expected_providers",
+    [
+        (b"<p>MAINTENANCE 12-12 Ticket done done</p>", [ProviderD, ProviderE, ProviderA]),
+        (b"<p>Maintenance 12-13 Ticket</p>", [ProviderA, ProviderD, ProviderE]),
+        (b"<p>Maintenance Ticket done done cancelled</p>", [ProviderA, ProviderD]),
+        (b"<p>Nothing 12-13</p>", []),
+    ],
+)
+def test_classify_not_combinable_expressions(html, expected_providers):
+    """Tests that the expressions with global flags, named groups or backreferences are matched on their own."""
+    classifier = ProviderClassifier([ProviderA, ProviderD, ProviderE])
+    _, combined, separate = classifier._matchers["text/html"]  # pylint: disable=protected-access
+    assert [signature.expression for signature in combined] == ["Ticket", "Ticket"]
+    assert [signature.expression for signature in separate] == [
+        "(?i)maintenance",
+        r"(?P<id>\d+)-(?P=id)",
+        r"(\w+) \1",
+        "(?x) cancel led",
+    ]
+    data = NotificationData.init_from_raw("text/html", html)
+    assert classifier.classify(data) == expected_providers
+
+
+@pytest.mark.parametrize(
+    "email_file, expected_providers",
+    [
+        (Path(dir_path, "data", "equinix", "equinix1.eml"), [Equinix]),
+        (Path(dir_path, "data", "pccw", "pccw_email.eml"), [PCCW]),
+        # "Planned Work Notification" matches both the GTT and Tata subject filters
+        (Path(dir_path, "data", "tata", "tata_email.eml"), [GTT, Tata]),
+        (Path(dir_path, "data", "zayo", "zayo3.eml"), [Zayo]),
+    ],
+)
+def test_classify_notification(email_file, expected_providers):
+    """Tests the classification of real notifications among the supported providers."""
+    data = NotificationData.init_from_email_file(email_file)
+    assert classify_notification(data) == expected_providers
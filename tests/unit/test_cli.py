@@ -0,0 +1,65 @@
+"""Tests for the CLI."""
+import mailbox
+import os
+from email.mime.application import MIMEApplication
+from email.mime.multipart import MIMEMultipart
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from circuit_maintenance_parser.cli import main
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+
+OTHER_EMAIL = b"From: user@example.com\nSubject: Hello\nDate: Mon, 1 Jan 2024 00:00:00 +0000\n\nNot a maintenance\n"
+
+
+def build_ical_email() -> bytes:
+    """Return an email with an iCalendar maintenance notification attached."""
+    with open(Path(dir_path, "data", "ical", "ical1"), "rb") as ical_file:
+        ical_attachment = MIMEApplication(ical_file.read(), "calendar")
+    ical_attachment.replace_header("Content-Type", "text/calendar")
+    email_message = MIMEMultipart()
+    email_message["Subject"] = "Maintenance"
+    email_message["Date"] = "Mon, 1 Jan 2024 00:00:00 +0000"
+    email_message.attach(ical_attachment)
+    return email_message.as_bytes()
+
+
+def test_cli_mbox_continues_after_failures(tmp_path):
+    """Test that the messages of an archive failing to be processed don't stop the processing of the others."""
+    mbox = mailbox.mbox(tmp_path / "archive.mbox")
+    for raw_email in (OTHER_EMAIL, build_ical_email(), OTHER_EMAIL):
+        mbox.add(raw_email)
+    mbox.close()
+
+    result = CliRunner().invoke(main, ["--data-file", str(tmp_path / "archive.mbox"), "--data-type", "mbox"])
+
+    assert result.exit_code == 1
+    assert "Circuit Maintenance Notification #0" in result.output
+    assert "Provider processing failed for message #0" in result.output
+    assert "Provider processing failed for message #2" in result.output
+    assert "2 messages of" in result.output
+
+
+def test_cli_maildir_counts_messages_not_initialized(tmp_path):
+    """Test that the messages of an archive that can't be initialized are reported as failures."""
+    maildir = mailbox.Maildir(tmp_path / "maildir")
+    for raw_email in (build_ical_email(), b"Not an email message"):
+        maildir.add(raw_email)
+    maildir.close()
+
+    result = CliRunner().invoke(main, ["--data-file", str(tmp_path / "maildir"), "--data-type", "maildir"])
+
+    assert result.exit_code == 1
+    assert "Circuit Maintenance Notification #0" in result.output
+    assert "Notification data could not be initialized from message #" in result.output
+    assert "1 messages of" in result.output
+
+
+def test_cli_data_not_initialized(tmp_path):
+    """Test that a file that can't be loaded is reported instead of being processed."""
+    result = CliRunner().invoke(main, ["--data-file", str(tmp_path / "missing.ics"), "--data-type", "ical"])
+
+    assert result.exit_code == 1
+    assert "Notification data could not be initialized" in result.output
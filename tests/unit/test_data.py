@@ -1,9 +1,17 @@
 """Tests NotificationData."""
 import os
+import mailbox
+import types
 from pathlib import Path
 import email
 
-from circuit_maintenance_parser.data import NotificationData
+import pytest
+
+from circuit_maintenance_parser.constants import EMAIL_HEADER_DATE, EMAIL_HEADER_SUBJECT
+from circuit_maintenance_parser.data import DataPart, NotificationData
+from circuit_maintenance_parser.provider import GenericProvider
+from circuit_maintenance_parser.providers.zayo import Zayo
+from circuit_maintenance_parser.testing import build_forwarded_email
 
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
@@ -24,6 +32,44 @@ def test_init_from_raw_with_issue():
     assert data is None
 
 
+def test_init_from_file():
+    """Test the memory mapped data load and its release when leaving the context."""
+    data_file = Path(dir_path, "data", "ical", "ical1")
+    with NotificationData.init_from_file("ical", data_file) as data:
+        assert isinstance(data.data_parts[0].content, memoryview)
+        assert data.data_parts[0].content == data_file.read_bytes()
+    with pytest.raises(ValueError):
+        bytes(data.data_parts[0].content)
+
+
+def test_init_from_file_with_issue(tmp_path):
+    """Test the memory mapped data load with a file that can't be mapped."""
+    assert NotificationData.init_from_file("ical", tmp_path / "missing") is None
+    (tmp_path / "empty").touch()
+    assert NotificationData.init_from_file("ical", tmp_path / "empty") is None
+
+
+@pytest.mark.parametrize(
+    "provider_class, data_type, data_file",
+    [
+        (Zayo, "html", Path(dir_path, "data", "zayo", "zayo1.html")),
+        (GenericProvider, "ical", Path(dir_path, "data", "ical", "ical1")),
+    ],
+)
+def test_init_from_file_get_maintenances(provider_class, data_type, data_file):
+    """Test that memory mapped content is parsed as the same content read into bytes."""
+    expected = provider_class().get_maintenances(NotificationData.init_from_raw(data_type, data_file.read_bytes()))
+    with NotificationData.init_from_file(data_type, data_file) as data:
+        assert provider_class().get_maintenances(data) == expected
+
+
+def test_init_from_email_file():
+    """Test the memory mapped email data load."""
+    email_path = Path(dir_path, "data", "email", "test_sample_message.eml")
+    data = NotificationData.init_from_email_file(email_path)
+    assert data == NotificationData.init_from_email_bytes(email_path.read_bytes())
+
+
 def test_init_from_email_bytes():
     """Test the email data load."""
     with open(Path(dir_path, "data", "email", "test_sample_message.eml"), "rb") as email_file:
@@ -54,3 +100,295 @@ def test_init_from_emailmessage_with_issue():
     """Test the init_data_emailmessage function with issue."""
     data = NotificationData.init_from_emailmessage("")
     assert data is None
+
+
+def test_iter_from_mbox(tmp_path):
+    """Test the lazy load of the messages from a mbox archive."""
+    with open(Path(dir_path, "data", "email", "test_sample_message.eml"), "rb") as email_file:
+        email_raw_data = email_file.read()
+    mbox = mailbox.mbox(tmp_path / "archive.mbox")
+    for _ in range(3):
+        mbox.add(email_raw_data)
+    mbox.close()
+
+    notifications = NotificationData.iter_from_mbox(tmp_path / "archive.mbox")
+    assert isinstance(notifications, types.GeneratorType)
+    notifications_list = list(notifications)
+    assert len(notifications_list) == 3
+    for data in notifications_list:
+        assert isinstance(data, NotificationData)
+        assert len(data.data_parts) == 5
+
+
+def test_iter_from_maildir(tmp_path):
+    """Test the lazy load of the messages from a Maildir folder, skipping the wrong ones."""
+    with open(Path(dir_path, "data", "email", "test_sample_message.eml"), "rb") as email_file:
+        email_raw_data = email_file.read()
+    maildir = mailbox.Maildir(tmp_path / "maildir")
+    maildir.add(email_raw_data)
+    maildir.add(b"Not an email message")
+    maildir.close()
+
+    notifications_list = list(NotificationData.iter_from_maildir(tmp_path / "maildir"))
+    assert len(notifications_list) == 1
+    assert len(notifications_list[0].data_parts) == 5
+
+
+def test_iter_from_maildir_not_skipping_failed(tmp_path):
+    """Test that the Maildir messages that can't be initialized are yielded as None when requested."""
+    maildir = mailbox.Maildir(tmp_path / "maildir")
+    maildir.add(b"Not an email message")
+    maildir.close()
+
+    notifications_list = list(NotificationData.iter_from_maildir(tmp_path / "maildir", skip_failed=False))
+    assert notifications_list == [None]
+
+
+def test_init_from_email_bytes_non_utf8():
+    """Test the email data load with 8bit content not encoded as UTF-8."""
+    raw_email = (
+        "Subject: Maintenance Ünïcode\n"
+        "Date: Sat, 30 Apr 2005 19:28:29 -0300\n"
+        "Content-Type: text/plain; charset=ISO-8859-1\n"
+        "Content-Transfer-Encoding: 8bit\n"
+        "\n"
+    ).encode("utf-8") + "Body with non UTF-8 content: é\n".encode("latin-1")
+    data = NotificationData.init_from_email_bytes(raw_email)
+    assert isinstance(data, NotificationData)
+    assert [(data_part.type, data_part.content) for data_part in data.data_parts] == [
+        ("email-header-date", b"Sat, 30 Apr 2005 19:28:29 -0300"),
+        ("email-header-subject", "Maintenance Ünïcode".encode("utf-8")),
+        ("text/plain", "Body with non UTF-8 content: é\n".encode("latin-1")),
+    ]
+
+
+def test_data_part_lazy_decoding():
+    """Test that the email parts are only decoded when their content is accessed."""
+    with open(Path(dir_path, "data", "email", "test_sample_message.eml"), "rb") as email_file:
+        data = NotificationData.init_from_email_bytes(email_file.read())
+
+    html_data_part = next(data_part for data_part in data.data_parts if data_part.type == "text/html")
+    assert html_data_part._content is None  # pylint: disable=protected-access
+    assert b"<html>" in html_data_part.content
+    assert html_data_part._email_part is None  # pylint: disable=protected-access
+    # The email headers are always stored already decoded
+    assert all(
+        data_part._content is not None  # pylint: disable=protected-access
+        for data_part in data.data_parts
+        if data_part.type in (EMAIL_HEADER_DATE, EMAIL_HEADER_SUBJECT)
+    )
+
+
+def test_data_part_equality():
+    """Test DataParts comparison, that takes into account the type and the decoded content."""
+    email_message = email.message_from_string(
+        "Content-Type: text/plain\nContent-Transfer-Encoding: base64\n\nc29tZSBjb250ZW50\n"
+    )
+    assert DataPart.from_email_part(email_message) == DataPart("text/plain", b"some content")
+    assert DataPart("text/plain", b"some content") != DataPart("text/html", b"some content")
+    assert len({DataPart("text/plain", b"some content"), DataPart("text/plain", b"some content")}) == 1
+
+
+def test_data_part_as_tuple():
+    """Test that a DataPart can still be used as its `(type, content)` tuple."""
+    data_part = DataPart("text/plain", b"some content")
+    data_type, content = data_part
+    assert (data_type, content) == ("text/plain", b"some content")
+    assert data_part[0] == "text/plain"
+    assert data_part[1] == b"some content"
+    assert data_part[-1] == b"some content"
+    assert len(data_part) == 2
+    assert tuple(data_part) == ("text/plain", b"some content")
+
+
+@pytest.mark.parametrize("forwarding_levels", [0, 1, 5, 20])
+def test_walk_email_visits_each_part_once(forwarding_levels):
+    """Test that walk_email visits each email part only once, also for nested forwarded emails."""
+    email_message = build_forwarded_email(forwarding_levels)
+    data_parts = set()
+    visited_parts = NotificationData.walk_email(email_message, data_parts, max_depth=100)
+    assert visited_parts == len(list(email_message.walk()))
+    assert len(data_parts) == forwarding_levels + 1
+
+
+def test_init_from_emailmessage_max_depth():
+    """Test that the email parts nested deeper than max_depth are skipped."""
+    # Each forwarding level adds two levels of nesting, the multipart and the message/rfc822 parts
+    email_message = build_forwarded_email(5)
+    data = NotificationData.init_from_emailmessage(email_message, max_depth=4)
+    text_contents = sorted(data_part.content for data_part in data.data_parts if data_part.type == "text/plain")
+    assert text_contents == [b"Forwarded notification 3", b"Forwarded notification 4"]
+
+
+def test_data_part_digest():
+    """Test the DataPart digest, that depends on the type and the content."""
+    data_part = DataPart("text/plain", b"some content")
+    assert data_part.digest == DataPart("text/plain", b"some content").digest
+    assert len(data_part.digest) == 32
+    assert data_part.digest != DataPart("text/html", b"some content").digest
+    assert data_part.digest != DataPart("text/plain", b"other content").digest
+
+
+def test_notification_data_fingerprint():
+    """Test the NotificationData fingerprint, that doesn't depend on the order of the data parts."""
+    data = NotificationData.init_from_raw("text/plain", b"some content")
+    data.add_data_part("text/html", b"<b>some content</b>")
+    same_data = NotificationData.init_from_raw("text/html", b"<b>some content</b>")
+    same_data.add_data_part("text/plain", b"some content")
+    assert data.fingerprint == same_data.fingerprint
+
+    data.add_data_part("text/calendar", b"BEGIN:VCALENDAR")
+    assert data.fingerprint != same_data.fingerprint
+
+
+def test_notification_data_init():
+    """Test the NotificationData construction, that keeps its own copy of the data parts."""
+    data_parts = [DataPart("text/plain", b"some content")]
+    data = NotificationData(data_parts=data_parts)
+    data.add_data_part("text/html", b"<b>some content</b>")
+    assert len(data_parts) == 1
+    assert len(data.data_parts) == 2
+    assert not NotificationData().data_parts
+    assert (
+        repr(NotificationData(data_parts))
+        == "NotificationData(data_parts=[DataPart(type='text/plain', content=b'some content')])"
+    )
+    with pytest.raises(TypeError):
+        NotificationData(data_parts=data_parts, unknown_field=True)  # pylint: disable=unexpected-keyword-arg
+
+
+def test_notification_data_init_from_tuples():
+    """Test that the `(type, content)` tuples are converted into DataParts, and other data parts are rejected."""
+    data = NotificationData(data_parts=[("text/plain", b"some content"), DataPart("text/html", b"<b>content</b>")])
+    assert all(isinstance(data_part, DataPart) for data_part in data.data_parts)
+    assert data.data_parts == [DataPart("text/plain", b"some content"), DataPart("text/html", b"<b>content</b>")]
+    with pytest.raises(TypeError):
+        NotificationData(data_parts=[("text/plain", b"some content", "extra")])
+    with pytest.raises(TypeError):
+        NotificationData(data_parts=["text/plain"])
+
+
+def test_data_part_str_content():
+    """Test that a str content is encoded as UTF-8."""
+    data_part = DataPart("text/plain", "Équipe")
+    assert data_part.content == "Équipe".encode("utf-8")
+    assert data_part.charset == "utf-8"
+    data = NotificationData.init_from_raw("text/plain", "some str")
+    assert data is not None
+    assert data.data_parts[0].content == b"some str"
+
+
+def test_peek_headers():
+    """Test the headers pre-scan, that matches the headers of the fully parsed email."""
+    with open(Path(dir_path, "data", "email", "test_sample_message.eml"), "rb") as email_file:
+        email_raw_data = email_file.read()
+    email_message = email.message_from_bytes(email_raw_data)
+    assert NotificationData.peek_headers(email_raw_data) == {
+        "From": email_message["From"],
+        "Subject": email_message["Subject"],
+        "Date": email_message["Date"],
+        "Message-ID": email_message["Message-ID"],
+    }
+    assert NotificationData.peek_headers(memoryview(email_raw_data), headers=["To"]) == {"To": email_message["To"]}
+
+
+def test_peek_headers_ignores_body():
+    """Test that the headers pre-scan decodes encoded words and doesn't look after the first blank line."""
+    raw_email = b"From: noc@example.com\r\nSubject: =?utf-8?q?Maintenance_caf=C3=A9?=\r\n\r\nDate: not a header\r\n"
+    assert NotificationData.peek_headers(raw_email) == {
+        "From": "noc@example.com",
+        "Subject": "Maintenance café",
+        "Date": None,
+        "Message-ID": None,
+    }
+
+
+def test_notification_data_types_index():
+    """Test the index of the data parts positions by normalized data type, updated when data parts are added."""
+    data = NotificationData.init_from_raw("text/html; charset=UTF-8", b"<b>some content</b>")
+    assert data.get_data_types_index() == {"text/html": [0]}
+    data.add_data_part("text/plain", b"some content")
+    data.data_parts.append(DataPart("TEXT/HTML", b"<b>other content</b>"))
+    assert data.get_data_types_index() == {"text/html": [0, 2], "text/plain": [1]}
+
+
+def test_data_part_charset():
+    """Test that the DataParts from an email keep the MIME charset of their part."""
+    with open(Path(dir_path, "data", "email", "test_sample_message.eml"), "rb") as email_file:
+        data = NotificationData.init_from_email_bytes(email_file.read())
+    assert [(data_part.type, data_part.charset) for data_part in data.data_parts] == [
+        (EMAIL_HEADER_DATE, "utf-8"),
+        (EMAIL_HEADER_SUBJECT, "utf-8"),
+        ("text/html", "iso-8859-1"),
+        ("text/plain", "iso-8859-1"),
+        ("text/plain", None),
+    ]
+
+
+def test_notification_data_memoization():
+    """Test that the values derived from the DataParts are computed once within the memoization context."""
+    data = NotificationData.init_from_raw("text/plain", b"some content")
+    data_part = data.data_parts[0]
+    computed = []
+
+    def decode():
+        computed.append(True)
+        return str(data_part.content, "utf-8")
+
+    assert data_part.memoize(decode, decode) == "some content"
+    with data.memoization():
+        with data.memoization():
+            assert data_part.memoize(decode, decode) == "some content"
+        assert data_part.memoize(decode, decode) == "some content"
+    assert data_part.memoize(decode, decode) == "some content"
+    assert len(computed) == 3
+
+
+def test_notification_data_memoization_release():
+    """Test that the memoized values are released, once, when the memoization context ends."""
+    data = NotificationData.init_from_raw("text/plain", b"some content")
+    data_part = data.data_parts[0]
+    released = []
+
+    with data.memoization():
+        value = data_part.memoize("key", lambda: ["value"], released.append)
+        assert data_part.memoize("key", lambda: ["other value"], released.append) is value
+        assert not released
+    assert released == [["value"]]
+
+    data_part.memoize("key", lambda: ["value"], released.append)
+    assert len(released) == 1
+
+
+def test_notification_data_serialization():
+    """Test that a NotificationData serialized to bytes is loaded back with the same data parts."""
+    with open(Path(dir_path, "data", "email", "test_sample_message.eml"), "rb") as email_file:
+        data = NotificationData.init_from_email_bytes(email_file.read())
+    serialized_data = data.to_bytes()
+
+    loaded_data = NotificationData.from_bytes(serialized_data)
+    assert loaded_data == data
+    assert [data_part.charset for data_part in loaded_data.data_parts] == [
+        data_part.charset for data_part in data.data_parts
+    ]
+    assert all(isinstance(data_part.content, bytes) for data_part in loaded_data.data_parts)
+
+    loaded_data = NotificationData.from_bytes(memoryview(serialized_data))
+    assert loaded_data == data
+    assert all(isinstance(data_part.content, memoryview) for data_part in loaded_data.data_parts)
+    assert NotificationData.from_bytes(NotificationData().to_bytes()) == NotificationData()
+
+
+@pytest.mark.parametrize(
+    "serialized_data",
+    [
+        b"",
+        b"not a serialized notification",
+        NotificationData([DataPart("ical", b"BEGIN:VCALENDAR")]).to_bytes()[:-1],
+        NotificationData([DataPart("ical", b"BEGIN:VCALENDAR")]).to_bytes() + b"\0",
+    ],
+)
+def test_notification_data_serialization_with_issue(serialized_data):
+    """Test the loading of invalid serialized NotificationData."""
+    with pytest.raises(ValueError):
+        NotificationData.from_bytes(serialized_data)
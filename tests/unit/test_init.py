@@ -1,21 +1,33 @@
 """Tests for generic parser."""
 import os
+import subprocess
+import sys
+from importlib import import_module
 
 import pytest
 
+import circuit_maintenance_parser
 from circuit_maintenance_parser import (
     init_provider,
     get_provider_class,
     get_provider_class_from_sender,
+    lookup_provider_class_from_sender,
 )
 from circuit_maintenance_parser.errors import NonexistentProviderError
 from circuit_maintenance_parser.provider import (
     GenericProvider,
+    Arelion,
+    AWS,
     EUNetworks,
+    Google,
+    HGC,
     NTT,
     PacketFabric,
+    PCCW,
+    Seaborn,
     Zayo,
 )
+from circuit_maintenance_parser.providers import PROVIDER_CLASS_NAMES
 
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
@@ -81,3 +93,80 @@ def test_get_provider_class_from_email(email_sender, result, error):
     elif error:
         with pytest.raises(error):
             get_provider_class_from_sender(email_sender)
+
+
+@pytest.mark.parametrize(
+    "email_sender, result",
+    [
+        ("MR@zayo.com", Zayo),
+        ("Zayo Maintenance <mr@zayo.com>", Zayo),
+        ("noreply@zayo.com", Zayo),
+        ("noreply@notify.zayo.com", Zayo),
+        ("change@mail.hgc.com.hk", HGC),
+        ("gsoc-planned-event@pccwglobal.com", PCCW),
+        # Providers sharing the same organizer, the first supported provider wins
+        ("support@arelion.com", Arelion),
+        ("inoc@superonline.net", Seaborn),
+        # Providers with a company-wide mail domain are only matched by their address
+        ("aws-account-notifications@amazon.com", AWS),
+        ("other@amazon.com", None),
+        ("noc-noreply@google.com", Google),
+        ("other@google.com", None),
+        ("other@netflix.com", None),
+        ("noc@example.com", None),
+        ("unknown", None),
+        ("", None),
+    ],
+)
+def test_lookup_provider_class_from_sender(email_sender, result):
+    """Tests for the provider lookup from the sender address and domain."""
+    assert lookup_provider_class_from_sender(email_sender) == result
+
+
+@pytest.mark.parametrize(
+    "email_sender",
+    ["other@amazon.com", "other@google.com", "noreply@zayo.com", "noreply@notify.zayo.com"],
+)
+def test_get_provider_class_from_email_not_matching_domain(email_sender):
+    """Tests that the provider class from the sender only matches the organizer address, and not its domain."""
+    with pytest.raises(NonexistentProviderError):
+        get_provider_class_from_sender(email_sender)
+
+
+def test_supported_providers_registry():
+    """Tests that the lazily imported providers are the ones of the registry."""
+    supported_providers = circuit_maintenance_parser.SUPPORTED_PROVIDERS
+    assert supported_providers[0] is GenericProvider
+    assert [provider_class.get_provider_type() for provider_class in supported_providers] == (
+        circuit_maintenance_parser.SUPPORTED_PROVIDER_NAMES
+    )
+    assert circuit_maintenance_parser.SUPPORTED_ORGANIZER_EMAILS[-1] == Zayo.get_default_organizer()
+    assert circuit_maintenance_parser.Zayo is Zayo
+
+
+@pytest.mark.parametrize("class_name", PROVIDER_CLASS_NAMES)
+def test_provider_module_reexports_providers(class_name):
+    """Tests that the provider classes are still importable from the `provider` module."""
+    provider_module = import_module(f"circuit_maintenance_parser.providers.{class_name.lower()}")
+    assert getattr(circuit_maintenance_parser.provider, class_name) is getattr(provider_module, class_name)
+
+
+def test_provider_module_unknown_provider():
+    """Tests that the `provider` module doesn't re-export unknown provider classes."""
+    with pytest.raises(AttributeError):
+        circuit_maintenance_parser.provider.Unknown  # pylint: disable=pointless-statement
+
+
+def test_get_provider_class_imports_only_its_provider():
+    """Tests that getting a provider class doesn't import the rest of providers and their parsers."""
+    script = """
+import sys
+import circuit_maintenance_parser
+circuit_maintenance_parser.get_provider_class("zayo")
+print(" ".join(module for module in sys.modules if module.startswith("circuit_maintenance_parser.parsers.")))
+print(" ".join(module for module in sys.modules if module.startswith("circuit_maintenance_parser.providers.")))
+"""
+    output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True).stdout
+    parser_modules, provider_modules = output.splitlines()
+    assert parser_modules == "circuit_maintenance_parser.parsers.zayo"
+    assert provider_modules == "circuit_maintenance_parser.providers.zayo"
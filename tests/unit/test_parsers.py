@@ -2,12 +2,15 @@
 
 import json
 import os
+import quopri
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from circuit_maintenance_parser.data import NotificationData
 from circuit_maintenance_parser.errors import ParserError
-from circuit_maintenance_parser.parser import EmailDateParser, ICal
+from circuit_maintenance_parser.parser import EmailDateParser, Html, ICal
 from circuit_maintenance_parser.parsers.aquacomms import HtmlParserAquaComms1, SubjectParserAquaComms1
 from circuit_maintenance_parser.parsers.aws import SubjectParserAWS1, TextParserAWS1
 from circuit_maintenance_parser.parsers.bso import HtmlParserBSO1
@@ -805,3 +808,96 @@ def test_parser_no_data(parser_class):
     """Test parser with no data."""
     with pytest.raises(ParserError):
         parser_class().parse(b"", parser_class.get_data_types()[0])  # pylint: disable=protected-access
+
+
+def test_parsers_share_decoded_data_part():
+    """Test that the parsers of the same DataPart decode its content only once while memoization is enabled."""
+    data = NotificationData.init_from_file("text/html", Path(dir_path, "data", "zayo", "zayo1.html"))
+    with patch("circuit_maintenance_parser.parser.quopri.decodestring", wraps=quopri.decodestring) as mock_decode:
+        with data.memoization():
+            first_result = HtmlParserZayo1().parse_data_part(data.data_parts[0])
+            assert HtmlParserZayo1().parse_data_part(data.data_parts[0]) == first_result
+        assert mock_decode.call_count == 1
+
+
+def test_parsers_share_html_dom():
+    """Test that the HTML parsers of the same DataPart share its DOM, decomposed when the memoization ends."""
+    data = NotificationData.init_from_file("text/html", Path(dir_path, "data", "telstra", "telstra1.html"))
+    with patch("circuit_maintenance_parser.parser.Html.parse_soup", wraps=Html.parse_soup) as mock_parse_soup:
+        with patch("circuit_maintenance_parser.parser.Html.release_soup", wraps=Html.release_soup) as mock_release:
+            with data.memoization():
+                first_result = HtmlParserTelstra1().parse_data_part(data.data_parts[0])
+                assert HtmlParserTelstra1().parse_data_part(data.data_parts[0]) == first_result
+                assert mock_release.call_count == 0
+            assert mock_parse_soup.call_count == 1
+            assert mock_release.call_count == 1
+            soup = mock_release.call_args.args[0]
+            assert not soup.contents
+
+
+def test_parsers_share_html_dom_of_their_tags():
+    """Test that the HTML parsers declaring the tags they parse share a DOM with only those tags."""
+    data = NotificationData.init_from_file("text/html", Path(dir_path, "data", "gtt", "gtt1.html"))
+    with patch("circuit_maintenance_parser.parser.Html.parse_soup", wraps=Html.parse_soup) as mock_parse_soup:
+        with data.memoization():
+            expected_result = HtmlParserGTT1().parse_data_part(data.data_parts[0])
+            assert HtmlParserGTT1().parse_data_part(data.data_parts[0]) == expected_result
+            assert mock_parse_soup.call_count == 1
+            # A parser without declared tags gets the whole DOM
+            with pytest.raises(ParserError):
+                HtmlParserTelstra1().parse_data_part(data.data_parts[0])
+            assert mock_parse_soup.call_count == 2
+    assert mock_parse_soup.call_args_list[0].args[1:] == (("table",),)
+    assert mock_parse_soup.call_args_list[1].args[1:] == ()
+
+    full_parser = HtmlParserGTT1()
+    full_parser._parse_only_tags = None  # pylint: disable=protected-access
+    assert full_parser.parse_data_part(data.data_parts[0]) == expected_result
+
+
+def test_html_parse_soup_only_tags():
+    """Test that the DOM parsed only with some tags has just those tags and their descendants."""
+    raw = b"<html><body><p>Dear customer</p><table><tr><td><p>Circuit</p></td></tr></table></body></html>"
+    soup = Html.parse_soup(raw, ("table",))
+    assert [tag.name for tag in soup.descendants if tag.name] == ["table", "tr", "td", "p"]
+    assert soup.get_text() == "Circuit"
+
+
+def test_parsers_share_lxml_tree():
+    """Test that the HTML parsers with the lxml backend share the lxml tree of the DataPart, and not the soup."""
+    data = NotificationData.init_from_file("text/html", Path(dir_path, "data", "zayo", "zayo1.html"))
+    with patch("circuit_maintenance_parser.parser.Html.parse_soup", wraps=Html.parse_soup) as mock_parse_soup:
+        with patch(
+            "circuit_maintenance_parser.parser.Html.parse_lxml_tree", wraps=Html.parse_lxml_tree
+        ) as mock_parse_lxml_tree:
+            with data.memoization():
+                first_result = HtmlParserZayo1().parse_data_part(data.data_parts[0])
+                assert HtmlParserZayo1().parse_data_part(data.data_parts[0]) == first_result
+            assert mock_parse_lxml_tree.call_count == 1
+            assert mock_parse_soup.call_count == 0
+
+
+@pytest.mark.parametrize(
+    "raw, expected_string",
+    (
+        (b"<td>Start</td>", "Start"),
+        (b"<td><span><b>Start</b></span></td>", "Start"),
+        (b"<td>Start <b>time</b></td>", None),
+        (b"<td><b>Start</b> time</td>", None),
+        (b"<td><b>Start</b><b>time</b></td>", None),
+        (b"<td></td>", None),
+    ),
+)
+def test_html_get_lxml_string(raw, expected_string):
+    """Test that the only string of an lxml.html element is the `string` of the equivalent bs4 Tag."""
+    td_element = Html.parse_lxml_tree(raw).find(".//td")
+    assert Html.get_lxml_string(td_element) == expected_string
+    assert Html.parse_soup(raw).find("td").string == expected_string
+
+
+def test_html_unsupported_backend():
+    """Test that an HTML parser with an unsupported backend fails to parse."""
+    parser = HtmlParserZayo1()
+    parser._html_backend = "html5lib"  # pylint: disable=protected-access
+    with pytest.raises(ParserError):
+        parser.parse(b"<html></html>", "text/html")
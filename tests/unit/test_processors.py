@@ -92,6 +92,21 @@ def test_simpleprocessor_without_matching_type():
     assert "None of the supported parsers for processor SimpleProcessor (FakeParser)" in str(e_info)
 
 
+@pytest.mark.parametrize(
+    "data_types, supported",
+    [
+        ({"fake_type"}, True),
+        ({"fake_type_0", "other_type"}, True),
+        ({"other_type"}, False),
+        (set(), False),
+    ],
+)
+def test_processor_supports_data_types(data_types, supported):
+    """Tests the check of the data types supported by any of the Parsers of a Processor."""
+    processor = CombinedProcessor(data_parsers=[FakeParser, FakeParser0])
+    assert processor.supports_data_types(data_types) is supported
+
+
 def test_combinedprocessor_multiple_data():
     """Tests CombinedProcessor wrong parsed data, with multiple entities."""
     processor = CombinedProcessor(data_parsers=[FakeParser])
@@ -210,3 +225,21 @@ def test_combinedprocessor_multidatatype():
             }
         )
         assert parser_runs == 1
+
+
+def test_data_part_and_parser_combinations():
+    """Tests the Parser and DataPart combinations, looking up the normalized data types."""
+    data = NotificationData(
+        data_parts=[
+            DataPart("Fake_Type_1; charset=utf-8", b"first fake data"),
+            DataPart("fake_type_0", b"second fake data"),
+            DataPart("fake_type_1", b"third fake data"),
+        ]
+    )
+    processor = CombinedProcessor(data_parsers=[FakeParser, FakeParser0, FakeParserMultiDataType, FakeParser1])
+    combinations = processor.get_data_part_and_parser_combinations(data)
+    # Parsers ordered by their first matching data part, each one with its last matching data part
+    assert list(combinations) == [FakeParserMultiDataType, FakeParser1, FakeParser0]
+    assert combinations[FakeParserMultiDataType] is data.data_parts[2]
+    assert combinations[FakeParser1] is data.data_parts[2]
+    assert combinations[FakeParser0] is data.data_parts[1]
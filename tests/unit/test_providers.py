@@ -1,18 +1,29 @@
 """Tests for Providers."""
 import os
+import re
 from unittest.mock import patch
 
 import pytest
 
-from circuit_maintenance_parser.data import NotificationData
-from circuit_maintenance_parser.errors import ProcessorError, ProviderError
+from circuit_maintenance_parser.data import DataPart, NotificationData
+from circuit_maintenance_parser.errors import ParserError, ProcessorError, ProviderError
 from circuit_maintenance_parser.processor import SimpleProcessor, CombinedProcessor
-from circuit_maintenance_parser.provider import GenericProvider, AquaComms
+from circuit_maintenance_parser.provider import (
+    GenericProvider,
+    LLMFallbackPolicy,
+    charset_detection_stats,
+    get_compiled_filters,
+    get_llm_fallback_policy,
+    processor_success_stats,
+)
+from circuit_maintenance_parser.providers.aquacomms import AquaComms
 from circuit_maintenance_parser.parser import Parser, EmailDateParser
 from circuit_maintenance_parser.parsers.openai import OpenAIParser
 
 # pylint: disable=use-implicit-booleaness-not-comparison
 fake_data = NotificationData.init_from_raw("fake_type", b"fake data")
+# Fake data with the data types of the `ICal` and base `Parser`, so the Processors of the fake Providers are tried
+processable_fake_data = NotificationData([DataPart("ical", b"fake data"), DataPart("text/plain", b"fake data")])
 
 
 class ProviderWithOneProcessor(GenericProvider):
@@ -37,7 +48,7 @@ def test_provide_get_maintenances(provider_class):
     provider = provider_class()
 
     with patch("circuit_maintenance_parser.provider.GenericProcessor.process") as mock_processor:
-        provider.get_maintenances(fake_data)
+        provider.get_maintenances(processable_fake_data)
         assert mock_processor.call_count == 1
 
 
@@ -53,14 +64,119 @@ def test_provide_get_maintenances_one_exception(provider_class):
         mock_processor.side_effect = [ProcessorError, ""]
         if len(provider._processors) < 2:  # pylint: disable=protected-access
             with pytest.raises(ProviderError) as ex_info:
-                provider.get_maintenances(fake_data)
+                provider.get_maintenances(processable_fake_data)
             assert "Failed creating Maintenance notification for" in str(ex_info)
 
         else:
-            provider.get_maintenances(fake_data)
+            provider.get_maintenances(processable_fake_data)
             assert mock_processor.call_count == 2
 
 
+def test_provider_skips_processors_without_supported_data_types():
+    """Tests that the Processors without Parsers for the data types are skipped, but reported in the error."""
+    provider = ProviderWithTwoProcessors()
+
+    with patch("circuit_maintenance_parser.provider.GenericProcessor.process") as mock_processor:
+        with pytest.raises(ProviderError) as ex_info:
+            provider.get_maintenances(fake_data)
+    assert mock_processor.call_count == 0
+    assert len(ex_info.value.related_exceptions) == 2
+    assert all(isinstance(exc, ProcessorError) for exc in ex_info.value.related_exceptions)
+    assert (
+        "- Processor SimpleProcessor from ProviderWithTwoProcessors failed due to: None of the supported parsers for "
+        "processor SimpleProcessor (Parser) was matching any of the provided data types (fake_type)."
+    ) in str(ex_info.value)
+
+
+class ProviderWithAdaptiveProcessorOrder(ProviderWithTwoProcessors):
+    """Fake Provider with two Processors, tried in order of success."""
+
+    _adaptive_processor_order = True
+
+
+@pytest.mark.parametrize(
+    "provider_class, expected_processor_positions",
+    [
+        (ProviderWithTwoProcessors, [0, 1, 0, 1, 0, 1]),
+        (ProviderWithAdaptiveProcessorOrder, [0, 1, 1, 1]),
+    ],
+)
+def test_provider_adaptive_processor_order(provider_class, expected_processor_positions):
+    """Tests that the adaptive mode tries first the Processor that has processed more notifications."""
+    provider = provider_class()
+    processors = provider._processors  # pylint: disable=protected-access
+    tried_processor_positions = []
+
+    def fake_process(processor, data, extended_data):  # pylint: disable=unused-argument
+        tried_processor_positions.append(0 if processor is processors[0] else 1)
+        if processor is processors[0]:
+            raise ProcessorError
+        return [{"a": "b"}]
+
+    processor_success_stats.clear()
+    with patch("circuit_maintenance_parser.provider.GenericProcessor.process", autospec=True) as mock_processor:
+        mock_processor.side_effect = fake_process
+        for _ in range(3):
+            assert provider.get_maintenances(processable_fake_data) == [{"a": "b"}]
+
+    assert tried_processor_positions == expected_processor_positions
+    assert processor_success_stats[provider_class.get_provider_type()] == {1: 3}
+
+
+def test_provider_adaptive_processor_order_from_env(monkeypatch):
+    """Tests that the adaptive mode is enabled by default with the environment variable."""
+    assert not GenericProvider()._adaptive_processor_order  # pylint: disable=protected-access
+    monkeypatch.setenv("PARSER_ADAPTIVE_PROCESSOR_ORDER", "1")
+    assert GenericProvider()._adaptive_processor_order  # pylint: disable=protected-access
+
+
+class SharedParser(Parser):
+    """Fake Parser, shared by the Processors of a Provider."""
+
+    _data_types = ["fake_type"]
+
+    def parser_hook(self, raw, content_type):
+        return [{"summary": "shared"}]
+
+
+class FailingParser(SharedParser):
+    """Fake Parser that always fails."""
+
+    def parser_hook(self, raw, content_type):
+        raise ParserError
+
+
+def test_provider_processors_share_parsed_data():
+    """Tests that the Parsers shared by the Processors parse each DataPart once per `get_maintenances` call."""
+
+    class ProviderWithSharedParsers(GenericProvider):
+        """Fake Provider whose Processors share one Parser."""
+
+        _processors = [
+            CombinedProcessor(data_parsers=[SharedParser, FailingParser]),
+            CombinedProcessor(data_parsers=[SharedParser, FailingParser]),
+        ]
+
+    with patch.object(SharedParser, "parser_hook", wraps=SharedParser().parser_hook) as mock_shared_hook:
+        with patch.object(FailingParser, "parser_hook", side_effect=ParserError) as mock_failing_hook:
+            for _ in range(2):
+                with pytest.raises(ProviderError) as ex_info:
+                    ProviderWithSharedParsers().get_maintenances(fake_data)
+                assert len(ex_info.value.related_exceptions) == 2
+
+    assert mock_shared_hook.call_count == 2
+    assert mock_failing_hook.call_count == 2
+
+
+def test_processor_parsed_data_copied_on_reuse():
+    """Tests that each Processor gets its own copy of the memoized parsed data."""
+    data_part = fake_data.data_parts[0]
+    with fake_data.memoization():
+        parsed_data = CombinedProcessor.parse_data_part(SharedParser, data_part)
+        parsed_data[0]["summary"] = "changed"
+        assert CombinedProcessor.parse_data_part(SharedParser, data_part) == [{"summary": "shared"}]
+
+
 def test_provider_with_include_filter():
     """Tests usage of _include_filter."""
 
@@ -111,22 +227,141 @@ def test_provider_with_include_and_exclude_filters():
     assert ProviderWithIncludeFilter().get_maintenances(data) == []
 
 
+def test_provider_filters_share_decoded_text():
+    """Tests that the include and exclude filters decode each DataPart only once per `get_maintenances` call."""
+    data = NotificationData.init_from_raw("ical", b"fake data")
+
+    class ProviderWithFilters(GenericProvider):
+        """Fake Provider."""
+
+        _include_filter = {"ical": ["fake data"]}
+        _exclude_filter = {"ical": ["other data"]}
+
+    charset_detection_stats.clear()
+    with patch("circuit_maintenance_parser.processor.GenericProcessor.process") as mock_processor:
+        mock_processor.return_value = [{"a": "b"}]
+        ProviderWithFilters().get_maintenances(data)
+        ProviderWithFilters().get_maintenances(data)
+    assert charset_detection_stats == {"chardet": 2}
+
+
+def test_provider_filters_compiled_once_per_class():
+    """Tests that the filters of each Provider class are compiled once and evaluated from the compiled patterns."""
+
+    class ProviderWithFilters(GenericProvider):
+        """Fake Provider."""
+
+        _include_filter = {"fake_type": ["fake data"]}
+
+    class ProviderWithOtherFilters(ProviderWithFilters):
+        """Fake Provider, inheriting the include filter."""
+
+        _exclude_filter = {"fake_type": ["fake.*"]}
+
+    with patch.object(
+        ProviderWithFilters, "get_default_include_filters", wraps=ProviderWithFilters.get_default_include_filters
+    ) as mock_include_filters:
+        for _ in range(3):
+            assert ProviderWithFilters().include_filter_check(fake_data)
+            assert not ProviderWithFilters().exclude_filter_check(fake_data)
+    assert mock_include_filters.call_count == 1
+
+    include_filters, exclude_filters = get_compiled_filters(ProviderWithOtherFilters)
+    assert [pattern.pattern for pattern in include_filters["fake_type"]] == ["fake data"]
+    assert [pattern.pattern for pattern in exclude_filters["fake_type"]] == ["fake.*"]
+    assert ProviderWithOtherFilters().exclude_filter_check(fake_data)
+    assert get_compiled_filters(GenericProvider) == ({}, {})
+
+
 @pytest.mark.parametrize(
-    "provider_class",
-    [GenericProvider, AquaComms],
+    "filter_dict, expected_result",
+    [
+        ({"fake_type": ["fake data"]}, True),
+        ({"fake_type": ["other data"]}, False),
+        ({"fake_type": [re.compile("fake.*")]}, True),
+        ({"fake_type": ["other data", re.compile("fake.*")]}, True),
+        ({"other_type": ["fake data"]}, False),
+    ],
+)
+def test_provider_filter_check(filter_dict, expected_result):
+    """Tests the generic filter check, with string or compiled filter expressions."""
+    assert GenericProvider.filter_check(filter_dict, fake_data, "include") is expected_result
+
+
+@pytest.mark.parametrize(
+    "data_part, expected_text, expected_charset_source",
+    [
+        (DataPart("text/html", "café".encode("latin-1"), charset="iso-8859-1"), "café", "mime"),
+        (DataPart("text/html", "café".encode("utf-8"), charset="utf-8"), "café", "mime"),
+        (DataPart("text/html", b"plain ascii"), "plain ascii", "chardet"),
+        (DataPart("text/html", b"plain ascii", charset="unknown-charset"), "plain ascii", "chardet"),
+        (DataPart("text/html", "café".encode("latin-1"), charset="utf-8"), "caf", "chardet"),
+        (
+            DataPart("text/html", b"<html>" + b"a" * 5000 + "Équipe".encode()),
+            "<html>" + "a" * 5000 + "Équipe",
+            "chardet",
+        ),
+    ],
+)
+def test_provider_get_data_part_text(data_part, expected_text, expected_charset_source):
+    """Tests the DataPart decoding used by the filters, with the MIME charset or guessing it."""
+    charset_detection_stats.clear()
+    assert GenericProvider.get_data_part_text(data_part).startswith(expected_text)
+    assert charset_detection_stats == {expected_charset_source: 1}
+
+
+@pytest.mark.parametrize(
+    "provider_class, expected_process_calls",
+    [(GenericProvider, 1), (AquaComms, 2)],
 )
-def test_provider_gets_mlparser(provider_class):
-    """Test to check the any provider gets a default ML parser when ENV is activated."""
-    os.environ["PARSER_OPENAI_API_KEY"] = "some_api_key"
+def test_provider_gets_mlparser(provider_class, expected_process_calls):
+    """Test to check the any provider falls back to a default ML parser when ENV is activated."""
     data = NotificationData.init_from_raw("text/plain", b"fake data")
     data.add_data_part("text/html", b"other data")
 
-    provider = provider_class()
+    get_llm_fallback_policy.cache_clear()
+    with patch.dict(os.environ, {"PARSER_OPENAI_API_KEY": "some_api_key"}):
+        provider = provider_class()
+    get_llm_fallback_policy.cache_clear()
+    processors = list(provider._processors)  # pylint: disable=protected-access
 
     with patch("circuit_maintenance_parser.processor.GenericProcessor.process") as mock_processor:
-        mock_processor.return_value = [{"a": "b"}]
-        provider.get_maintenances(data)
+        mock_processor.side_effect = ProcessorError
+        for _ in range(2):
+            with pytest.raises(ProviderError):
+                provider.get_maintenances(data)
+
+    # The LLM Processor is only tried after the Provider ones fail, and the Provider `_processors` don't change
+    assert mock_processor.call_count == 2 * expected_process_calls
+    assert provider._processors == processors  # pylint: disable=protected-access
+    assert provider._llm_fallback_policy.processors == [  # pylint: disable=protected-access
+        CombinedProcessor(data_parsers=[EmailDateParser, OpenAIParser])
+    ]
+
 
-    assert provider._processors[-1] == CombinedProcessor(  # pylint: disable=protected-access
-        data_parsers=[EmailDateParser, OpenAIParser]
+def test_provider_llm_fallback_policy_max_attempts():
+    """Tests that the LLM fallback Processors tried per notification are limited to `max_attempts`."""
+    provider = ProviderWithOneProcessor()
+    provider._llm_fallback_policy = LLMFallbackPolicy(  # pylint: disable=protected-access
+        processors=[SimpleProcessor(data_parsers=[Parser]), SimpleProcessor(data_parsers=[Parser])], max_attempts=1
     )
+
+    with patch("circuit_maintenance_parser.provider.GenericProcessor.process") as mock_processor:
+        mock_processor.side_effect = ProcessorError
+        with pytest.raises(ProviderError):
+            provider.get_maintenances(processable_fake_data)
+        assert mock_processor.call_count == 2
+
+        mock_processor.reset_mock()
+        mock_processor.side_effect = [ProcessorError, [{"a": "b"}]]
+        assert provider.get_maintenances(processable_fake_data) == [{"a": "b"}]
+        assert mock_processor.call_count == 2
+
+
+def test_provider_without_llm_fallback_policy():
+    """Tests that there is no LLM fallback policy without the ENV for any LLM integration."""
+    get_llm_fallback_policy.cache_clear()
+    with patch.dict(os.environ, clear=True):
+        assert LLMFallbackPolicy.from_env() is None
+        assert GenericProvider()._llm_fallback_policy is None  # pylint: disable=protected-access
+    get_llm_fallback_policy.cache_clear()
@@ -1,8 +1,18 @@
 """Tests for parser utils."""
 
+import re
+from unittest.mock import patch
+
 import pytest
+from dateutil import parser
 
-from circuit_maintenance_parser.utils import Geolocator
+from circuit_maintenance_parser.utils import (
+    Geolocator,
+    compile_registered_regexes,
+    parse_datetime,
+    register_regex,
+    regex_registry,
+)
 
 geolocator = Geolocator()
 
@@ -27,3 +37,97 @@ geolocator = Geolocator()
 def test_city_timezones(city, timezone):
     """Tests for utility timezone function."""
     assert geolocator.city_timezone(city) == timezone
+
+
+@pytest.mark.parametrize(
+    "first_timestr, timestr, dayfirst",
+    [
+        ("25-Sep-2020 07:00", "27-Feb-2021 06:00", False),
+        ("2021-08-13 18:00:00 GMT", "2021-11-09 04:00:00 GMT", False),
+        ("Aug 16 2021 23:01 GMT", "Aug 7 2021 05:00 GMT", False),
+        ("Thu, 20 May 2021 08:00:00 GMT", "Mon, 13 Sep 2021 19:02:00 GMT", False),
+        ("2021-08-14 09:30 AM UTC", "2021-08-14 11:00 PM UTC", False),
+        ("8/12/2021 2:00:00 am GMT", "8/13/2021 11:00:00 pm GMT", False),
+        ("31/10/2021 00:00:00 GMT", "07/8/2021 06:00:00 GMT", True),
+        ("15-Aug-2021\xa0 07:01 UTC", "16-Aug-2021\xa0 12:00 UTC", False),
+    ],
+)
+def test_parse_datetime_learned_format(first_timestr, timestr, dayfirst):
+    """Tests that the dates parsed with the learned format are the ones of dateutil, without calling it."""
+    key = ("test_parse_datetime_learned_format", first_timestr)
+    assert parse_datetime(first_timestr, key, dayfirst) == parser.parse(first_timestr, dayfirst=dayfirst)
+
+    expected = parser.parse(timestr, dayfirst=dayfirst)
+    with patch("dateutil.parser.parse") as mock_parse:
+        result = parse_datetime(timestr, key, dayfirst)
+    assert mock_parse.call_count == 0
+    assert result == expected
+    assert result.tzinfo == expected.tzinfo
+
+
+@pytest.mark.parametrize(
+    "first_timestr, timestr, dayfirst",
+    [
+        # The learned format doesn't match
+        ("25-Sep-2020 07:00", "2021-02-27 06:00", False),
+        # The month can't be first, dateutil swaps it with the day
+        ("08/12/2021 03:00 UTC", "13/08/2021 03:00 UTC", False),
+        ("31/10/2021 00:00:00 GMT", "08/13/2021 00:00:00 GMT", True),
+        # With dayfirst, dateutil parses the years first as year, day, month
+        ("31/10/2021 00:00:00", "2021-08-10 00:00:00", True),
+    ],
+)
+def test_parse_datetime_learned_format_miss(first_timestr, timestr, dayfirst):
+    """Tests that the dates not matching the learned format are parsed by dateutil."""
+    key = ("test_parse_datetime_learned_format_miss", first_timestr)
+    parse_datetime(first_timestr, key, dayfirst)
+    assert parse_datetime(timestr, key, dayfirst) == parser.parse(timestr, dayfirst=dayfirst)
+
+
+def test_parse_datetime_without_candidate_format():
+    """Tests that the dates without a candidate format are always parsed by dateutil."""
+    key = "test_parse_datetime_without_candidate_format"
+    for timestr in ("07.08.2021 00:00 GMT+3", "18.08.2021 00:30 GMT+3"):
+        expected = parser.parse(timestr)
+        with patch("dateutil.parser.parse", wraps=parser.parse) as mock_parse:
+            assert parse_datetime(timestr, key) == expected
+        assert mock_parse.call_count == 1
+
+
+def test_register_regex():
+    """Tests that the registered regular expressions are shared, compiled once on first use, and match as `re`."""
+    pattern = r"test_register_regex ([0-9]+)"
+    regex = register_regex(pattern)
+    assert register_regex(pattern) is regex
+    assert register_regex(pattern, re.IGNORECASE) is not regex
+    assert regex_registry[(pattern, 0)] is regex
+    assert not regex.is_compiled
+
+    text = "test_register_regex 1, test_register_regex 22"
+    assert regex.search(text).group(1) == re.search(pattern, text).group(1)
+    assert regex.is_compiled
+    compiled = regex.compiled
+    assert regex.match(text).group(0) == re.match(pattern, text).group(0)
+    assert regex.fullmatch(text) is None
+    assert regex.findall(text) == re.findall(pattern, text)
+    assert [match.span() for match in regex.finditer(text)] == [match.span() for match in re.finditer(pattern, text)]
+    assert regex.sub("X", text) == re.sub(pattern, "X", text)
+    assert regex.split(text) == re.split(pattern, text)
+    assert regex.compiled is compiled
+
+
+def test_register_regex_eager(monkeypatch):
+    """Tests that the regular expressions are compiled on registration with `PARSER_EAGER_REGEX_COMPILATION`."""
+    lazy_regex = register_regex("test_register_regex_eager lazy")
+    assert not lazy_regex.is_compiled
+    monkeypatch.setenv("PARSER_EAGER_REGEX_COMPILATION", "1")
+    assert register_regex("test_register_regex_eager eager").is_compiled
+    assert register_regex("test_register_regex_eager lazy").is_compiled
+
+
+def test_compile_registered_regexes():
+    """Tests that all the registered regular expressions not compiled yet are compiled."""
+    regex = register_regex("test_compile_registered_regexes")
+    assert compile_registered_regexes() >= 1
+    assert regex.is_compiled
+    assert compile_registered_regexes() == 0